@@ -1,13 +1,16 @@
+import os
 import sys
 import pygame
 from scripts.utils import load_images  # Function to load tile images from directories
 from scripts.tilemap import Tilemap    # Tilemap class to handle tile-based maps
+from scripts.level_catalog import write_catalog, MAPS_DIR  # Regenerates data/level_catalog.json
 
 RENDER_SCALE = 2.0  # Scaling factor for rendering
 
 class Editor:
-    def __init__(self):
+    def __init__(self, map_path='data/maps/7.json'):
         pygame.init()  # Initialize pygame
+        self.map_path = map_path  # Map opened at startup and written by O
 
         pygame.display.set_caption('Editor')  # Set window title
         self.screen = pygame.display.set_mode((960, 480))  # Set the main window size
@@ -30,7 +33,7 @@ class Editor:
         self.tilemap = Tilemap(self, tile_size=16)  # Initialize the tilemap with a tile size of 16x16
 
         try:
-            self.tilemap.load('data/maps/7.json')  # Load the saved map if available
+            self.tilemap.load(self.map_path)  # Load the saved map if available
         except FileNotFoundError:
             pass  # No map file found, continue without loading
 
@@ -198,7 +201,10 @@ class Editor:
                     if event.key == pygame.K_t:
                         self.tilemap.autotile()
                     if event.key == pygame.K_o:
-                        self.tilemap.save('data/maps/7.json')
+                        self.tilemap.save(self.map_path)
+                        # Keep the level catalog in step when a shipped map changes
+                        if os.path.dirname(os.path.abspath(self.map_path)) == os.path.abspath(MAPS_DIR):
+                            write_catalog()
                     if event.key == pygame.K_LSHIFT:
                         self.shift = True
 
@@ -216,15 +222,11 @@ class Editor:
             
             # Handle tile placement/removal
             if self.clicking and self.ongrid:
-                # Place the tile in the tilemap at the calculated grid position
-                self.tilemap.tilemap[str(tile_pos[0]) + ';' + str(tile_pos[1])] = {'type': self.selected_tile['type'],
-                                                                                  'variant': self.selected_tile['variant'],
-                                                                                  'pos': tile_pos}
+                # Place the tile in the tilemap at the calculated grid position (keeps the walk spans current)
+                self.tilemap.set_tile(tile_pos, self.selected_tile['type'], self.selected_tile['variant'])
             if self.rightclick:
                 # Remove tiles at the grid position
-                tile_loc = str(tile_pos[0]) + ';' + str(tile_pos[1])
-                if tile_loc in self.tilemap.tilemap:
-                    del self.tilemap.tilemap[tile_loc]
+                self.tilemap.remove_tile(tile_pos)
                 # Remove off-grid tiles that are clicked
                 for tile in self.tilemap.offgrid_tiles.copy():
                     tile_img = self.assets[tile['type']][tile['variant']]
@@ -239,5 +241,5 @@ class Editor:
             pygame.display.update()
             self.clock.tick(60)  # Cap the frame rate at 60 FPS
 
-# Start the editor
-Editor().run()
\ No newline at end of file
+# Start the editor: python editor.py [map path]
+Editor(*sys.argv[1:2]).run()
\ No newline at end of file
@@ -1,22 +1,57 @@
 import os
-import sys
 import math
 import random
 import pygame
 import json
+import argparse
+import time
 from scripts.utils import load_image, load_images, Animation, resource_path
 from scripts.entities import PhysicsEntity, Player, Enemy
 from scripts.tilemap import Tilemap
 from scripts.clouds import Clouds
-from scripts.particle import Particle
-from scripts.spark import Spark
-from scripts.pause import pause_menu, options_menu
-from scripts.levels_menu import levels_menu
-from scripts.main_menu import main_menu
-from scripts.save_select import save_select
-from scripts.level_select import level_select
-from scripts.about import about_screen
+from scripts.pause import PauseMenu, OptionsMenu, VolumeMenu, ConfirmationDialog
+from scripts.levels_menu import LevelsMenu
+from scripts.main_menu import MainMenu
+from scripts.save_select import SaveSelect
+from scripts.level_select import LevelSelect
+from scripts.about import AboutScreen
+from scripts.keybindings_menu import KeybindingsMenu
 from scripts.shared_background import SharedBackground
+from scripts.scenes import Scene, SceneStack
+from scripts.frame_scheduler import MenuScheduler
+from scripts.dirty_rects import DirtyRects
+from scripts.save_writer import SaveWriter
+from scripts.save_index import SaveIndex
+from scripts.level_catalog import LevelCatalog
+from scripts.profiler import FrameProfiler
+from scripts.telemetry import TelemetryLog
+from scripts.chunk_streamer import ChunkStreamer
+from scripts.culling import Culling
+from scripts.ai_scheduler import AIScheduler
+from scripts.spatial_hash import SpatialHash
+from scripts.gameplay import follow_camera, step_entities, advance_death
+from scripts.world import World, Projectiles, in_view
+from scripts import ui_effects
+
+
+class GameplayScene(Scene):
+    """The level being played; the simulation itself lives on Game"""
+
+    # Gameplay always runs at the full frame rate
+    allow_idle = False
+
+    def resume(self):
+        # Keys released while a menu was open never reached us
+        self.game.movement = [False, False]
+
+    def handle_event(self, event):
+        self.game.handle_gameplay_event(event)
+
+    def update(self, dt):
+        self.game.update_gameplay()
+
+    def render(self, surf):
+        self.game.render_gameplay(surf)
 
 
 class Game:
@@ -41,8 +76,10 @@ class Game:
                     'dash': 'left shift'
                 }, f, indent=4)
 
-    def __init__(self):
+    def __init__(self, telemetry_path=None, save_progress=True, maps_dir=None, motes=15):
         pygame.init()
+        # Benchmarks and tools drive levels without touching the player's saves
+        self.save_progress = save_progress
 
         # Keybindings
         self.load_keybindings()
@@ -53,6 +90,9 @@ class Game:
         self.display = pygame.Surface((320, 240), pygame.SRCALPHA)
         self.display_2 = pygame.Surface((320, 240))
 
+        # Build the menu vignette/overlays now so opening a dialog never hitches
+        ui_effects.prewarm(self.screen.get_size())
+
         self.clock = pygame.time.Clock()
 
         self.movement = [False, False]
@@ -107,8 +147,32 @@ class Game:
 
         self.tilemap = Tilemap(self, tile_size=16)
 
-        self.level = 1
-        self.max_level = 1
+        # Save summaries are read from disk once per session, then kept current by the writer
+        self.save_index = SaveIndex(self.get_save_path('index.json'),
+                                    [self.get_save_path()] + [self.get_save_path(f'savefile_{i + 1}.json') for i in range(4)])
+        self.save_index.load()
+        self.save_writer = SaveWriter(index=self.save_index)
+
+        self.profiler = FrameProfiler()  # F3 toggles the timing overlay
+        self.telemetry = None
+        if telemetry_path is not None:
+            if not telemetry_path:
+                telemetry_path = self.get_save_path(time.strftime('telemetry/session-%Y%m%d-%H%M%S.csv'))
+            self.telemetry = TelemetryLog(telemetry_path)
+            self.profiler.attach(self.telemetry)
+
+        # Generated by tools/build_level_catalog.py; the only place level files are discovered.
+        # A maps folder given on the command line (e.g. stress maps) is scanned instead
+        self.levels = LevelCatalog.scan(maps_dir) if maps_dir else LevelCatalog.load()
+
+        self.streamer = None  # Set while a chunked level is loaded
+        self.culling = Culling()
+        self.ai = AIScheduler()  # Enemies decide every 4th frame, staggered, at most 24 per frame
+        self.spatial = SpatialHash()  # Refilled every frame with the awake enemies
+        self.world = World(self.assets)  # Sparks and particles
+        self.projectiles = Projectiles()
+        self.level = self.levels.ids()[0]
+        self.max_level = self.level
         self.load_level(self.level)
 
         self.screenshake = 0
@@ -121,12 +185,29 @@ class Game:
         
         # Game state management
         self.game_state = "menu"  # menu, playing, paused
-        self.show_menu = True
         self.current_save_slot = 0  # Track which save slot is currently being used
         
-        # Shared background for consistent animation across screens
-        self.shared_background = SharedBackground(self.assets)
+        # Only the regions that changed are presented while a menu is static
+        self.dirty = DirtyRects()
 
+        # Shared background for consistent animation across screens
+        self.shared_background = SharedBackground(self.assets, self.dirty, particle_count=motes)
+
+        # Every screen is built once and kept alive; the scene stack decides which one is shown
+        self.gameplay = GameplayScene(self)
+        self.main_menu = MainMenu(self)
+        self.save_select = SaveSelect(self)
+        self.level_select = LevelSelect(self)
+        self.pause_menu = PauseMenu(self)
+        self.options_menu = OptionsMenu(self)
+        self.volume_menu = VolumeMenu(self)
+        self.keybindings_menu = KeybindingsMenu(self)
+        self.levels_menu = LevelsMenu(self)
+        self.about_screen = AboutScreen(self)
+        self.confirmation_dialog = ConfirmationDialog(self)
+        self.scenes = SceneStack()
+        self.scheduler = MenuScheduler(self.clock)
+        self.running = False
 
     def get_save_path(self, filename=None):
         """Get the correct path for save files, works for dev and executable"""
@@ -136,6 +217,8 @@ class Game:
 
     def save_game_state(self):
         """Save the game state to a file."""
+        if not self.save_progress:
+            return
         state = {
             "level": self.level,
             "max_level": self.max_level,
@@ -147,10 +230,8 @@ class Game:
                 save_file = self.get_save_path(f'savefile_{self.current_save_slot + 1}.json')
             else:
                 save_file = self.get_save_path()
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(save_file), exist_ok=True)
-            with open(save_file, "w") as f:
-                json.dump(state, f)
+            # Written on the save writer's thread; deaths never wait for the disk
+            self.save_writer.save(save_file, state)
         except Exception as e:
             print(f"Error saving game state: {e}")
 
@@ -181,25 +262,33 @@ class Game:
         self.transition = 0  # Reset transition
         self.level = map_id
         self.max_level = max(self.max_level, map_id)
-        self.tilemap.load(resource_path('data/maps/' + str(map_id) + '.json'))
+        self.profiler.mark('level_load')
+        if self.streamer:
+            self.streamer.close()
+            self.streamer = None
+
+        chunk_dir = self.levels.chunk_path(map_id)
+        if chunk_dir:
+            self.load_streamed_level(chunk_dir)
+        else:
+            self.tilemap.load(self.levels.map_path(map_id))
 
-        self.leaf_spawners = []
-        for tree in self.tilemap.extract([('large_decor', 2)], keep=True):
-            self.leaf_spawners.append(pygame.FRect(4 + tree['pos'][0], 4 + tree['pos'][1], 23, 13))
+            self.leaf_spawners = []
+            for tree in self.tilemap.extract([('large_decor', 2)], keep=True):
+                self.leaf_spawners.append(pygame.FRect(4 + tree['pos'][0], 4 + tree['pos'][1], 23, 13))
 
-        self.enemies = []
-        for spawner in self.tilemap.extract([('spawners', 0), ('spawners', 1)]):
-            if spawner['variant'] == 0:
-                self.player.pos = spawner['pos']
-                self.player.air_time = 0
-            else:
-                self.enemies.append(Enemy(self, spawner['pos'], (8, 15)))
+            self.enemies = []
+            for spawner in self.tilemap.extract([('spawners', 0), ('spawners', 1)]):
+                if spawner['variant'] == 0:
+                    self.player.pos = spawner['pos']
+                    self.player.air_time = 0
+                else:
+                    self.enemies.append(Enemy(self, spawner['pos'], (8, 15)))
+            self.scroll = [0, 0]
 
-        self.projectiles = []
-        self.particles = []
-        self.sparks = []
+        self.projectiles.clear()
+        self.world.clear()
 
-        self.scroll = [0, 0]
         self.dead = 0
         self.transition = -30
 
@@ -207,6 +296,50 @@ class Game:
         self.death_counter = getattr(self, "death_counter", 0)
         self.save_game_state()
 
+    def load_streamed_level(self, chunk_dir):
+        """Start a chunked level: only the chunks around the spawn are read before the first frame"""
+        self.streamer = ChunkStreamer(self, chunk_dir)
+        self.tilemap.tile_size = self.streamer.tile_size
+        self.tilemap.clear()
+        self.leaf_spawners = []
+        self.enemies = []
+        if self.streamer.meta['spawn']:
+            self.player.pos = list(self.streamer.meta['spawn'])
+        self.player.air_time = 0
+
+        # The camera starts on the player; panning in from the origin would stream the whole way
+        self.scroll = [self.player.rect().centerx - self.display.get_width() / 2,
+                       self.player.rect().centery - self.display.get_height() / 2]
+        self.streamer.prime(self.camera_rect())
+
+    def camera_rect(self):
+        """World area the streamer keeps loaded: the view plus the player, who can be ahead of it"""
+        view = pygame.Rect(int(self.scroll[0]), int(self.scroll[1]), self.display.get_width(), self.display.get_height())
+        return view.union(self.player.rect())
+
+    def enemies_remaining(self):
+        """Enemies left in the level, including those in chunks that are not loaded"""
+        if self.streamer:
+            return len(self.enemies) + self.streamer.enemies_elsewhere()
+        return len(self.enemies)
+
+    def on_enemy_killed(self, enemy):
+        enemy.die()
+
+    def on_projectile_blocked(self, pos, velocity):
+        for i in range(4):
+            self.world.add_spark(pos, random.random() - 0.5 + (math.pi if velocity[0] > 0 else 0),
+                                 2 + random.random())
+
+    def on_player_hit(self):
+        self.sfx['hit'].play()
+        self.screenshake = max(16, self.screenshake)
+        for i in range(30):
+            angle = random.random() * math.pi * 2
+            speed = random.random() * 5
+            self.world.add_spark(self.player.rect().center, angle, 2 + random.random())
+            self.world.add_particle('particle', self.player.rect().center, velocity=[math.cos(angle + math.pi) * speed * 0.5, math.sin(angle + math.pi) * speed * 0.5], frame=random.randint(0, 7))
+
     def toggle_fullscreen(self):
         self.is_fullscreen = not self.is_fullscreen
         if self.is_fullscreen:
@@ -216,76 +349,292 @@ class Game:
 
         self.display = pygame.Surface((320, 240), pygame.SRCALPHA)
         self.display_2 = pygame.Surface((320, 240))
+        # Overlays cached for the old display mode are rebuilt for the new one
+        ui_effects.clear_cache()
+        ui_effects.prewarm(self.screen.get_size())
+        self.dirty.invalidate()
     
     def handle_menu_action(self, action):
-        """Handle menu actions and return True if game should continue"""
-        if action == "exit":
-            return False
-        elif action == "start_game":
+        """Open the screen behind a main menu action"""
+        if action == "start_game":
             # Show save selection screen
-            selected_save = save_select(self.screen, self.clock, self.assets, self.sfx, self.shared_background)
-            if selected_save == "back":
-                return True  # Return to main menu
-            elif selected_save == "exit":
-                return False
-            else:
-                # Set the current save slot
-                self.current_save_slot = selected_save
-
-                # Load the selected save file
-                save_file = self.get_save_path(f'savefile_{selected_save + 1}.json')
-                if os.path.exists(save_file):
-                    try:
-                        with open(save_file, "r") as f:
-                            save_data = json.load(f)
-                            self.level = save_data.get("level", 1)
-                            self.max_level = save_data.get("max_level", 1)
-                            self.death_counter = save_data.get("death_counter", 0)
-                    except (json.JSONDecodeError, FileNotFoundError):
-                        # Corrupt file, create new one with defaults
-                        self.level = 1
-                        self.max_level = 1
-                        self.death_counter = 0
-                else:
-                    # New save file
-                    self.level = 1
-                    self.max_level = 1
-                    self.death_counter = 0
-
-                # Create/save the save file (whether existing or new)
-                save_data = {
-                    "level": self.level,
-                    "max_level": self.max_level,
-                    "death_counter": self.death_counter
-                }
-                try:
-                    os.makedirs(os.path.dirname(save_file), exist_ok=True)
-                    with open(save_file, "w") as f:
-                        json.dump(save_data, f)
-                except Exception as e:
-                    print(f"Error creating save file: {e}")
+            self.scenes.push(self.save_select, self.on_save_selected)
+        elif action == "options":
+            self.scenes.push(self.options_menu, lambda result: self.load_keybindings())
+        elif action == "about":
+            self.scenes.push(self.about_screen)
+
+    def on_save_selected(self, selected_save):
+        if selected_save == "back":
+            return  # Return to main menu
+        # Set the current save slot
+        self.current_save_slot = selected_save
+
+        # Load the selected save from the index
+        save_file = self.get_save_path(f'savefile_{selected_save + 1}.json')
+        summary = self.save_index.summary(save_file)
+        if summary:
+            self.level = summary['level']
+            self.max_level = summary['max_level']
+            self.death_counter = summary['death_counter']
+        else:
+            # New (or corrupt) save file: start over and create it
+            self.level = 1
+            self.max_level = 1
+            self.death_counter = 0
+            save_data = {
+                "level": self.level,
+                "max_level": self.max_level,
+                "death_counter": self.death_counter
+            }
+            self.save_writer.save(save_file, save_data)
+
+        # Show level selection screen
+        self.scenes.push(self.level_select, self.on_level_selected)
+
+    def on_level_selected(self, selected_level):
+        if selected_level == "back":
+            return  # Return to main menu
+        self.level = selected_level
+        self.game_state = "playing"
+        self.load_level(self.level)
+        self.scenes.reset(self.gameplay)
+
+    def on_pause_closed(self, selected_level):
+        self.load_keybindings()
+        self.game_state = "playing"
+        if selected_level == "menu":
+            self.game_state = "menu"
+            self.scenes.reset(self.main_menu)
+        elif selected_level != self.level:
+            self.load_level(selected_level)
+
+    def confirm(self, message, callback):
+        """Ask a yes/no question; callback receives True or False"""
+        self.confirmation_dialog.set_message(message)
+        self.scenes.push(self.confirmation_dialog, callback)
+
+    def quit(self):
+        self.running = False
+
+    def handle_gameplay_event(self, event):
+        # Always handle KEYUP events to prevent stuck input states
+        if event.type == pygame.KEYUP:
+            if event.key == self.keybindings['left']:
+                self.movement[0] = False
+            if event.key == self.keybindings['right']:
+                self.movement[1] = False
+            if event.key == self.keybindings['jump']:
+                self.player.cut_jump()
+
+        if self.transition == 0:
+            if event.type == pygame.KEYDOWN:
+                if event.key == self.keybindings['left']:
+                    self.movement[0] = True
+                if event.key == self.keybindings['right']:
+                    self.movement[1] = True
+                if event.key == pygame.K_f:  # Toggle fullscreen when F is pressed
+                    self.toggle_fullscreen()
+                if event.key == self.keybindings['jump']:
+                    if self.player.jump():
+                        self.sfx['jump'].play()
+                if event.key == self.keybindings['dash']:
+                    if self.player.dash():
+                        self.profiler.mark('dash')
+                if event.key == pygame.K_ESCAPE:
+                    self.game_state = "paused"
+                    self.scenes.push(self.pause_menu, self.on_pause_closed)
+
+    def update_gameplay(self):
+        """Advance the level by one frame and draw it into display_2"""
+        prof = self.profiler
+        self.display.fill((0, 0, 0, 0))
+        
+        # Camera first; only what is near it is drawn, and far enemies sleep
+        render_scroll = follow_camera(self, self.display.get_size())
+        culling = self.culling
+        if self.streamer:
+            with prof.scope('streaming'):
+                self.streamer.update(self.camera_rect())
+        drawn = 0
+        
+        with prof.scope('background'):
+            # Render background layers with parallax effect and proper tiling
+            # Each layer moves at different speeds to create depth
+            parallax_factors = [0.05, 0.1, 0.2, 0.35, 0.5, 0.65]  # Adjusted for 6 layers
+        
+            for index, layer in enumerate(self.assets['background_layers']):
+                if index < len(parallax_factors):
+                    # Calculate parallax offset for horizontal scrolling only
+                    parallax_x = render_scroll[0] * parallax_factors[index]
+                
+                    # Get layer dimensions
+                    layer_width = layer.get_width()
+                    layer_height = layer.get_height()
+                
+                    # Scale the background to fit screen height if needed
+                    screen_height = self.display_2.get_height()
+                    if layer_height < screen_height:
+                        # Scale layer to fit screen height
+                        scale_factor = screen_height / layer_height
+                        scaled_layer = pygame.transform.scale(layer, (int(layer_width * scale_factor), screen_height))
+                        layer_width = scaled_layer.get_width()
+                    else:
+                        scaled_layer = layer
+                
+                    # Calculate how many horizontal tiles we need
+                    tiles_x = (self.display_2.get_width() // layer_width) + 3
+                
+                    # Wrap the horizontal parallax offset for seamless tiling
+                    offset_x = -(parallax_x % layer_width)
                 
-                # Show level selection screen
-                selected_level = level_select(self.screen, self.clock, self.assets, self.sfx, self.max_level, self.shared_background)
-                if selected_level == "back":
-                    return True  # Return to main menu
-                elif selected_level == "exit":
-                    return False
+                    # Draw horizontally tiled background (no vertical tiling)
+                    for tile_x in range(-1, tiles_x):
+                        pos_x = offset_x + tile_x * layer_width
+                        pos_y = 0  # Always start at top of screen
+                        self.display_2.blit(scaled_layer, (pos_x, pos_y))
+                    prof.count('blits', tiles_x + 1)
                 else:
-                    self.level = selected_level
-                    self.game_state = "playing"
-                    self.show_menu = False
+                    # Fallback for extra layers - stretch to fit screen
+                    scaled_layer = pygame.transform.scale(layer, (self.display_2.get_width(), self.display_2.get_height()))
+                    self.display_2.blit(scaled_layer, (0, 0))
+
+        with prof.scope('state'):
+            self.screenshake = max(0, self.screenshake - 1)
+
+            if not self.enemies_remaining():
+                self.transition += 1
+                if self.transition == 1:
+                    prof.mark('level_complete')
+                if self.transition > 30:
+                    self.level = min(self.level + 1, self.levels.last_id)
+                    self.max_level = max(self.max_level, self.level)
                     self.load_level(self.level)
-        elif action == "options":
-            options_menu(self.screen, self.clock, self.level, self.max_level, self.assets, self.sfx, self.shared_background)
-            self.load_keybindings()
-        elif action == "about":
-            about_result = about_screen(self.screen, self.clock, self.assets, self.sfx, self.shared_background)
-            if about_result == "exit":
-                return False
-            # If "back", continue to main menu
-        return True
-    
+            if self.transition < 0:
+                self.transition += 1
+
+            if self.dead and advance_death(self):
+                self.load_level(self.level)
+
+            for rect in self.leaf_spawners:
+                if culling.near(rect) and random.random() * 49999 < rect.width * rect.height:
+                    pos = (rect.x + random.random() * rect.width, rect.y + random.random() * rect.height)
+                    self.world.add_particle('leaf', pos, velocity=[-0.1, 0.3], frame=random.randint(0, 20))
+
+        with prof.scope('clouds'):
+            self.clouds.update()
+            self.clouds.render(self.display_2, offset=render_scroll)
+            prof.count('blits', len(self.clouds))
+
+        with prof.scope('tilemap'):
+            prof.count('blits', self.tilemap.render(self.display, offset=render_scroll))
+
+        alive = not self.dead
+        step_entities(self, (self.movement[1] - self.movement[0], 0))
+        if alive and self.dead:
+            self.death_counter += 1
+            prof.mark('death')
+
+        with prof.scope('sprites'):
+            for enemy in self.enemies:
+                if not enemy.asleep and culling.visible(enemy.rect()):
+                    enemy.render(self.display, offset=render_scroll)
+                    drawn += 1
+            if not self.dead:
+                self.player.render(self.display, offset=render_scroll)
+            img = self.assets['projectile']
+            pos = self.projectiles.column('pos')
+            corners = pos[in_view(pos, culling.view)] - (img.get_width() / 2, img.get_height() / 2) - render_scroll
+            self.display.fblits([(img, corner) for corner in corners.tolist()])
+            drawn += len(corners)
+
+        with prof.scope('sparks'):
+            self.world.run_sparks(self.display, render_scroll, culling.view)
+
+        with prof.scope('silhouette'):
+            display_mask = pygame.mask.from_surface(self.display)
+            display_sillhouette = display_mask.to_surface(setcolor=(0, 0, 0, 180), unsetcolor=(0, 0, 0, 0))
+            for offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                self.display_2.blit(display_sillhouette, offset)
+
+        with prof.scope('particles'):
+            drawn += self.world.run_particles(self.display, render_scroll, culling.view)
+
+        with prof.scope('transition'):
+            if self.transition:
+                transition_surf = pygame.Surface(self.display.get_size())
+                pygame.draw.circle(transition_surf, (255, 255, 255), (self.display.get_width() // 2, self.display.get_height() // 2), (30 - abs(self.transition)) * 8) #30*8 = 180
+                transition_surf.set_colorkey((255, 255, 255))
+                self.display.blit(transition_surf, (0, 0))
+
+        with prof.scope('hud'):
+            self.display_2.blit(self.display, (0, 0))
+
+            # Game screen HUD with Protest_Revolution font - black labels, dark bright red numbers
+            ui_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 18)
+
+            # Level display at top-left with black labels and dark bright red numbers with thin black padding
+            level_label = ui_font.render("Level:", True, (0, 0, 0))
+            level_number = ui_font.render(str(self.level), True, (255, 50, 50))
+
+            # Position level display
+            level_label_pos = (10, 10)
+            level_number_pos = (level_label_pos[0] + level_label.get_width() + 5, level_label_pos[1])
+
+            # Add thin black outline around number
+            for offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                outline_text = ui_font.render(str(self.level), True, (0, 0, 0))
+                self.display_2.blit(outline_text, (level_number_pos[0] + offset[0], level_number_pos[1] + offset[1]))
+
+            self.display_2.blit(level_label, level_label_pos)
+            self.display_2.blit(level_number, level_number_pos)
+
+            enemies_left = self.enemies_remaining()  # Get the number of enemies left
+
+            # Enemies display at top-right with black labels and dark bright red numbers with thin black padding
+            enemies_label = ui_font.render("Enemies:", True, (0, 0, 0))
+            enemies_number = ui_font.render(str(enemies_left), True, (255, 50, 50))
+
+            # Position enemies display
+            enemies_label_x = self.display_2.get_width() - enemies_label.get_width() - enemies_number.get_width() - 15
+            enemies_number_x = enemies_label_x + enemies_label.get_width() + 5
+
+            # Add thin black outline around enemy count
+            for offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                outline_text = ui_font.render(str(enemies_left), True, (0, 0, 0))
+                self.display_2.blit(outline_text, (enemies_number_x + offset[0], 10 + offset[1]))
+
+            self.display_2.blit(enemies_label, (enemies_label_x, 10))
+            self.display_2.blit(enemies_number, (enemies_number_x, 10))
+
+            # Death counter at bottom-left with black labels and dark bright red numbers with thin black padding
+            death_label = ui_font.render("Deaths:", True, (0, 0, 0))
+            death_number = ui_font.render(str(self.death_counter), True, (255, 50, 50))
+
+            # Position death counter
+            death_label_pos = (10, self.display_2.get_height() - 28)
+            death_number_pos = (death_label_pos[0] + death_label.get_width() + 5, death_label_pos[1])
+
+            # Add thin black outline around death count
+            for offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                outline_text = ui_font.render(str(self.death_counter), True, (0, 0, 0))
+                self.display_2.blit(outline_text, (death_number_pos[0] + offset[0], death_number_pos[1] + offset[1]))
+
+            self.display_2.blit(death_label, death_label_pos)
+            self.display_2.blit(death_number, death_number_pos)
+
+        prof.count('entities', len(self.enemies) + 1)
+        prof.count('projectiles', len(self.projectiles))
+        prof.count('particles', len(self.world.particles))
+        prof.count('sparks', len(self.world.sparks))
+        # Visible enemies, projectiles and particles, the player and the silhouette pass
+        prof.count('blits', drawn + 1 + 4)
+
+    def render_gameplay(self, surf):
+        with self.profiler.scope('upscale'):
+            screenshake_offset = (random.random() * self.screenshake - self.screenshake / 2, random.random() * self.screenshake - self.screenshake / 2)
+            surf.blit(pygame.transform.scale(self.display_2, surf.get_size()), screenshake_offset)
+
     def run(self):
         pygame.mixer.music.load(resource_path('data/music.wav'))
         pygame.mixer.music.set_volume(0.5)
@@ -293,263 +642,80 @@ class Game:
 
         self.sfx['ambience'].play(-1)
 
+        # One loop drives every screen: input dispatch, update, render,
+        # presentation and frame pacing all happen here
+        self.scenes.reset(self.main_menu)
+        self.running = True
+        presented_scene = None
         try:
-            while True:
-                # Show main menu if needed
-                if self.show_menu:
-                    action = main_menu(self.screen, self.clock, self.assets, self.sfx, self.shared_background)
-                    if not self.handle_menu_action(action):
-                        break
-                    continue
-                self.display.fill((0, 0, 0, 0))
-                
-                # Calculate camera scroll first
-                self.scroll[0] += (self.player.rect().centerx - self.display.get_width() / 2 - self.scroll[0]) / 30
-                self.scroll[1] += (self.player.rect().centery - self.display.get_height() / 2 - self.scroll[1]) / 30
-                render_scroll = (int(self.scroll[0]), int(self.scroll[1]))
-                
-                # Render background layers with parallax effect and proper tiling
-                # Each layer moves at different speeds to create depth
-                parallax_factors = [0.05, 0.1, 0.2, 0.35, 0.5, 0.65]  # Adjusted for 6 layers
-                
-                for index, layer in enumerate(self.assets['background_layers']):
-                    if index < len(parallax_factors):
-                        # Calculate parallax offset for horizontal scrolling only
-                        parallax_x = render_scroll[0] * parallax_factors[index]
-                        
-                        # Get layer dimensions
-                        layer_width = layer.get_width()
-                        layer_height = layer.get_height()
-                        
-                        # Scale the background to fit screen height if needed
-                        screen_height = self.display_2.get_height()
-                        if layer_height < screen_height:
-                            # Scale layer to fit screen height
-                            scale_factor = screen_height / layer_height
-                            scaled_layer = pygame.transform.scale(layer, (int(layer_width * scale_factor), screen_height))
-                            layer_width = scaled_layer.get_width()
-                        else:
-                            scaled_layer = layer
-                        
-                        # Calculate how many horizontal tiles we need
-                        tiles_x = (self.display_2.get_width() // layer_width) + 3
-                        
-                        # Wrap the horizontal parallax offset for seamless tiling
-                        offset_x = -(parallax_x % layer_width)
-                        
-                        # Draw horizontally tiled background (no vertical tiling)
-                        for tile_x in range(-1, tiles_x):
-                            pos_x = offset_x + tile_x * layer_width
-                            pos_y = 0  # Always start at top of screen
-                            self.display_2.blit(scaled_layer, (pos_x, pos_y))
-                    else:
-                        # Fallback for extra layers - stretch to fit screen
-                        scaled_layer = pygame.transform.scale(layer, (self.display_2.get_width(), self.display_2.get_height()))
-                        self.display_2.blit(scaled_layer, (0, 0))
-
-                self.screenshake = max(0, self.screenshake - 1)
-
-                if not len(self.enemies):
-                    self.transition += 1
-                    if self.transition > 30:
-                        self.level = min(self.level + 1, len(os.listdir(resource_path('data/maps'))))
-                        self.max_level = max(self.max_level, self.level)
-                        self.load_level(self.level)
-                if self.transition < 0:
-                    self.transition += 1
-
-                if self.dead:
-                    self.dead += 1
-                    if self.dead >= 10:
-                        self.transition = min(30, self.transition + 1)
-                    if self.dead > 40:
-                        self.load_level(self.level)
-
-                for rect in self.leaf_spawners:
-                    if random.random() * 49999 < rect.width * rect.height:
-                        pos = (rect.x + random.random() * rect.width, rect.y + random.random() * rect.height)
-                        self.particles.append(
-                            Particle(self, 'leaf', pos, velocity=[-0.1, 0.3], frame=random.randint(0, 20)))
-
-                self.clouds.update()
-                self.clouds.render(self.display_2, offset=render_scroll)
-
-                self.tilemap.render(self.display, offset=render_scroll)
-
-                for enemy in self.enemies.copy():
-                    kill = enemy.update(self.tilemap, (0, 0))
-                    enemy.render(self.display, offset=render_scroll)
-                    if kill:
-                        self.enemies.remove(enemy)
-
-                if not self.dead:
-                    self.player.update(self.tilemap, (self.movement[1] - self.movement[0], 0))
-                    self.player.render(self.display, offset=render_scroll)
-
-                # [[x, y], direction, timer]
-                for projectile in self.projectiles.copy():
-                    projectile[0][0] += projectile[1]
-                    projectile[2] += 1
-                    img = self.assets['projectile']
-                    self.display.blit(img, (projectile[0][0] - img.get_width() / 2 - render_scroll[0],
-                                            projectile[0][1] - img.get_height() / 2 - render_scroll[1]))
-                    if self.tilemap.solid_check(projectile[0]):
-                        self.projectiles.remove(projectile)
-                        for i in range(4):
-                            self.sparks.append(
-                                Spark(projectile[0], random.random() - 0.5 + (math.pi if projectile[1] > 0 else 0),
-                                      2 + random.random()))
-                    elif projectile[2] > 360:
-                        self.projectiles.remove(projectile)
-                    elif abs(self.player.dashing) < 50:
-                        if self.player.rect().collidepoint(projectile[0]):
-                            self.projectiles.remove(projectile)
-                            self.dead += 1
-                            self.sfx['hit'].play()
-                            self.screenshake = max(16, self.screenshake)
-                            for i in range(30):
-                                angle = random.random() * math.pi * 2
-                                speed = random.random() * 5
-                                self.sparks.append(Spark(self.player.rect().center, angle, 2 + random.random()))
-                                self.particles.append(Particle(self, 'particle', self.player.rect().center, velocity=[math.cos(angle + math.pi) * speed * 0.5, math.sin(angle + math.pi) * speed * 0.5], frame=random.randint(0, 7)))
-
-                for spark in self.sparks.copy():
-                    kill = spark.update()
-                    spark.render(self.display, offset=render_scroll)
-                    if kill:
-                        self.sparks.remove(spark)
-
-                display_mask = pygame.mask.from_surface(self.display)
-                display_sillhouette = display_mask.to_surface(setcolor=(0, 0, 0, 180), unsetcolor=(0, 0, 0, 0))
-                for offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    self.display_2.blit(display_sillhouette, offset)
-
-                for particle in self.particles.copy():
-                    kill = particle.update()
-                    particle.render(self.display, offset=render_scroll)
-                    if particle.type == 'leaf':
-                        particle.pos[0] += math.sin(particle.animation.frame * 0.035) * 0.3
-                    if kill:
-                        self.particles.remove(particle)
-
-                if self.dead:
-                    self.dead += 1  # Increment the death animation/frame counter
-                    if self.dead == 2:  # Increment death counter only once per death
-                        self.death_counter += 1
-                    if self.dead >= 10:  # Start transition to respawn
-                        self.transition = min(30, self.transition + 1)
-                    if self.dead > 40:  # After animation finishes, reload the level
-                        self.load_level(self.level)
-
-
-
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        sys.exit()
-
-                    # Always handle KEYUP events to prevent stuck input states
-                    if event.type == pygame.KEYUP:
-                        if event.key == self.keybindings['left']:
-                            self.movement[0] = False
-                        if event.key == self.keybindings['right']:
-                            self.movement[1] = False
-                        if event.key == self.keybindings['jump']:
-                            self.player.cut_jump()
-
-                    if self.transition == 0:
-                        if event.type == pygame.KEYDOWN:
-                            if event.key == self.keybindings['left']:
-                                self.movement[0] = True
-                            if event.key == self.keybindings['right']:
-                                self.movement[1] = True
-                            if event.key == pygame.K_f:  # Toggle fullscreen when F is pressed
-                                self.toggle_fullscreen()
-                            if event.key == self.keybindings['jump']:
-                                if self.player.jump():
-                                    self.sfx['jump'].play()
-                            if event.key == self.keybindings['dash']:
-                                self.player.dash()
-                            if event.key == pygame.K_ESCAPE:
-                                selected_level = pause_menu(self.screen, self.clock, self.level, self.max_level, self.assets, self.sfx, self.shared_background)
-                                self.load_keybindings()
-                                if selected_level == "menu":
-
-                                    self.show_menu = True
-                                    self.game_state = "menu"
-                                elif selected_level != self.level:
-                                    self.load_level(selected_level)
-
-                if self.transition:
-                    transition_surf = pygame.Surface(self.display.get_size())
-                    pygame.draw.circle(transition_surf, (255, 255, 255), (self.display.get_width() // 2, self.display.get_height() // 2), (30 - abs(self.transition)) * 8) #30*8 = 180
-                    transition_surf.set_colorkey((255, 255, 255))
-                    self.display.blit(transition_surf, (0, 0))
-
-                self.display_2.blit(self.display, (0, 0))
-
-                # Game screen HUD with Protest_Revolution font - black labels, dark bright red numbers
-                ui_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 18)
-
-                # Level display at top-left with black labels and dark bright red numbers with thin black padding
-                level_label = ui_font.render("Level:", True, (0, 0, 0))
-                level_number = ui_font.render(str(self.level), True, (255, 50, 50))
-
-                # Position level display
-                level_label_pos = (10, 10)
-                level_number_pos = (level_label_pos[0] + level_label.get_width() + 5, level_label_pos[1])
-
-                # Add thin black outline around number
-                for offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    outline_text = ui_font.render(str(self.level), True, (0, 0, 0))
-                    self.display_2.blit(outline_text, (level_number_pos[0] + offset[0], level_number_pos[1] + offset[1]))
-
-                self.display_2.blit(level_label, level_label_pos)
-                self.display_2.blit(level_number, level_number_pos)
-
-                enemies_left = len(self.enemies)  # Get the number of enemies left
-
-                # Enemies display at top-right with black labels and dark bright red numbers with thin black padding
-                enemies_label = ui_font.render("Enemies:", True, (0, 0, 0))
-                enemies_number = ui_font.render(str(enemies_left), True, (255, 50, 50))
-
-                # Position enemies display
-                enemies_label_x = self.display_2.get_width() - enemies_label.get_width() - enemies_number.get_width() - 15
-                enemies_number_x = enemies_label_x + enemies_label.get_width() + 5
-
-                # Add thin black outline around enemy count
-                for offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    outline_text = ui_font.render(str(enemies_left), True, (0, 0, 0))
-                    self.display_2.blit(outline_text, (enemies_number_x + offset[0], 10 + offset[1]))
-
-                self.display_2.blit(enemies_label, (enemies_label_x, 10))
-                self.display_2.blit(enemies_number, (enemies_number_x, 10))
-
-                # Death counter at bottom-left with black labels and dark bright red numbers with thin black padding
-                death_label = ui_font.render("Deaths:", True, (0, 0, 0))
-                death_number = ui_font.render(str(self.death_counter), True, (255, 50, 50))
-
-                # Position death counter
-                death_label_pos = (10, self.display_2.get_height() - 28)
-                death_number_pos = (death_label_pos[0] + death_label.get_width() + 5, death_label_pos[1])
-
-                # Add thin black outline around death count
-                for offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    outline_text = ui_font.render(str(self.death_counter), True, (0, 0, 0))
-                    self.display_2.blit(outline_text, (death_number_pos[0] + offset[0], death_number_pos[1] + offset[1]))
-
-                self.display_2.blit(death_label, death_label_pos)
-                self.display_2.blit(death_number, death_number_pos)
-
-
-                screenshake_offset = (random.random() * self.screenshake - self.screenshake / 2, random.random() * self.screenshake - self.screenshake / 2)
-                self.screen.blit(pygame.transform.scale(self.display_2, self.screen.get_size()), screenshake_offset)
-                pygame.display.update()
-                self.clock.tick(60)
+            while self.running and self.scenes.top:
+                prof = self.profiler
+                prof.begin_frame()
+                with prof.scope('events'):
+                    for event in self.scheduler.events():
+                        if event.type == pygame.QUIT:
+                            self.running = False
+                            break
+                        self.dirty.note_event(event)
+                        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                            prof.toggle()
+                            self.dirty.invalidate()
+                            continue
+                        # The top scene may change while events are dispatched
+                        self.scenes.top.handle_event(event)
+                if not self.running or not self.scenes.top:
+                    break
+
+                scene = self.scenes.top
+                if scene is not presented_scene:
+                    self.dirty.invalidate()
+                    presented_scene = scene
+                with prof.scope('update'):
+                    scene.update(self.scheduler.frame_scale)
+                with prof.scope('render'):
+                    scene.render(self.screen)
+                regions = scene.dirty_regions()
+                if regions is None:
+                    self.dirty.invalidate()
+                else:
+                    self.dirty.extend(regions)
+                overlay_rect = prof.render(self.screen)
+                if overlay_rect:
+                    self.dirty.add(overlay_rect)
+                with prof.scope('present'):
+                    self.dirty.present()
+                # Measured before tick() so the idle wait is not counted as frame time
+                prof.end_frame(type(scene).__name__, self.level)
+                self.scheduler.tick(allow_idle=scene.allow_idle)
 
         except Exception as e:
             print(f"Error: {e}")
         finally:
-            self.save_game_state()
+            self.shutdown()
 
-Game().run()
+    def shutdown(self):
+        # The only synchronous save: flush everything before the process exits
+        self.save_game_state()
+        self.save_writer.close()
+        if self.save_progress:
+            self.save_index.save()
+        if self.telemetry:
+            self.telemetry.close()
+        if self.streamer:
+            self.streamer.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Try-Hard')
+    parser.add_argument('--telemetry', nargs='?', const='', metavar='PATH',
+                        help='log per-frame timings to a CSV file (default: saves/telemetry/session-<time>.csv)')
+    parser.add_argument('--maps', metavar='DIR', help='play the N.json maps in DIR instead of the shipped levels')
+    parser.add_argument('--discrete-collision', action='store_true',
+                        help='use the old 3x3 tile collision test instead of swept collision')
+    parser.add_argument('--motes', type=int, default=15, metavar='N',
+                        help='ambient motes behind the menus (default: 15; thousands on fast machines)')
+    args = parser.parse_args()
+    if args.motes < 0:
+        parser.error('--motes must be 0 or more')
+    PhysicsEntity.sweep = not args.discrete_collision
+    Game(telemetry_path=args.telemetry, maps_dir=args.maps, motes=args.motes).run()
@@ -1,8 +1,8 @@
 import pygame
-import sys
 import math
-from scripts.shared_background import SharedBackground
 from scripts.utils import resource_path
+from scripts.scenes import Scene
+from scripts import ui_effects
 
 pygame.init()
 pygame.mixer.init()
@@ -10,12 +10,11 @@ pygame.mixer.init()
 click_sound = pygame.mixer.Sound(resource_path('data/menu.wav'))
 click_sound.set_volume(0.2)
 
-class AboutScreen:
-    def __init__(self, screen, clock, assets, sfx, shared_background=None):
-        self.screen = screen
-        self.clock = clock
-        self.assets = assets
-        self.sfx = sfx
+class AboutScreen(Scene):
+    def __init__(self, game):
+        super().__init__(game)
+        self.assets = game.assets
+        self.sfx = game.sfx
 
         # Fonts - dark theme focused
         self.title_font = pygame.font.Font(resource_path('data/fonts/ninjaline/NinjaLine.ttf'), 36)
@@ -25,6 +24,7 @@ class AboutScreen:
 
         # Animation variables
         self.glow_phase = 0
+        self.frame_scale = 1.0
 
         # Colors - emphasize dark red and black theme
         self.colors = {
@@ -39,7 +39,8 @@ class AboutScreen:
         }
 
         # Shared background
-        self.shared_background = shared_background or SharedBackground(assets)
+        self.shared_background = game.shared_background
+        self.regions = []
 
         # Minimal content structure
         self.content = {
@@ -65,7 +66,7 @@ class AboutScreen:
 
     def render_title(self, display, center_x, y_pos):
         """Render the glowing title"""
-        self.glow_phase += 0.05
+        self.glow_phase += 0.05 * self.frame_scale
         glow_intensity = int(128 + 127 * math.sin(self.glow_phase))
 
         # Crimson glow effect
@@ -83,10 +84,10 @@ class AboutScreen:
             glow_rect = title_rect.copy()
             glow_rect.centerx += offset[0]
             glow_rect.centery += offset[1]
-            display.blit(glow_text, glow_rect)
+            self.regions.append(display.blit(glow_text, glow_rect))
 
         # Draw main title
-        display.blit(title_text, title_rect)
+        self.regions.append(display.blit(title_text, title_rect))
 
     def render_text_block(self, display, center_x, start_y, lines, font, color, line_spacing=26):
         """Render a block of text with centered alignment"""
@@ -124,20 +125,17 @@ class AboutScreen:
         pygame.draw.rect(display, self.colors['separator'],
                         (center_x - 150, y_pos - 1, 300, 2))
 
-    def render(self, display, display_2):
+    def render(self, surf):
         """Main render method - dark red/black themed single page"""
-        # Clear displays
-        display.fill((0, 0, 0, 0))
+        display = display_2 = surf  # Menus draw straight onto the screen
+        self.regions = []
         display_2.fill((0, 0, 0))
 
         # Render background using shared background
         self.shared_background.render_background(display_2)
 
-        # Create dark overlay for readability
-        overlay = pygame.Surface(display_2.get_size())
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(140)  # Dark enough for contrast
-        display_2.blit(overlay, (0, 0))
+        # Dark overlay for readability
+        display_2.blit(ui_effects.dim_overlay(display_2.get_size(), 140), (0, 0))  # Dark enough for contrast
 
         # Render particles for atmosphere
         self.shared_background.render_particles(display)
@@ -175,39 +173,18 @@ class AboutScreen:
         exit_rect = exit_text.get_rect(center=(center_x, exit_y))
         display.blit(exit_text, exit_rect)
 
-        # Composite displays
-        display_2.blit(display, (0, 0))
-
-    def handle_input(self):
-        """Handle input and return action"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "exit"
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE or event.key == pygame.K_ESCAPE:
-                    click_sound.play()
-                    return "back"
-            # Removed scroll wheel handling since not scrollable anymore
-        return None
-
-    def run(self):
-        """Main about screen loop - single page"""
-        while True:
-            action = self.handle_input()
-            if action is not None:
-                return action
-
-            # Update animations
-            self.shared_background.update()
-
-            # Render
-            self.render(self.screen, self.screen)
-
-            # Update display
-            pygame.display.flip()
-            self.clock.tick(60)
-
-def about_screen(screen, clock, assets, sfx, shared_background=None):
-    """Entry point for about screen"""
-    about = AboutScreen(screen, clock, assets, sfx, shared_background)
-    return about.run()
+    def handle_event(self, event):
+        """Handle input and return to the previous screen"""
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE or event.key == pygame.K_ESCAPE:
+                click_sound.play()
+                self.close("back")
+
+    def dirty_regions(self):
+        """Only the title animates; the text below it is static"""
+        return self.regions
+
+    def update(self, dt):
+        """Update animations"""
+        self.frame_scale = dt
+        self.shared_background.update(dt)
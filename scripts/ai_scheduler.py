@@ -0,0 +1,62 @@
+import math
+
+
+class AIScheduler:
+    """Spreads enemy decision-making across frames.
+
+    Each enemy gets a stagger slot and thinks once every `period` frames, on
+    the frame matching its slot, so a level's enemies decide in turn rather
+    than together. At most `budget` enemies think in one frame: when more
+    enemies are awake than period * budget allows, the period stretches to
+    fit, and an enemy that still misses the budget stays due and thinks on
+    the next frame. Physics is not scheduled; Enemy.update integrates every
+    frame either way.
+    """
+
+    def __init__(self, period=4, budget=24):
+        self.base_period = period
+        self.period = period
+        self.budget = budget
+        self.frame = 0
+        self.next_slot = 0
+        self.candidates = 0  # Enemies asked about this frame
+        self.thinks = 0
+        self.deferred = 0
+        self.max_thinks = 0
+        self.total_thinks = 0
+        self.total_deferred = 0
+
+    def begin_frame(self):
+        self.frame += 1
+        # Last frame's awake count decides how far decisions must be spread
+        self.period = max(self.base_period, math.ceil(self.candidates / self.budget))
+        self.candidates = 0
+        self.thinks = 0
+        self.deferred = 0
+
+    def end_frame(self, profiler):
+        self.max_thinks = max(self.max_thinks, self.thinks)
+        self.total_thinks += self.thinks
+        self.total_deferred += self.deferred
+        profiler.count('ai_thinks', self.thinks)
+        profiler.count('ai_deferred', self.deferred)
+        profiler.count('ai_period', self.period)
+
+    def think_frames(self, enemy):
+        """Frames the enemy's decision covers this frame, or 0 if it does not think"""
+        if enemy.ai_slot is None:
+            # Consecutive slots land on consecutive frames for any period
+            enemy.ai_slot = self.next_slot
+            self.next_slot += 1
+        self.candidates += 1
+        enemy.ai_elapsed += 1
+        if (self.frame + enemy.ai_slot) % self.period and enemy.ai_elapsed < self.period:
+            return 0
+        if self.thinks >= self.budget:
+            self.deferred += 1
+            return 0
+        self.thinks += 1
+        # A long wait still counts as at most one period's worth of walk rolls
+        frames = min(enemy.ai_elapsed, self.period)
+        enemy.ai_elapsed = 0
+        return frames
@@ -0,0 +1,224 @@
+import hashlib
+import json
+import math
+import os
+import queue
+import threading
+import pygame
+from scripts.entities import Enemy
+from scripts.level_catalog import describe_map_data
+
+CHUNK_SIZE = 32  # Tiles per chunk side
+CHUNK_FORMAT = 1
+LEAF_TREE = ('large_decor', 2)
+
+
+def chunk_name(key):
+    return f'{key[0]}_{key[1]}.json'
+
+
+def split_map(map_data, chunk_size=CHUNK_SIZE):
+    """Split map data into {(cx, cy): chunk}; spawners become enemy positions and the player spawn"""
+    tile_size = map_data['tile_size']
+    span = chunk_size * tile_size
+    chunks = {}
+
+    def chunk_at(px, py):
+        key = (math.floor(px / span), math.floor(py / span))
+        if key not in chunks:
+            chunks[key] = {'tilemap': {}, 'offgrid': [], 'enemies': []}
+        return chunks[key]
+
+    # Same order and pixel units as Tilemap.extract in Game.load_level, so the same spawn wins
+    spawners = []
+    for tile in map_data['offgrid']:
+        if tile['type'] == 'spawners':
+            spawners.append((tile['variant'], list(tile['pos'])))
+        else:
+            chunk_at(*tile['pos'])['offgrid'].append(tile)
+    for loc, tile in map_data['tilemap'].items():
+        if tile['type'] == 'spawners':
+            spawners.append((tile['variant'], [tile['pos'][0] * tile_size, tile['pos'][1] * tile_size]))
+        else:
+            chunk_at(tile['pos'][0] * tile_size, tile['pos'][1] * tile_size)['tilemap'][loc] = tile
+
+    spawn = None
+    for variant, pos in spawners:
+        if variant == 0:
+            spawn = pos
+        else:
+            chunk_at(*pos)['enemies'].append(pos)
+    return chunks, spawn
+
+
+def write_chunks(map_data, out_dir, chunk_size=CHUNK_SIZE):
+    """Write map data as a folder of chunk files plus meta.json; returns the meta"""
+    raw = json.dumps(map_data).encode()
+    meta = describe_map_data(None, map_data, None, hashlib.sha1(raw).hexdigest())
+    chunks, spawn = split_map(map_data, chunk_size)
+    os.makedirs(out_dir, exist_ok=True)
+    for name in os.listdir(out_dir):
+        if name.endswith('.json'):
+            os.remove(os.path.join(out_dir, name))
+    for key, chunk in chunks.items():
+        with open(os.path.join(out_dir, chunk_name(key)), 'w') as f:
+            json.dump(chunk, f)
+    meta.update({
+        'format': CHUNK_FORMAT,
+        'chunk_size': chunk_size,
+        'spawn': spawn,
+        # Enemy count per chunk, so the HUD can count enemies in chunks never loaded
+        'chunks': {f'{key[0]};{key[1]}': len(chunk['enemies']) for key, chunk in chunks.items()},
+    })
+    del meta['id'], meta['file']
+    with open(os.path.join(out_dir, 'meta.json'), 'w') as f:
+        json.dump(meta, f)
+    return meta
+
+
+def read_meta(chunk_dir):
+    with open(os.path.join(chunk_dir, 'meta.json'), 'r') as f:
+        return json.load(f)
+
+
+class ChunkStreamer:
+    """Keeps only the chunks around the camera of a chunked level in memory.
+
+    Chunk files are read on a background thread and merged into the
+    Tilemap on the game thread in update(). Chunks outside the keep area are
+    evicted, as is the farthest chunk whenever more than `budget` are
+    resident. Live enemies standing in an evicted chunk go dormant: their
+    positions are remembered and they come back when the chunk is loaded
+    again, so killed enemies stay dead and the level's enemy count holds.
+    """
+
+    def __init__(self, game, chunk_dir, budget=64, margin=1):
+        self.game = game
+        self.chunk_dir = chunk_dir
+        self.meta = read_meta(chunk_dir)
+        self.tile_size = self.meta['tile_size']
+        self.span = self.meta['chunk_size'] * self.tile_size
+        self.available = {tuple(int(v) for v in key.split(';')): count for key, count in self.meta['chunks'].items()}
+        self.budget = budget
+        self.margin = margin  # Chunks loaded beyond the camera; evicted beyond margin + 1
+
+        self.loaded = {}  # key -> chunk data (tile locations, offgrid tiles, leaf spawner rects)
+        self.dormant = {}  # key -> enemy positions of an evicted chunk; replaces the file's spawners
+        self.requested = set()
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.thread = threading.Thread(target=self.run, name='chunk-loader', daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            key = self.requests.get()
+            if key is None:
+                break
+            try:
+                with open(os.path.join(self.chunk_dir, chunk_name(key)), 'r') as f:
+                    self.results.put((key, json.load(f)))
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Error loading chunk {key}: {e}")
+                self.results.put((key, {'tilemap': {}, 'offgrid': [], 'enemies': []}))
+
+    def close(self):
+        self.requests.put(None)
+
+    def chunks_around(self, rect, margin):
+        x0 = math.floor(rect[0] / self.span) - margin
+        y0 = math.floor(rect[1] / self.span) - margin
+        x1 = math.floor((rect[0] + rect[2]) / self.span) + margin
+        y1 = math.floor((rect[1] + rect[3]) / self.span) + margin
+        return {(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1) if (x, y) in self.available}
+
+    def prime(self, rect):
+        """Load the chunks around rect before the first frame, waiting for the loader"""
+        wanted = self.chunks_around(rect, self.margin)
+        for key in wanted - self.requested:
+            self.requested.add(key)
+            self.requests.put(key)
+        while self.requested & wanted:
+            key, chunk = self.results.get()
+            self.integrate(key, chunk)
+
+    def update(self, rect):
+        """Request chunks near the camera rect, merge finished loads and evict far chunks"""
+        wanted = self.chunks_around(rect, self.margin)
+        for key in wanted - self.loaded.keys() - self.requested:
+            self.requested.add(key)
+            self.requests.put(key)
+
+        keep = self.chunks_around(rect, self.margin + 1)
+        changed = False
+        while True:
+            try:
+                key, chunk = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if key in keep:
+                self.integrate(key, chunk, rebuild=False)
+                changed = True
+            else:
+                self.requested.discard(key)
+
+        evict = [key for key in self.loaded if key not in keep]
+        if len(self.loaded) - len(evict) > self.budget:
+            center = (rect[0] + rect[2] / 2, rect[1] + rect[3] / 2)
+            extra = sorted((key for key in self.loaded if key in keep and key not in wanted),
+                           key=lambda key: -self.distance(key, center))
+            evict += extra[:len(self.loaded) - len(evict) - self.budget]
+        for key in evict:
+            self.evict(key, rebuild=False)
+            changed = True
+        if changed:
+            self.rebuild()
+
+    def distance(self, key, pos):
+        return math.hypot((key[0] + 0.5) * self.span - pos[0], (key[1] + 0.5) * self.span - pos[1])
+
+    def integrate(self, key, chunk, rebuild=True):
+        game = self.game
+        self.requested.discard(key)
+        if key in self.loaded:
+            return
+        game.tilemap.add_tiles(chunk['tilemap'])
+        leaf_spawners = []
+        for tile in chunk['offgrid']:
+            if (tile['type'], tile['variant']) == LEAF_TREE:
+                leaf_spawners.append(pygame.FRect(4 + tile['pos'][0], 4 + tile['pos'][1], 23, 13))
+        self.loaded[key] = {'locs': list(chunk['tilemap']), 'offgrid': chunk['offgrid'], 'leaf_spawners': leaf_spawners}
+        for pos in self.dormant.pop(key, chunk['enemies']):
+            game.enemies.append(Enemy(game, list(pos), (8, 15)))
+        if rebuild:
+            self.rebuild()
+
+    def evict(self, key, rebuild=True):
+        game = self.game
+        chunk = self.loaded.pop(key)
+        game.tilemap.remove_tiles(chunk['locs'])
+        sleeping = []
+        for enemy in game.enemies.copy():
+            if self.key_at(enemy.pos) == key:
+                sleeping.append(list(enemy.pos))
+                game.enemies.remove(enemy)
+        self.dormant[key] = sleeping
+        if rebuild:
+            self.rebuild()
+
+    def key_at(self, pos):
+        return (math.floor(pos[0] / self.span), math.floor(pos[1] / self.span))
+
+    def rebuild(self):
+        """Refresh the per-level lists that span chunks"""
+        game = self.game
+        game.tilemap.offgrid_tiles = [tile for chunk in self.loaded.values() for tile in chunk['offgrid']]
+        game.leaf_spawners = [rect for chunk in self.loaded.values() for rect in chunk['leaf_spawners']]
+
+    def enemies_elsewhere(self):
+        """Enemies of this level that are not loaded: dormant ones and those in chunks never visited"""
+        count = sum(len(positions) for positions in self.dormant.values())
+        for key, enemies in self.available.items():
+            if key not in self.loaded and key not in self.dormant:
+                count += enemies
+        return count
@@ -1,31 +1,32 @@
-import random
+import numpy as np
 
-class Cloud:
-    def __init__(self, pos, img, speed, depth,):
-        self.pos = list(pos)
-        self.img = img
-        self.speed = speed
-        self.depth = depth
-
-    def update(self):
-        self.pos[0] += self.speed
-
-    def render(self, surf, offset=(0, 0)):
-        render_pos = (self.pos[0] - offset[0] * self.depth, self.pos[1] - offset[1] * self.depth)
-        surf.blit(self.img, (render_pos[0] % (surf.get_width() + self.img.get_width()) - self.img.get_width(), render_pos[1] % (surf.get_height() + self.img.get_height()) - self.img.get_height()))
 
 class Clouds:
+    """Cloud field kept as parallel arrays so the whole layer moves and wraps in one step"""
+
     def __init__(self, cloud_images, count=16):
-        self.clouds = []
-        for i in range(count):
-            self.clouds.append(Cloud((random.random() * 99999, random.random() * 99999), random.choice(cloud_images), random.random() * 0.05 + 0.05, random.random() * 0.6 + 0.2))
+        rng = np.random.default_rng()
+        self.images = list(cloud_images)
+        image_index = rng.integers(0, len(self.images), count)
+        depth = rng.random(count) * 0.6 + 0.2
+
+        # Far clouds first so nearer ones are drawn over them
+        order = np.argsort(depth, kind='stable')
+        self.image_index = image_index[order]
+        self.depth = depth[order]
+        self.pos = rng.random((count, 2))[order] * 99999
+        self.speed = rng.random(count) * 0.05 + 0.05
+        self.image_size = np.array([self.images[i].get_size() for i in self.image_index.tolist()], dtype=float).reshape(-1, 2)
 
-        self.clouds.sort(key=lambda x: x.depth)
+    def __len__(self):
+        return len(self.image_index)
 
     def update(self):
-        for cloud in self.clouds:
-            cloud.update()
+        self.pos[:, 0] += self.speed
 
     def render(self, surf, offset=(0, 0)):
-        for cloud in self.clouds:
-            cloud.render(surf, offset=offset)
\ No newline at end of file
+        render_pos = self.pos - np.outer(self.depth, offset)
+        wrap = np.array(surf.get_size(), dtype=float) + self.image_size
+        render_pos = render_pos % wrap - self.image_size
+        images = self.images
+        surf.fblits(list(zip(map(images.__getitem__, self.image_index.tolist()), render_pos.tolist())))
@@ -0,0 +1,47 @@
+import pygame
+
+DRAW_MARGIN = 16  # Pixels past the screen edge that still count as visible
+
+
+class Culling:
+    """Camera-relative visibility and enemy sleep for one frame.
+
+    `view` is the visible world area plus a small margin; anything outside
+    it is not drawn. Enemies sleep while they are outside the wake area
+    (the view plus `wake_margin` on every side) and are not updated at all.
+    A sleeping enemy wakes on the first frame it is inside the wake area,
+    and an awake one only falls asleep again once it leaves the larger
+    sleep area, so enemies near the edge do not flicker between states.
+    Sleep depends only on positions, so a replayed camera path wakes the
+    same enemies on the same frames.
+    """
+
+    def __init__(self, draw_margin=DRAW_MARGIN, wake_margin=(320, 240), sleep_margin=(480, 360)):
+        self.draw_margin = draw_margin
+        self.wake_margin = wake_margin
+        self.sleep_margin = sleep_margin
+        self.view = pygame.Rect(0, 0, 0, 0)
+        self.wake_area = self.view
+        self.sleep_area = self.view
+
+    def set_camera(self, scroll, size):
+        camera = pygame.Rect(scroll, size)
+        self.view = camera.inflate(self.draw_margin * 2, self.draw_margin * 2)
+        self.wake_area = camera.inflate(self.wake_margin[0] * 2, self.wake_margin[1] * 2)
+        self.sleep_area = camera.inflate(self.sleep_margin[0] * 2, self.sleep_margin[1] * 2)
+
+    def visible(self, rect):
+        return self.view.colliderect(rect)
+
+    def near(self, rect):
+        """Inside the wake area: close enough for effects such as falling leaves to matter"""
+        return self.wake_area.colliderect(rect)
+
+    def awake(self, enemy):
+        """Whether enemy runs this frame; updates its sleep state"""
+        rect = enemy.rect()
+        if enemy.asleep:
+            enemy.asleep = not self.wake_area.colliderect(rect)
+        else:
+            enemy.asleep = not self.sleep_area.colliderect(rect)
+        return not enemy.asleep
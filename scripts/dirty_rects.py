@@ -0,0 +1,70 @@
+import pygame
+
+# Events after which the whole screen is presented: input can change any part
+# of a menu (selection, hover, slider), and the window may need repainting.
+REDRAW_EVENTS = {
+    pygame.KEYDOWN, pygame.KEYUP,
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+    pygame.VIDEOEXPOSE, pygame.VIDEORESIZE,
+    pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED, pygame.WINDOWFOCUSGAINED,
+}
+
+
+class DirtyRects:
+    """Tracks the screen regions changed this frame and presents only those.
+
+    Renderers report what they redrew with add(); anything that changes the
+    whole picture (a scrolling background, a new scene, input) calls
+    invalidate() instead, and the frame falls back to a full flip. Regions from
+    the previous frame are presented again so moving things don't leave trails.
+    """
+
+    def __init__(self, full_ratio=0.5):
+        self.full_ratio = full_ratio  # Flip instead once this much of the screen is dirty
+        self.rects = []
+        self.previous = []
+        self.full = True
+
+    def add(self, rect):
+        self.rects.append(pygame.Rect(rect))
+
+    def extend(self, rects):
+        for rect in rects:
+            self.add(rect)
+
+    def invalidate(self):
+        """Present the whole screen this frame"""
+        self.full = True
+
+    def note_event(self, event):
+        if event.type in REDRAW_EVENTS:
+            self.full = True
+
+    def merged(self):
+        """This frame's and last frame's regions with overlapping rects combined"""
+        merged = []
+        for rect in self.previous + self.rects:
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def present(self):
+        rects = self.merged()
+        screen = pygame.display.get_surface()
+        if not self.full:
+            screen_area = screen.get_width() * screen.get_height()
+            if sum(rect.width * rect.height for rect in rects) > screen_area * self.full_ratio:
+                self.full = True
+
+        if self.full:
+            pygame.display.flip()
+        elif rects:
+            screen_rect = screen.get_rect()
+            pygame.display.update([rect.clip(screen_rect) for rect in rects])
+
+        self.previous = self.rects
+        self.rects = []
+        self.full = False
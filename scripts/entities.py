@@ -2,18 +2,44 @@ import math
 import random
 import pygame
 
-from scripts.particle import Particle
-from scripts.spark import Spark
+
+# Collision sides as bit flags in PhysicsEntity.collision_flags
+UP = 1
+DOWN = 2
+RIGHT = 4
+LEFT = 8
+COLLISION_SIDES = {'up': UP, 'down': DOWN, 'right': RIGHT, 'left': LEFT}
+SUBSTEP = 12  # Longest move in pixels swept in one step; faster moves are split into equal sub-steps
+
+
+class CollisionFlags:
+    """Read-only dict-style view of an entity's collision bits, so collisions['down'] keeps working"""
+    __slots__ = ('entity',)
+
+    def __init__(self, entity):
+        self.entity = entity
+
+    def __getitem__(self, side):
+        return bool(self.entity.collision_flags & COLLISION_SIDES[side])
+
+    def __repr__(self):
+        return repr({side: self[side] for side in COLLISION_SIDES})
 
 
 class PhysicsEntity:
+    __slots__ = ('game', 'type', 'pos', 'size', 'velocity', 'collision_flags', 'collisions', 'hitbox',
+                 'action', 'animation', 'anim_offset', 'flip', 'last_movement')
+    sweep = True  # Swept collision; False uses the old test against the 3x3 tiles around the new position
+
     def __init__(self, game, e_type, pos, size):
         self.game = game
         self.type = e_type
         self.pos = list(pos)
         self.size = size
         self.velocity = [0, 0]
-        self.collisions = {'up': False, 'down': False, 'right': False, 'left': False}
+        self.collision_flags = 0
+        self.collisions = CollisionFlags(self)
+        self.hitbox = pygame.Rect(0, 0, size[0], size[1])
 
         self.action = ''
         self.anim_offset = (-3, -3)
@@ -23,17 +49,17 @@ class PhysicsEntity:
         self.last_movement = [0, 0]
 
     def rect(self):
-        return pygame.Rect(self.pos[0], self.pos[1], self.size[0], self.size[1])
-
-    def set_action(self, action):
-        if action != self.action:
-            self.action = action
-            self.animation = self.game.assets[self.type + '/' + self.action].copy()
-
-    def update(self, tilemap, movement=(0, 0)):
-        self.collisions = {'up': False, 'down': False, 'right': False, 'left': False}
-
-        frame_movement = (movement[0] + self.velocity[0], movement[1] + self.velocity[1])
+        """The entity's Rect, refreshed from pos. It is the same object on every call, so copy it to
+        keep a position across a move."""
+        hitbox = self.hitbox
+        hitbox.x = self.pos[0]
+        hitbox.y = self.pos[1]
+        return hitbox
+
+    def discrete_move(self, tilemap, frame_movement):
+        """Move, then push out of any of the 3x3 tiles around the new position. A move longer than
+        a tile plus the entity's size can pass through a wall."""
+        flags = 0
 
         self.pos[0] += frame_movement[0]
         entity_rect = self.rect()
@@ -41,10 +67,10 @@ class PhysicsEntity:
             if entity_rect.colliderect(rect):
                 if frame_movement[0] > 0:
                     entity_rect.right = rect.left
-                    self.collisions['right'] = True
+                    flags |= RIGHT
                 if frame_movement[0] < 0:
                     entity_rect.left = rect.right
-                    self.collisions['left'] = True
+                    flags |= LEFT
                 self.pos[0] = entity_rect.x
 
         self.pos[1] += frame_movement[1]
@@ -53,11 +79,76 @@ class PhysicsEntity:
             if entity_rect.colliderect(rect):
                 if frame_movement[1] > 0:
                     entity_rect.bottom = rect.top
-                    self.collisions['down'] = True
+                    flags |= DOWN
                 if frame_movement[1] < 0:
                     entity_rect.top = rect.bottom
-                    self.collisions['up'] = True
+                    flags |= UP
                 self.pos[1] = entity_rect.y
+        return flags
+
+    def sweep_move(self, tilemap, frame_movement):
+        """Move x then y, each axis swept against every tile on its path so nothing is skipped.
+        Moves longer than SUBSTEP are split so that x and y stay interleaved around corners."""
+        steps = max(1, math.ceil(max(abs(frame_movement[0]), abs(frame_movement[1])) / SUBSTEP))
+        step_x, step_y = frame_movement
+        if steps > 1:
+            step_x /= steps
+            step_y /= steps
+        flags = 0
+        for _ in range(steps):
+            flags |= self.sweep_axis(tilemap, 0, step_x, RIGHT, LEFT)
+            flags |= self.sweep_axis(tilemap, 1, step_y, DOWN, UP)
+        return flags
+
+    def sweep_axis(self, tilemap, axis, amount, positive_flag, negative_flag):
+        """Move along one axis and stop at the nearest solid tile in the way. Tiles overlapping the
+        end position are resolved as the discrete test would, so results match it at normal speeds.
+        Works on the integer hitbox edges (int() truncates like Rect) and walks tile columns or rows
+        in the direction of travel, so the first blocking one is the answer."""
+        size = self.size[axis]
+        start = int(self.pos[axis])
+        self.pos[axis] += amount
+        end = int(self.pos[axis])
+        tile_size = tilemap.tile_size
+        solid = tilemap.solid_cells
+        low = int(self.pos[1 - axis])
+        cross = range(low // tile_size, (low + self.size[1 - axis] - 1) // tile_size + 1)
+
+        first = min(start, end) // tile_size
+        last = (max(start, end) + size - 1) // tile_size
+        lines = range(first, last + 1) if amount >= 0 else range(last, first - 1, -1)
+        for line in lines:
+            edge = line * tile_size
+            overlaps_end = edge < end + size and edge + tile_size > end
+            crossed = (amount > 0 and edge >= start + size) or (amount < 0 and edge + tile_size <= start)
+            if not (overlaps_end or crossed):
+                continue
+            for other in cross:
+                if ((line, other) if axis == 0 else (other, line)) in solid:
+                    break
+            else:
+                continue
+            if amount > 0:
+                self.pos[axis] = edge - size
+                return positive_flag
+            if amount < 0:
+                self.pos[axis] = edge + tile_size
+                return negative_flag
+            self.pos[axis] = end
+            return 0
+        return 0
+
+    def set_action(self, action):
+        if action != self.action:
+            self.action = action
+            self.animation = self.game.assets[self.type + '/' + self.action].copy()
+
+    def update(self, tilemap, movement=(0, 0)):
+        frame_movement = (movement[0] + self.velocity[0], movement[1] + self.velocity[1])
+        if self.sweep:
+            self.collision_flags = self.sweep_move(tilemap, frame_movement)
+        else:
+            self.collision_flags = self.discrete_move(tilemap, frame_movement)
 
         if movement[0] > 0:
             self.flip = False
@@ -68,7 +159,7 @@ class PhysicsEntity:
 
         self.velocity[1] = min(5, self.velocity[1] + 0.1)
 
-        if self.collisions['down'] or self.collisions['up']:
+        if self.collision_flags & (DOWN | UP):
             self.velocity[1] = 0
 
         self.animation.update()
@@ -77,15 +168,54 @@ class PhysicsEntity:
         surf.blit(pygame.transform.flip(self.animation.img(), self.flip, False),(self.pos[0] - offset[0] + self.anim_offset[0], self.pos[1] - offset[1] + self.anim_offset[1]))
 
 class Enemy(PhysicsEntity):
+    __slots__ = ('walking', 'asleep', 'ai_slot', 'ai_elapsed', 'span', 'ready_to_shoot', 'sight')
+
     def __init__(self, game, pos, size):
         super().__init__(game, 'enemy', pos, size)
 
         self.walking = 0
-
-    def update(self, tilemap, movement=(0, 0)):
+        self.asleep = False  # Set by Culling while the enemy is far from the camera
+        self.ai_slot = None  # Stagger slot assigned by the AIScheduler
+        self.ai_elapsed = 0  # Frames since this enemy last thought
+        self.span = None  # (tilemap version, row, first x, last x) of the run of tiles being patrolled
+        self.ready_to_shoot = False  # A walk ended; aim at the next think
+        self.sight = None  # (tilemap version, muzzle cell, player cell, clear) of the last sight check
+
+    def ground_ahead(self, tilemap):
+        """Whether there is a tile just ahead of the enemy's feet (the old ledge probe), read from
+        the patrol span cached from Tilemap.walk_spans; the map is only consulted on a new span"""
+        tile_size = tilemap.tile_size
+        x = int((self.rect().centerx + (-7 if self.flip else 7)) // tile_size)
+        y = int((self.pos[1] + 23) // tile_size)
+        span = self.span
+        if span and span[0] == tilemap.version and span[1] == y and span[2] <= x <= span[3]:
+            return True
+        run = tilemap.walk_spans.get((x, y))
+        if run is None:
+            return False
+        self.span = (tilemap.version, y, run[0], run[1])
+        return True
+
+    def can_see(self, tilemap, muzzle, target):
+        """Whether no solid tile lies between the muzzle and the target. The answer is reused while
+        neither end leaves its tile cell and the map is unchanged, e.g. an enemy pacing its row
+        while the player stands still."""
+        tile_size = tilemap.tile_size
+        muzzle_cell = (int(muzzle[0] // tile_size), int(muzzle[1] // tile_size))
+        target_cell = (int(target[0] // tile_size), int(target[1] // tile_size))
+        sight = self.sight
+        if sight and sight[0] == tilemap.version and sight[1] == muzzle_cell and sight[2] == target_cell:
+            return sight[3]
+        clear = tilemap.line_of_sight(muzzle, target)
+        self.sight = (tilemap.version, muzzle_cell, target_cell, clear)
+        return clear
+
+    def update(self, tilemap, movement=(0, 0), think=1):
+        """Physics, animation and ledge turns run every frame. Decisions (walk roll, shooting) only
+        run when think is non-zero; it is the number of frames since the enemy last decided."""
         if self.walking:
-            if tilemap.solid_check((self.rect().centerx + (-7 if self.flip else 7), self.pos[1] + 23)):
-                if (self.collisions['right'] or self.collisions['left']):
+            if self.ground_ahead(tilemap):
+                if self.collision_flags & (RIGHT | LEFT):
                     self.flip = not self.flip
                 else:
                     movement = (movement[0] - 0.5 if self.flip else 0.5, movement[1])
@@ -93,21 +223,26 @@ class Enemy(PhysicsEntity):
                 self.flip = not self.flip
             self.walking = max(0, self.walking - 1)
             if not self.walking:
-                dis = (self.game.player.pos[0] - self.pos[0], self.game.player.pos[1] - self.pos[1])
-                if (abs(dis[1]) < 16):
-                    if (self.flip and dis[0] < 0):
-                        self.game.sfx['shoot'].play()
-                        self.game.projectiles.append([[self.rect().centerx - 7, self.rect().centery], -1.5 * 1.55, 0])
-                        for i in range(4):
-                            self.game.sparks.append(Spark(self.game.projectiles[-1][0], random.random() - 0.5 + math.pi, 2 + random.random()))
-                    if (not self.flip and dis[0] > 0):
-                        self.game.sfx['shoot'].play()
-                        self.game.projectiles.append([[self.rect().centerx + 7, self.rect().centery], 1.5 * 1.55, 0])
-                        for i in range(4):
-                            self.game.sparks.append(Spark(self.game.projectiles[-1][0], random.random() - 0.5, 2 + random.random()))
-        elif random.random() < 0.01:
+                self.ready_to_shoot = True
+        elif think and random.random() < 1 - 0.99 ** think:  # 1% per frame, whatever the think period
             self.walking = random.randint(30, 120)
 
+        if think and self.ready_to_shoot:
+            self.ready_to_shoot = False
+            dis = (self.game.player.pos[0] - self.pos[0], self.game.player.pos[1] - self.pos[1])
+            muzzle = (self.rect().centerx + (-7 if self.flip else 7), self.rect().centery)
+            if (abs(dis[1]) < 16) and self.can_see(tilemap, muzzle, self.game.player.rect().center):
+                if (self.flip and dis[0] < 0):
+                    self.game.sfx['shoot'].play()
+                    self.game.projectiles.fire(muzzle, (-1.5 * 1.55, 0))
+                    for i in range(4):
+                        self.game.world.add_spark(muzzle, random.random() - 0.5 + math.pi, 2 + random.random())
+                if (not self.flip and dis[0] > 0):
+                    self.game.sfx['shoot'].play()
+                    self.game.projectiles.fire(muzzle, (1.5 * 1.55, 0))
+                    for i in range(4):
+                        self.game.world.add_spark(muzzle, random.random() - 0.5, 2 + random.random())
+
         super().update(tilemap, movement=movement)
 
         if movement[0] != 0:
@@ -115,18 +250,17 @@ class Enemy(PhysicsEntity):
         else:
             self.set_action('idle')
 
-        if abs(self.game.player.dashing) >= 50:
-            if self.rect().colliderect(self.game.player.rect()):
-                self.game.screenshake = max(16, self.game.screenshake)
-                self.game.sfx['hit'].play()
-                for i in range(30):
-                    angle = random.random() * math.pi * 2
-                    speed = random.random() * 5
-                    self.game.sparks.append(Spark(self.rect().center, angle, 2 + random.random()))
-                    self.game.particles.append(Particle(self.game, 'particle', self.rect().center, velocity=[math.cos(angle + math.pi) * speed * 0.5, math.sin(angle + math.pi) * speed * 0.5], frame=random.randint(0, 7)))
-                self.game.sparks.append(Spark(self.rect().center, 0, 5 + random.random()))
-                self.game.sparks.append(Spark(self.rect().center, math.pi, 5 + random.random()))
-                return True
+    def die(self):
+        """Effects of being cut down by a dash; the Game finds the hit and removes the enemy"""
+        self.game.screenshake = max(16, self.game.screenshake)
+        self.game.sfx['hit'].play()
+        for i in range(30):
+            angle = random.random() * math.pi * 2
+            speed = random.random() * 5
+            self.game.world.add_spark(self.rect().center, angle, 2 + random.random())
+            self.game.world.add_particle('particle', self.rect().center, velocity=[math.cos(angle + math.pi) * speed * 0.5, math.sin(angle + math.pi) * speed * 0.5], frame=random.randint(0, 7))
+        self.game.world.add_spark(self.rect().center, 0, 5 + random.random())
+        self.game.world.add_spark(self.rect().center, math.pi, 5 + random.random())
 
     def render(self, surf, offset=(0, 0)):
         super().render(surf, offset=offset)
@@ -138,6 +272,8 @@ class Enemy(PhysicsEntity):
 
 
 class Player(PhysicsEntity):
+    __slots__ = ('air_time', 'jumps', 'wall_slide', 'dashing', 'is_jumping', 'speed_multiplier')
+
     def __init__(self, game, pos, size):
         super().__init__(game, 'player', pos, size)
         self.air_time = 0
@@ -151,7 +287,7 @@ class Player(PhysicsEntity):
         scaled_movement = (movement[0] * self.speed_multiplier, movement[1])
         super().update(tilemap, movement=scaled_movement)
 
-        if self.collisions['down']:
+        if self.collision_flags & DOWN:
             self.air_time = 0
             self.jumps = 1
             self.is_jumping = False
@@ -167,10 +303,10 @@ class Player(PhysicsEntity):
             self.game.dead += 1
 
         self.wall_slide = False
-        if (self.collisions['right'] or self.collisions['left']) and self.air_time > 4:
+        if self.collision_flags & (RIGHT | LEFT) and self.air_time > 4:
             self.wall_slide = True
             self.velocity[1] = min(self.velocity[1], 0.5)
-            if self.collisions['right']:
+            if self.collision_flags & RIGHT:
                 self.flip = False
             else:
                 self.flip = True
@@ -189,7 +325,7 @@ class Player(PhysicsEntity):
                 angle = random.random() * math.pi * 2
                 speed = random.random() * 0.5 + 0.5
                 pvelocity = [math.cos(angle) * speed, math.sin(angle) * speed]
-                self.game.particles.append(Particle(self.game, 'particle', self.rect().center, velocity=pvelocity, frame=random.randint(0, 7)))
+                self.game.world.add_particle('particle', self.rect().center, velocity=pvelocity, frame=random.randint(0, 7))
         if self.dashing > 0:
             self.dashing = max(0, self.dashing - 1)
         if self.dashing < 0:
@@ -199,7 +335,7 @@ class Player(PhysicsEntity):
             if abs(self.dashing) == 51:
                 self.velocity[0] *= 0.1
             pvelocity = [abs(self.dashing) / self.dashing * random.random() * 3, 0]
-            self.game.particles.append(Particle(self.game, 'particle', self.rect().center, velocity=pvelocity, frame=random.randint(0, 7)))
+            self.game.world.add_particle('particle', self.rect().center, velocity=pvelocity, frame=random.randint(0, 7))
 
         if self.velocity[0] > 0:
             self.velocity[0] = max(self.velocity[0] - 0.1, 0)
@@ -242,4 +378,5 @@ class Player(PhysicsEntity):
             if self.flip:
                 self.dashing = -60 * self.speed_multiplier
             else:
-                self.dashing = 60 * self.speed_multiplier
\ No newline at end of file
+                self.dashing = 60 * self.speed_multiplier
+            return True
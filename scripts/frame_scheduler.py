@@ -0,0 +1,85 @@
+import pygame
+
+# Events that count as the player interacting with a menu
+ACTIVITY_EVENTS = {
+    pygame.KEYDOWN, pygame.KEYUP,
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+    pygame.WINDOWFOCUSGAINED, pygame.WINDOWENTER, pygame.VIDEOEXPOSE,
+}
+
+
+class MenuScheduler:
+    """Frame pacing for the main loop.
+
+    Menus run at the full frame rate while the player is interacting with them.
+    Once nothing but the ambient animations (title glow, particles) has changed
+    for a while, the scheduler drops to a low frame rate and sleeps in
+    pygame.event.wait between frames, so an idle or unfocused menu no longer
+    keeps a core busy. Any input wakes it up immediately.
+    """
+
+    def __init__(self, clock, fps=60, idle_fps=20, background_fps=5, idle_after=2000):
+        self.clock = clock
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.background_fps = background_fps
+        self.idle_after = idle_after
+        self.frame_scale = 1.0
+        self.last_activity = 0  # Ticks of the last input
+        self.wake()
+
+    def wake(self):
+        """Return to the full frame rate"""
+        self.last_activity = pygame.time.get_ticks()
+
+    def events(self):
+        """Drop-in replacement for pygame.event.get() that tracks activity"""
+        events = pygame.event.get()
+        for event in events:
+            if event.type in ACTIVITY_EVENTS:
+                self.wake()
+                break
+        return events
+
+    def focused(self):
+        return pygame.display.get_active() and pygame.key.get_focused()
+
+    def is_idle(self):
+        if not self.focused():
+            return True
+        if any(pygame.mouse.get_pressed()):
+            return False  # Dragging a slider etc.
+        return pygame.time.get_ticks() - self.last_activity > self.idle_after
+
+    def target_fps(self):
+        if not self.is_idle():
+            return self.fps
+        return self.idle_fps if self.focused() else self.background_fps
+
+    def tick(self, allow_idle=True):
+        """End the frame: cap to the frame rate, sleeping on the event queue while idle.
+
+        Screens that must keep the full rate (gameplay) pass allow_idle=False.
+        Returns the animation step for the next frame relative to a full-rate
+        frame, so animations keep their speed at the reduced rate.
+        """
+        fps = self.target_fps() if allow_idle else self.fps
+        if fps == self.fps:
+            self.clock.tick(self.fps)
+        else:
+            # Sleep until input arrives or the next low-rate frame is due; the
+            # event is handed back in order for the menu's own input handling.
+            event = pygame.event.wait(1000 // fps)
+            if event.type != pygame.NOEVENT:
+                pending = [event] + pygame.event.get()
+                for pending_event in pending:
+                    pygame.event.post(pending_event)
+                if event.type in ACTIVITY_EVENTS:
+                    self.wake()
+            self.clock.tick()
+        if fps == self.fps:
+            self.frame_scale = 1.0
+        else:
+            elapsed_frames = self.clock.get_time() * self.fps / 1000
+            self.frame_scale = max(1.0, min(self.fps / fps, elapsed_frames))
+        return self.frame_scale
@@ -0,0 +1,86 @@
+from scripts.spatial_hash import dash_hits
+
+FADE_FRAMES = 4  # Frames after a death before the transition circle starts closing, two steps a frame
+RESPAWN_FRAMES = 20  # Frames from a death to the level reload
+
+
+def follow_camera(host, view_size):
+    """Ease the camera towards the player and point the culling at it; returns the integer scroll.
+    A host that streams chunks updates its streamer after this, from the new scroll."""
+    player_rect = host.player.rect()
+    host.scroll[0] += (player_rect.centerx - view_size[0] / 2 - host.scroll[0]) / 30
+    host.scroll[1] += (player_rect.centery - view_size[1] / 2 - host.scroll[1]) / 30
+    render_scroll = (int(host.scroll[0]), int(host.scroll[1]))
+    host.culling.set_camera(render_scroll, view_size)
+    return render_scroll
+
+
+def advance_death(host):
+    """One frame of the death sequence, for a host whose dead is set: dead counts the frames since
+    the death, and the transition closes in. Returns True once the level should be reloaded."""
+    host.dead += 1
+    if host.dead > FADE_FRAMES:
+        host.transition = min(30, host.transition + 2)
+    return host.dead > RESPAWN_FRAMES
+
+
+def step_entities(host, movement):
+    """One frame of enemies, the player and projectiles, shared by Game, LevelSim and the benchmark.
+
+    host is the Game or a stand-in with its gameplay state (tilemap, player,
+    enemies, projectiles as a world.Projectiles, dead, culling, ai, spatial,
+    profiler). Awake enemies update and go into the spatial hash, the dash
+    cuts down those it touches (before the player moves, as when each enemy
+    tested the dash itself), the player moves unless dead, projectiles fly
+    and are dropped by walls and age, and a projectile inside the player
+    kills it. What
+    happens on screen is left to the host's on_enemy_killed(enemy),
+    on_projectile_blocked(pos, velocity) and on_player_hit() hooks, called in
+    that order of events. Returns the enemies killed.
+    """
+    prof = host.profiler
+    tilemap = host.tilemap
+    player = host.player
+    spatial = host.spatial
+
+    with prof.scope('enemies'):
+        culling = host.culling
+        ai = host.ai
+        asleep = 0
+        ai.begin_frame()
+        spatial.clear()
+        for enemy in host.enemies:
+            if not culling.awake(enemy):
+                asleep += 1
+                continue
+            enemy.update(tilemap, (0, 0), think=ai.think_frames(enemy))
+            spatial.insert(enemy, enemy.rect(), 'enemy')
+        killed = dash_hits(spatial, player)
+        for enemy in killed:
+            host.enemies.remove(enemy)
+            host.on_enemy_killed(enemy)
+            prof.mark('kill')
+        prof.count('asleep', asleep)
+        ai.end_frame(prof)
+
+    with prof.scope('player'):
+        if not host.dead:
+            player.update(tilemap, movement)
+
+    with prof.scope('projectiles'):
+        projectiles = host.projectiles
+        if projectiles.count:
+            projectiles.motion()
+            blocked = projectiles.blocked(tilemap)
+            if blocked.any():
+                for pos, velocity in zip(projectiles.column('pos')[blocked].tolist(),
+                                         projectiles.column('velocity')[blocked].tolist()):
+                    host.on_projectile_blocked(pos, velocity)
+            projectiles.keep(~(blocked | projectiles.expired()))
+        if projectiles.count and abs(player.dashing) < 50:
+            hit = projectiles.inside(player.rect())
+            for _ in range(int(hit.sum())):
+                host.dead += 1
+                host.on_player_hit()
+            projectiles.keep(~hit)
+    return killed
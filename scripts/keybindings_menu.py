@@ -1,8 +1,9 @@
 import pygame
 import json
-import sys
 import math
 from scripts.utils import resource_path
+from scripts.scenes import Scene
+from scripts import ui_effects
 
 def render_text_with_outline(surface, font, text, color, position, outline_color=(0, 0, 0)):
     """Renders text with an outline."""
@@ -16,44 +17,61 @@ def render_text_with_outline(surface, font, text, color, position, outline_color
     # Render the main text on top
     surface.blit(text_surface, position)
 
-def keybindings_menu(screen, clock, assets, sfx, shared_background):
-    keybindings = {}
-    try:
-        with open('keybindings.json', 'r') as f:
-            keybindings = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        keybindings = {
-            'left': 'a',
-            'right': 'd',
-            'jump': 'space',
-            'dash': 'left shift'
-        }
-
-    font_path = resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf')
-    title_font = pygame.font.Font(resource_path('data/fonts/ninjaline/NinjaLine.ttf'), 40)
-    option_font = pygame.font.Font(font_path, 22)
-
-    actions = list(keybindings.keys())
-    menu_items = actions + ["Restore Defaults", "Back"]
-    selected_index = 0
-    
-    changing_key_for = None
-    title_glow = 0
+DEFAULT_KEYBINDINGS = {
+    'left': 'a',
+    'right': 'd',
+    'jump': 'space',
+    'dash': 'left shift'
+}
+
+
+class KeybindingsMenu(Scene):
+    def __init__(self, game):
+        super().__init__(game)
+        self.sfx = game.sfx
+        self.shared_background = game.shared_background
+
+        font_path = resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf')
+        self.title_font = pygame.font.Font(resource_path('data/fonts/ninjaline/NinjaLine.ttf'), 40)
+        self.option_font = pygame.font.Font(font_path, 22)
+
+        self.title_glow = 0
+        self.frame_scale = 1.0
+        self.regions = []
+
+    def enter(self):
+        try:
+            with open('keybindings.json', 'r') as f:
+                self.keybindings = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.keybindings = dict(DEFAULT_KEYBINDINGS)
 
-    while True:
+        actions = list(self.keybindings.keys())
+        self.menu_items = actions + ["Restore Defaults", "Back"]
+        self.selected_index = 0
+        self.changing_key_for = None
+
+    def save_keybindings(self):
+        with open('keybindings.json', 'w') as f:
+            json.dump(self.keybindings, f, indent=4)
+
+    def dirty_regions(self):
+        return self.regions
+
+    def update(self, dt):
+        self.frame_scale = dt
+        self.shared_background.update(dt)
+
+    def render(self, screen):
         screen.fill((0, 0, 0))
-        if shared_background:
-            shared_background.render_background(screen)
-            shared_background.render_particles(screen)
-            shared_background.update()
+        self.shared_background.render_background(screen)
+        self.shared_background.render_particles(screen)
         
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        screen.blit(ui_effects.dim_overlay(screen.get_size(), 180), (0, 0))
 
         # --- Find duplicates --- #
         key_counts = {}
-        for action, key in keybindings.items():
+        for action, key in self.keybindings.items():
             if key not in key_counts:
                 key_counts[key] = []
             key_counts[key].append(action)
@@ -61,17 +79,21 @@ def keybindings_menu(screen, clock, assets, sfx, shared_background):
         duplicate_keys = {key for key, bound_actions in key_counts.items() if len(bound_actions) > 1}
 
         # --- Render --- #
+        title_font = self.title_font
+        option_font = self.option_font
         title_pos = (screen.get_width() // 2 - title_font.render("Keybindings", True, (255, 255, 255)).get_width() // 2, 80)
         render_text_with_outline(screen, title_font, "Keybindings", (255, 255, 255), title_pos)
 
         y_pos = 180
-        for i, item in enumerate(menu_items):
-            is_selected = (i == selected_index)
+        for i, item in enumerate(self.menu_items):
+            is_selected = (i == self.selected_index)
             
             if is_selected:
-                title_glow += 0.1
-                blink_intensity = int(128 + 127 * math.sin(title_glow))
+                self.title_glow += 0.1 * self.frame_scale
+                blink_intensity = int(128 + 127 * math.sin(self.title_glow))
                 color = (blink_intensity, blink_intensity, blink_intensity)
+                # Only the selected row blinks (Back and Restore Defaults sit 20px lower)
+                self.regions = [pygame.Rect(0, y_pos - 2, screen.get_width(), option_font.get_height() + 24)]
             else:
                 color = (255, 255, 255)
 
@@ -81,13 +103,13 @@ def keybindings_menu(screen, clock, assets, sfx, shared_background):
                 render_text_with_outline(screen, option_font, item, color, pos)
             else:
                 action_display = item.replace('_', ' ').title()
-                key_display = keybindings[item].upper()
+                key_display = self.keybindings[item].upper()
 
-                if changing_key_for == item:
+                if self.changing_key_for == item:
                     key_display = "..."
 
                 key_color = color
-                if keybindings[item] in duplicate_keys:
+                if self.keybindings[item] in duplicate_keys:
                     key_color = (255, 50, 50) # Red for duplicates
 
                 action_width = option_font.render(action_display, True, color).get_width()
@@ -101,69 +123,56 @@ def keybindings_menu(screen, clock, assets, sfx, shared_background):
 
             y_pos += 45
 
-        # --- Handle Input --- #
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if changing_key_for:
-                    new_key = pygame.key.name(event.key)
-                    keybindings[changing_key_for] = new_key
-                    with open('keybindings.json', 'w') as f:
-                        json.dump(keybindings, f, indent=4)
-                    changing_key_for = None
+    def handle_event(self, event):
+        sfx = self.sfx
+        menu_items = self.menu_items
+        if event.type == pygame.KEYDOWN:
+            if self.changing_key_for:
+                new_key = pygame.key.name(event.key)
+                self.keybindings[self.changing_key_for] = new_key
+                self.save_keybindings()
+                self.changing_key_for = None
+                sfx['menu_click'].play()
+            else:
+                if event.key == pygame.K_DOWN or event.key == pygame.K_s:
+                    self.selected_index = (self.selected_index + 1) % len(menu_items)
                     sfx['menu_click'].play()
-                else:
-                    if event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                        selected_index = (selected_index + 1) % len(menu_items)
+                elif event.key == pygame.K_UP or event.key == pygame.K_w:
+                    self.selected_index = (self.selected_index - 1 + len(menu_items)) % len(menu_items)
+                    sfx['menu_click'].play()
+                elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+                    selected_item = menu_items[self.selected_index]
+                    if selected_item == "Back":
                         sfx['menu_click'].play()
-                    elif event.key == pygame.K_UP or event.key == pygame.K_w:
-                        selected_index = (selected_index - 1 + len(menu_items)) % len(menu_items)
+                        self.close("back")
+                    elif selected_item == "Restore Defaults":
+                        self.keybindings.clear()
+                        self.keybindings.update(DEFAULT_KEYBINDINGS)
+                        self.save_keybindings()
                         sfx['menu_click'].play()
-                    elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                        selected_item = menu_items[selected_index]
-                        if selected_item == "Back":
-                            sfx['menu_click'].play()
-                            return "back"
-                        elif selected_item == "Restore Defaults":
-                            defaults = {
-                                'left': 'a',
-                                'right': 'd',
-                                'jump': 'space',
-                                'dash': 'left shift'
-                            }
-                            keybindings.clear()
-                            keybindings.update(defaults)
-                            with open('keybindings.json', 'w') as f:
-                                json.dump(keybindings, f, indent=4)
-                            sfx['menu_click'].play()
-                        else:
-                            changing_key_for = selected_item
-                            sfx['menu_click'].play()
-                    elif event.key == pygame.K_ESCAPE:
-                        return "back"
-            
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                y_pos = 180
-                for i, item in enumerate(menu_items):
-                    text_height = option_font.get_height()
-                    if item == "Back":
-                        item_rect = pygame.Rect(screen.get_width() // 2 - 50, y_pos + 20, 100, text_height)
                     else:
-                        item_rect = pygame.Rect(screen.get_width() // 2 - 150, y_pos, 300, text_height)
-                    
-                    if item_rect.collidepoint(event.pos):
-                        selected_index = i
-                        selected_item = menu_items[selected_index]
-                        if selected_item == "Back":
-                            sfx['menu_click'].play()
-                            return "back"
-                        else:
-                            changing_key_for = selected_item
-                            sfx['menu_click'].play()
-                        break
-                    y_pos += 45
-
-        pygame.display.update()
-        clock.tick(60)
+                        self.changing_key_for = selected_item
+                        sfx['menu_click'].play()
+                elif event.key == pygame.K_ESCAPE:
+                    self.close("back")
+        
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            y_pos = 180
+            for i, item in enumerate(menu_items):
+                text_height = self.option_font.get_height()
+                if item == "Back":
+                    item_rect = pygame.Rect(self.screen.get_width() // 2 - 50, y_pos + 20, 100, text_height)
+                else:
+                    item_rect = pygame.Rect(self.screen.get_width() // 2 - 150, y_pos, 300, text_height)
+                
+                if item_rect.collidepoint(event.pos):
+                    self.selected_index = i
+                    selected_item = menu_items[self.selected_index]
+                    if selected_item == "Back":
+                        sfx['menu_click'].play()
+                        self.close("back")
+                    else:
+                        self.changing_key_for = selected_item
+                        sfx['menu_click'].play()
+                    break
+                y_pos += 45
@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+from scripts.utils import resource_path
+
+CATALOG_PATH = 'data/level_catalog.json'
+MAPS_DIR = 'data/maps'
+CATALOG_VERSION = 1
+
+
+def describe_map(map_id, path, file_name):
+    """Catalog entry for one map file: bounds, counts, player spawn and content hash"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return describe_map_data(map_id, json.loads(raw), file_name, hashlib.sha1(raw).hexdigest())
+
+
+def describe_map_data(map_id, map_data, file_name, digest):
+    tile_size = map_data['tile_size']
+
+    # Pixel-space boxes of every grid and offgrid tile
+    boxes = []
+    for tile in map_data['tilemap'].values():
+        x, y = tile['pos'][0] * tile_size, tile['pos'][1] * tile_size
+        boxes.append((x, y, x + tile_size, y + tile_size))
+    for tile in map_data['offgrid']:
+        boxes.append((tile['pos'][0], tile['pos'][1], tile['pos'][0] + tile_size, tile['pos'][1] + tile_size))
+    if boxes:
+        bounds = [min(b[0] for b in boxes), min(b[1] for b in boxes), max(b[2] for b in boxes), max(b[3] for b in boxes)]
+    else:
+        bounds = [0, 0, 0, 0]
+
+    # Spawners: grid ones are stored in tile units, offgrid ones in pixels (as in Tilemap.extract)
+    spawners = [(tile, tile_size) for tile in map_data['tilemap'].values() if tile['type'] == 'spawners']
+    spawners += [(tile, 1) for tile in map_data['offgrid'] if tile['type'] == 'spawners']
+    spawn = None
+    enemies = 0
+    for tile, scale in spawners:
+        if tile['variant'] == 0:
+            spawn = [tile['pos'][0] * scale, tile['pos'][1] * scale]
+        else:
+            enemies += 1
+
+    return {
+        'id': map_id,
+        'file': file_name,
+        'tile_size': tile_size,
+        'bounds': bounds,
+        'tiles': len(map_data['tilemap']),
+        'offgrid': len(map_data['offgrid']),
+        'enemies': enemies,
+        'spawn': spawn,
+        'hash': digest,
+    }
+
+
+def describe_chunked_map(map_id, chunk_dir, relative_dir):
+    """Catalog entry for a map stored as chunks (see scripts/chunk_streamer.py), read from its meta.json"""
+    with open(os.path.join(chunk_dir, 'meta.json'), 'r') as f:
+        meta = json.load(f)
+    entry = {'id': map_id, 'file': None, 'chunks': relative_dir}
+    for key in ('tile_size', 'bounds', 'tiles', 'offgrid', 'enemies', 'spawn', 'hash'):
+        entry[key] = meta[key]
+    return entry
+
+
+def build_catalog(maps_dir=MAPS_DIR):
+    """Scan maps_dir (relative to the game folder) for N.json maps and N.chunks folders, ordered by id"""
+    folder = resource_path(maps_dir)
+    names = os.listdir(folder)
+    map_ids = {int(name[:-5]) for name in names if name.endswith('.json') and name[:-5].isdigit()}
+    chunked_ids = {int(name[:-7]) for name in names if name.endswith('.chunks') and name[:-7].isdigit()}
+    levels = []
+    # Entries always name the file relative to the game folder; a chunked copy of a map wins
+    for map_id in sorted(map_ids | chunked_ids):
+        if map_id in chunked_ids:
+            levels.append(describe_chunked_map(map_id, os.path.join(folder, f'{map_id}.chunks'),
+                                               f'{maps_dir}/{map_id}.chunks'))
+        else:
+            levels.append(describe_map(map_id, os.path.join(folder, f'{map_id}.json'), f'{maps_dir}/{map_id}.json'))
+    return {'version': CATALOG_VERSION, 'levels': levels}
+
+
+def write_catalog(path=CATALOG_PATH, maps_dir=MAPS_DIR):
+    catalog = build_catalog(maps_dir)
+    with open(path, 'w') as f:
+        json.dump(catalog, f, indent=2)
+    return catalog
+
+
+class LevelCatalog:
+    """The generated list of levels (see tools/build_level_catalog.py), loaded once at startup"""
+
+    def __init__(self, levels):
+        self.levels = levels
+        self.by_id = {level['id']: level for level in levels}
+
+    @classmethod
+    def load(cls, path=CATALOG_PATH):
+        try:
+            with open(resource_path(path), 'r') as f:
+                catalog = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            # Source checkout without a built catalog: describe the maps now
+            print(f"Level catalog {path} missing or unreadable, scanning {MAPS_DIR}")
+            catalog = build_catalog()
+        return cls(catalog['levels'])
+
+    @classmethod
+    def scan(cls, maps_dir):
+        """Catalog of another folder of N.json maps, such as generated stress maps"""
+        return cls(build_catalog(maps_dir)['levels'])
+
+    def __len__(self):
+        return len(self.levels)
+
+    def __contains__(self, level_id):
+        return level_id in self.by_id
+
+    def get(self, level_id):
+        return self.by_id[level_id]
+
+    def ids(self):
+        return [level['id'] for level in self.levels]
+
+    @property
+    def last_id(self):
+        return self.levels[-1]['id']
+
+    def map_path(self, level_id):
+        return resource_path(self.by_id[level_id]['file'])
+
+    def chunk_path(self, level_id):
+        """Folder of a level that streams its chunks, or None for a single-file map"""
+        chunks = self.by_id[level_id].get('chunks')
+        return resource_path(chunks) if chunks else None
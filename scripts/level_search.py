@@ -0,0 +1,267 @@
+import heapq
+import time
+from collections import deque
+from scripts.level_catalog import LevelCatalog
+from scripts.vec_env import LevelSim, VecEnv
+from scripts.rollouts import LEFT, RIGHT, JUMP, DASH
+
+MACRO_FRAMES = 6  # Frames each search action is held for
+# (buttons, presses jump, presses dash) for every held direction with and without a jump or dash press
+MACROS = [(direction | JUMP * jump | DASH * dash, jump, dash)
+          for direction in (RIGHT, LEFT, 0) for jump in (0, 1) for dash in (0, 1)]
+SETTLE_FRAMES = 120  # Frames enemies fall from their spawner before the search starts
+# Search orders tried in turn until one finds a full run: (pixels per macro the distance estimate
+# assumes, weight of macros already played, priority of one enemy left, most of the level's node
+# budget it may use). The first is greedy and always pushes on from its latest kill, and finds its
+# runs early or not at all, so it is cut off at 15%; the second gives up sooner on a run that has
+# dropped somewhere awkward and gets what is left. Neither one completes every level on its own.
+PROFILES = ((3, 0, 10000, 0.15), (6, 1, 100, 1.0))
+
+
+def snapshot(sim):
+    player = sim.player
+    return (list(player.pos), list(player.velocity), player.air_time, player.jumps, player.wall_slide,
+            player.dashing, player.is_jumping, player.flip, player.last_movement, player.collision_flags,
+            player.action, sim.jump_held)
+
+
+def restore(sim, state):
+    player = sim.player
+    (pos, velocity, player.air_time, player.jumps, player.wall_slide, player.dashing, player.is_jumping,
+     player.flip, player.last_movement, player.collision_flags, player.action, sim.jump_held) = state
+    player.pos = list(pos)
+    player.velocity = list(velocity)
+    sim.dead = 0
+
+
+def state_key(state):
+    """Coarse cell of a state; the first state to reach a cell stands for all of them"""
+    pos, velocity, air_time, jumps, wall_slide, dashing, _, flip, _, _, _, jump_held = state
+    return (int(pos[0]) >> 2, int(pos[1]) >> 2, round(velocity[0]), round(velocity[1]),
+            int(dashing) // 10, jumps, wall_slide, flip, jump_held, air_time > 4, air_time > 90)
+
+
+def distance_field(tilemap, targets, cells_box):
+    """Steps through open tiles from each cell of cells_box (x0, y0, x1, y1) to the nearest target
+    rect, by a breadth-first flood from the targets; cells walled off from every target are absent"""
+    tile_size = tilemap.tile_size
+    solid = tilemap.solid_cells
+    x0, y0, x1, y1 = cells_box
+    distance = {}
+    queue = deque()
+    for target in targets:
+        cell = (target.centerx // tile_size, target.centery // tile_size)
+        if cell not in distance:
+            distance[cell] = 0
+            queue.append(cell)
+    while queue:
+        x, y = cell = queue.popleft()
+        step = distance[cell] + 1
+        for near in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if near not in distance and near not in solid and x0 <= near[0] <= x1 and y0 <= near[1] <= y1:
+                distance[near] = step
+                queue.append(near)
+    return distance
+
+
+def play(sim, bits, frames, targets, killed):
+    """Step the player frames with bits held; returns the kill mask afterwards (bit i for targets[i]),
+    or None if the player died. With no enemies or projectiles in the sim, this is LevelSim.step
+    without the passes that would find nothing. A target is hit as the next frame's enemy pass
+    would see it."""
+    player = sim.player
+    tilemap = sim.tilemap
+    movement = ((bits & RIGHT) >> 1) - (bits & LEFT)
+    jump = bool(bits & JUMP)
+    dash = bool(bits & DASH)
+    for _ in range(frames):
+        sim.press(jump, dash)
+        player.update(tilemap, (movement, 0))
+        if sim.dead:
+            return None
+        if abs(player.dashing) >= 50:
+            for index in player.rect().collidelistall(targets):
+                killed |= 1 << index
+    return killed
+
+
+class LevelSearch:
+    """Searches for one input sequence that dashes through every enemy of a level.
+
+    The player is simulated with the real Player physics in a LevelSim with
+    no enemies; each enemy is a target rect where it comes to rest under its
+    spawner, and it is treated as harmless and standing still (enemies only
+    patrol their own platform). The search is best-first over macro actions
+    (a held direction plus an optional jump or dash press, MACRO_FRAMES
+    long) on (state, enemies killed), ordered by enemies left, a flood-fill
+    distance over open tiles to the nearest of them and frames played,
+    weighted as in PROFILES. A run that drops somewhere it cannot get out
+    of is abandoned for an earlier branch, and states with no open path to
+    any enemy left are dropped (enemies with none from the spawn are not
+    searched for at all). States are memoized by a coarse key of
+    position, velocity and jump/dash state. The witness uses the rollout
+    input format (one byte per frame) and replays exactly in a LevelSim
+    with no enemies, which is what replay() checks. It is a path through
+    the layout only: against live enemies, which walk and shoot, it does
+    not clear the level.
+    max_nodes is shared by every search order, and seconds, when given,
+    bounds the whole search in time as well.
+    """
+
+    def __init__(self, catalog, level_id, max_nodes=64000, seconds=None):
+        tilemap, spawn, enemy_spawns = VecEnv.load(catalog, level_id)
+        self.level_id = level_id
+        self.max_nodes = max_nodes
+        self.seconds = seconds
+        x0, y0, x1, y1 = catalog.get(level_id)['bounds']
+        self.limits = (x0 - 64, x1 + 64, y1 + 64)
+        tile_size = tilemap.tile_size
+        self.cells_box = (int(x0 - 64) // tile_size, int(y0 - 64) // tile_size,
+                          int(x1 + 64) // tile_size, int(y1 + 64) // tile_size)
+
+        settle = LevelSim(tilemap, spawn, enemy_spawns)
+        for _ in range(SETTLE_FRAMES):
+            for enemy in settle.enemies:
+                enemy.update(tilemap, (0, 0), think=0)
+        self.sim = LevelSim(tilemap, spawn, [], max_frames=1 << 30)
+        # Enemies with no open path from the spawn at all are unreachable without a search
+        open_cells = distance_field(tilemap, [self.sim.player.rect()], self.cells_box)
+        self.targets = []
+        self.walled_off = []
+        for enemy in settle.enemies:
+            rect = enemy.rect().copy()
+            connected = (rect.centerx // tile_size, rect.centery // tile_size) in open_cells
+            (self.targets if connected else self.walled_off).append(rect)
+        self.fields = {}  # kill mask -> distance field to the enemies left
+
+    def distance(self, state, killed):
+        """Open tiles between a state and the nearest enemy left, or None when it is walled off"""
+        field = self.fields.get(killed)
+        if field is None:
+            left = [target for index, target in enumerate(self.targets) if not killed >> index & 1]
+            field = self.fields[killed] = distance_field(self.sim.tilemap, left, self.cells_box)
+        tile_size = self.sim.tilemap.tile_size
+        return field.get((int(state[0][0] + 4) // tile_size, int(state[0][1] + 7) // tile_size))
+
+    def out_of_bounds(self):
+        x, y = self.sim.player.pos
+        return x < self.limits[0] or x > self.limits[1] or y > self.limits[2]
+
+    def run(self, speed, cost_weight, kill_weight, max_nodes, deadline=None):
+        """{'level', 'enemies', 'reached', 'unreached' (rects), 'witness' (bytes), 'nodes', 'exhausted'}
+        for the run that killed the most enemies, searching in the order of one of PROFILES for at
+        most max_nodes nodes and until the perf_counter() deadline. reached == enemies means they
+        can all be reached; exhausted means every state was tried."""
+        sim = self.sim
+        tile_size = sim.tilemap.tile_size
+        nodes = 0
+        sim.reset()
+        targets = self.targets
+        everyone = (1 << len(targets)) - 1
+        start = snapshot(sim)
+        # Nodes are (state, kill mask, parent node, macro bits); the witness is rebuilt from the parents
+        best = root = (start, 0, None, 0)
+        queue = [(0, 0, 0, root)]
+        seen = {(state_key(start), 0)}
+        tie = 0
+        while queue and nodes < max_nodes and best[1] != everyone:
+            if deadline and nodes % 256 == 0 and time.perf_counter() > deadline:
+                break
+            _, cost, _, node = heapq.heappop(queue)
+            state, killed = node[0], node[1]
+            nodes += 1
+            for bits, jump, dash in MACROS:
+                if dash and state[5]:
+                    continue  # Already dashing; the press would do nothing
+                if jump and not (state[3] or state[4]):
+                    continue  # No jump left and not on a wall
+                restore(sim, state)
+                now_killed = play(sim, bits, MACRO_FRAMES, targets, killed)
+                if now_killed is None or self.out_of_bounds():
+                    continue
+                child = snapshot(sim)
+                key = (state_key(child), now_killed)
+                if key in seen:
+                    continue
+                seen.add(key)
+                child_node = (child, now_killed, node, bits)
+                if bin(now_killed).count('1') > bin(best[1]).count('1'):
+                    best = child_node
+                    if now_killed == everyone:
+                        break
+                steps = self.distance(child, now_killed)
+                if steps is None:
+                    continue
+                tie += 1
+                priority = ((len(targets) - bin(now_killed).count('1')) * kill_weight
+                            + steps * tile_size / speed + (cost + 1) * cost_weight)
+                heapq.heappush(queue, (priority, cost + 1, tie, child_node))
+
+        macros = []
+        node = best
+        while node[2] is not None:
+            macros.append(node[3])
+            node = node[2]
+        witness = b''.join(bytes([bits]) * MACRO_FRAMES for bits in reversed(macros))
+        return {
+            'level': self.level_id,
+            'enemies': len(targets),
+            'reached': bin(best[1]).count('1'),
+            'unreached': [tuple(target) for index, target in enumerate(targets) if not best[1] >> index & 1],
+            'witness': witness,
+            'nodes': nodes,
+            'exhausted': not queue,
+        }
+
+    def search(self):
+        """run() with each of PROFILES until one reaches every enemy, finds it cannot be done or
+        the budget runs out; the best result, with the nodes of every run counted, walled-off
+        enemies added to enemies and unreached, and their number as 'walled_off'"""
+        deadline = time.perf_counter() + self.seconds if self.seconds else None
+        best = None
+        nodes = 0
+        for speed, cost_weight, kill_weight, share in PROFILES:
+            budget = min(int(self.max_nodes * share), self.max_nodes - nodes)
+            result = self.run(speed, cost_weight, kill_weight, budget, deadline)
+            nodes += result['nodes']
+            if best is None or result['reached'] > best['reached']:
+                best = result
+            if result['reached'] == result['enemies'] or result['exhausted']:
+                break
+            if nodes >= self.max_nodes or (deadline and time.perf_counter() > deadline):
+                break
+        best['nodes'] = nodes
+        best['exhausted'] = result['exhausted']
+        best['walled_off'] = len(self.walled_off)
+        best['enemies'] += len(self.walled_off)
+        best['unreached'] += [tuple(rect) for rect in self.walled_off]
+        return best
+
+    def replay(self, witness):
+        """Enemies the witness dashes through when played from the start with LevelSim.step,
+        for checking a result"""
+        sim = self.sim
+        sim.reset()
+        killed = 0
+        for bits in witness:
+            sim.step(bits & LEFT, (bits & RIGHT) >> 1, bool(bits & JUMP), bool(bits & DASH))
+            if sim.dead:
+                return 0
+            if abs(sim.player.dashing) >= 50:
+                for index in sim.player.rect().collidelistall(self.targets):
+                    killed |= 1 << index
+        return bin(killed).count('1')
+
+
+def verify_level(job):
+    """Search one level in a worker process; job is (level_id, maps_dir, max_nodes, seconds). The witness
+    comes back as hex, checked by a replay, with the seconds the search took."""
+    level_id, maps_dir, max_nodes, seconds = job
+    start = time.perf_counter()
+    catalog = LevelCatalog.scan(maps_dir) if maps_dir else LevelCatalog.load()
+    search = LevelSearch(catalog, level_id, max_nodes, seconds)
+    result = search.search()
+    result['replayed'] = search.replay(result['witness'])
+    result['witness'] = result['witness'].hex()
+    result['seconds'] = time.perf_counter() - start
+    return result
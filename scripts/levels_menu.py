@@ -1,85 +1,108 @@
+import math
+import random
 import pygame
-import sys
 from scripts.utils import resource_path
+from scripts.scenes import Scene
 
-def levels_menu(screen, clock, current_level, max_level, sfx):
-    import math
-    import random
-    font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 28)
-    title_font = pygame.font.Font(resource_path('data/fonts/ninjaline/NinjaLine.ttf'), 48)
-    small_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 16)
-
-    levels_per_row = 4  # Changed to 4 for better layout
-    total_levels = 8  # Match actual game levels
-    selected_level = current_level
-    hovered_level = None
-    title_glow = 0
-    animation_time = 0
-
-    # Animation and styling data
-    level_data = {}
-    for i in range(total_levels):
-        level_data[i+1] = {
-            'animation_offset': random.uniform(0, 2 * math.pi),
-            'pulse_scale': 1.0,
-            'selected': False,
-            'unlocked': (i+1) <= max_level
-        }
-
-    while True:
-        animation_time += 0.05
-        screen.fill((0, 0, 0, 180))  # Semi-transparent background
-
-        # Draw the title with glow effect
-        title_glow += 0.1
-        glow_intensity = int(50 + 30 * math.sin(title_glow))
-        title_text = title_font.render("LEVEL SELECT", True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(screen.get_width() // 2, 40))
 
-        # Add title glow/shadow
-        for offset in [(-3, -3), (3, -3), (-3, 3), (3, 3), (-2, 0), (2, 0), (0, -2), (0, 2)]:
-            shadow_text = title_font.render("LEVEL SELECT", True, (0, 0, 0))
-            screen.blit(shadow_text, (title_rect.x + offset[0], title_rect.y + offset[1]))
-        screen.blit(title_text, title_rect)
+class LevelsMenu(Scene):
+    def __init__(self, game):
+        super().__init__(game)
+        self.sfx = game.sfx
+        self.font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 28)
+        title_font = pygame.font.Font(resource_path('data/fonts/ninjaline/NinjaLine.ttf'), 48)
+        small_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 16)
 
-        # Draw level buttons
-        for i in range(total_levels):
+        self.levels_per_row = 4  # Changed to 4 for better layout
+        self.total_levels = len(game.levels)
+        self.animation_time = 0
+
+        # The title and its shadow never change, so bake them into one surface
+        title_text = title_font.render("LEVEL SELECT", True, (255, 255, 255))
+        shadow_text = title_font.render("LEVEL SELECT", True, (0, 0, 0))
+        self.title_art = pygame.Surface((title_text.get_width() + 6, title_text.get_height() + 6), pygame.SRCALPHA)
+        for offset in [(-3, -3), (3, -3), (-3, 3), (3, 3), (-2, 0), (2, 0), (0, -2), (0, 2)]:
+            self.title_art.blit(shadow_text, (3 + offset[0], 3 + offset[1]))
+        self.title_art.blit(title_text, (3, 3))
+        self.title_rect = self.title_art.get_rect(center=(self.screen.get_width() // 2, 40))
+
+        self.lock_color = (150, 50, 50)  # Reddish for locked
+        self.lock_text = small_font.render("LOCKED", True, self.lock_color)
+        self.nav_text = small_font.render("Use WASD or ARROW KEYS or MOUSE to select, ENTER/SPACE to confirm", True, (200, 200, 200))
+        self.nav_rect = self.nav_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 30))
+
+    def enter(self):
+        self.current_level = self.game.level
+        self.max_level = self.game.max_level
+        self.selected_level = self.current_level
+        self.hovered_level = None
+
+        # Animation and styling data
+        self.level_data = {}
+        for i in range(self.total_levels):
+            self.level_data[i+1] = {
+                'animation_offset': random.uniform(0, 2 * math.pi),
+                'pulse_scale': 1.0,
+                'selected': False,
+                'unlocked': (i+1) <= self.max_level
+            }
+
+        # Button rest positions and hit rects (the current level's button is drawn larger)
+        self.level_positions = {}
+        self.level_rects = []
+        for i in range(self.total_levels):
             level_number = i + 1
-            row = i // levels_per_row
-            col = i % levels_per_row
+            row = i // self.levels_per_row
+            col = i % self.levels_per_row
+            x = self.screen.get_width() // 2 + (col - 1.5) * 70  # Horizontal spacing - centered for 4 columns
+            y = 110 + row * 100  # More vertical gap between rows
+            self.level_positions[level_number] = (x, y)
+            hitbox_radius = 36 if level_number == self.current_level else 30
+            self.level_rects.append((level_number, pygame.Rect(x - hitbox_radius, y - hitbox_radius, hitbox_radius * 2, hitbox_radius * 2)))
+
+        # Everything that floats and pulses: the scaled button, its shadow and the LOCKED tag below it
+        self.animated_regions = [pygame.Rect(x - 40, y - 43, 80, 100) for x, y in self.level_positions.values()]
+
+    def dirty_regions(self):
+        return self.animated_regions
+
+    def level_at(self, pos):
+        for level_number, rect in self.level_rects:
+            if rect.collidepoint(pos):
+                return level_number
+        return None
+
+    def update(self, dt):
+        self.animation_time += 0.05 * dt
+
+        # Hover detection once per frame; hovering immediately updates the selection
+        prev_hovered = self.hovered_level
+        self.hovered_level = self.level_at(pygame.mouse.get_pos())
+        if self.hovered_level is not None:
+            self.selected_level = self.hovered_level
+            # Play sound when hover changes (only once per hover)
+            if prev_hovered is None:
+                self.sfx['menu_click'].play()
 
-            base_x = screen.get_width() // 2 + (col - 1.5) * 70  # Horizontal spacing - centered for 4 columns
-            base_y = 110 + row * 100  # More vertical gap between rows
+    def render(self, surf):
+        surf.fill((0, 0, 0, 180))  # Semi-transparent background
 
+        # Draw the pre-baked title with its shadow
+        surf.blit(self.title_art, self.title_rect)
+
+        # Draw level buttons
+        for level_number in range(1, self.total_levels + 1):
             # Animation calculations
-            level_info = level_data[level_number]
-            x = base_x
-            y = base_y
+            level_info = self.level_data[level_number]
+            x, y = self.level_positions[level_number]
 
             # Idle floating animation
-            float_offset = 3 * math.sin(animation_time + level_info['animation_offset'])
+            float_offset = 3 * math.sin(self.animation_time + level_info['animation_offset'])
             y += float_offset
 
-            # Determine if level is being hovered or selected
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            level_rect = pygame.Rect(x - 30, y - 30, 60, 60)  # Larger hitbox
-            is_hovered = level_rect.collidepoint(mouse_x, mouse_y)
-
-            # Update selection state when hovering
-            prev_hovered = hovered_level
-            if is_hovered:
-                hovered_level = level_number
-                selected_level = level_number  # Immediate update on hover
-            elif hovered_level == level_number:
-                hovered_level = None
-
-            # Play sound when hover changes (only once per hover)
-            if prev_hovered != hovered_level and prev_hovered is None and hovered_level is not None:
-                sfx['menu_click'].play()
-
             # Determine visual state
-            is_active = (hovered_level == level_number) or (level_number == selected_level and not hovered_level)
-            is_current = level_number == current_level
+            is_active = (self.hovered_level == level_number) or (level_number == self.selected_level and not self.hovered_level)
+            is_current = level_number == self.current_level
 
             # Calculate scale and colors based on state
             base_color = (255, 255, 255) if level_info['unlocked'] else (100, 100, 100)
@@ -92,8 +115,8 @@ def levels_menu(screen, clock, current_level, max_level, sfx):
             elif is_active:
                 # Pulsing scale effect for active levels with crimson energy
                 pulse_rate = 0.2
-                scale = 1.0 + 0.15 * math.sin(animation_time * pulse_rate)
-                glow_intensity = int(200 + 55 * math.sin(animation_time * 3))
+                scale = 1.0 + 0.15 * math.sin(self.animation_time * pulse_rate)
+                glow_intensity = int(200 + 55 * math.sin(self.animation_time * 3))
                 color = (glow_intensity, 80, 80)  # Crimson glow
             else:
                 color = base_color
@@ -108,7 +131,7 @@ def levels_menu(screen, clock, current_level, max_level, sfx):
             button_radius = int(base_button_radius * scale)
 
             # Draw button shadow
-            pygame.draw.circle(screen, (0, 0, 0), (x + 2, y + 2), button_radius, 0)
+            pygame.draw.circle(surf, (0, 0, 0), (x + 2, y + 2), button_radius, 0)
 
             # Draw ninja-themed button background with crimson theme
             if level_info['unlocked']:
@@ -123,7 +146,7 @@ def levels_menu(screen, clock, current_level, max_level, sfx):
             if level_info['unlocked']:
                 # Base parchment color (blood-stained)
                 parchment_color = button_color if is_active else (140, 60, 60)
-                pygame.draw.circle(screen, parchment_color, (x, y), button_radius, 0)
+                pygame.draw.circle(surf, parchment_color, (x, y), button_radius, 0)
 
                 # Add subtle parchment texture pattern (scaled)
                 texture_color = (int(parchment_color[0] * 0.7), int(parchment_color[1] * 0.7), int(parchment_color[2] * 0.7))
@@ -132,97 +155,70 @@ def levels_menu(screen, clock, current_level, max_level, sfx):
                     angle_rad = math.radians(angle)
                     dot_x = int(x + texture_radius * math.cos(angle_rad))
                     dot_y = int(y + texture_radius * math.sin(angle_rad))
-                    pygame.draw.circle(screen, texture_color, (dot_x, dot_y), 1)
+                    pygame.draw.circle(surf, texture_color, (dot_x, dot_y), 1)
             else:
-                pygame.draw.circle(screen, button_color, (x, y), button_radius, 0)
+                pygame.draw.circle(surf, button_color, (x, y), button_radius, 0)
 
             # Draw ninja-themed button border with crimson energy
             if level_info['unlocked']:
                 if is_active:
                     # Crimson energy aura
-                    glow_intensity = int(220 + 35 * math.sin(animation_time * 6))
+                    glow_intensity = int(220 + 35 * math.sin(self.animation_time * 6))
                     border_color = (glow_intensity, 70, 70)
                 else:
                     border_color = (200, 100, 100)  # Blood red border
             else:
                 border_color = (120, 50, 50)  # Reddish for locked
 
-            pygame.draw.circle(screen, border_color, (x, y), button_radius, 3)
+            pygame.draw.circle(surf, border_color, (x, y), button_radius, 3)
 
             # Draw level number with scaling
-            level_text = font.render(str(level_number), True, color)
+            level_text = self.font.render(str(level_number), True, color)
             if scale != 1.0:
                 scale_factor = scale
                 scaled_text = pygame.transform.smoothscale(level_text,
                     (int(level_text.get_width() * scale_factor), int(level_text.get_height() * scale_factor)))
                 scaled_rect = scaled_text.get_rect(center=(x, y))
-                screen.blit(scaled_text, scaled_rect)
+                surf.blit(scaled_text, scaled_rect)
             else:
                 text_rect = level_text.get_rect(center=(x, y))
-                screen.blit(level_text, text_rect)
+                surf.blit(level_text, text_rect)
 
             # Remove special yellow indicator since current level now pops out
 
             if not level_info['unlocked']:
                 # Lock visual indicator for unlocked levels
-                lock_color = (150, 50, 50)  # Reddish for locked
-                pygame.draw.circle(screen, lock_color, (x, y), 25, 2)
-                lock_text = small_font.render("LOCKED", True, lock_color)
-                lock_rect = lock_text.get_rect(center=(x, y + 45))
-                screen.blit(lock_text, lock_rect)
+                pygame.draw.circle(surf, self.lock_color, (x, y), 25, 2)
+                lock_rect = self.lock_text.get_rect(center=(x, y + 45))
+                surf.blit(self.lock_text, lock_rect)
 
         # Draw navigation hints at bottom
-        nav_text = small_font.render("Use WASD or ARROW KEYS or MOUSE to select, ENTER/SPACE to confirm", True, (200, 200, 200))
-        nav_rect = nav_text.get_rect(center=(screen.get_width() // 2, screen.get_height() - 30))
-        screen.blit(nav_text, nav_rect)
-
-        pygame.display.flip()
-
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key in [pygame.K_LEFT, pygame.K_a] and selected_level > 1:
-                    selected_level -= 1
-                    sfx['menu_click'].play()
-                elif event.key in [pygame.K_RIGHT, pygame.K_d] and selected_level < total_levels:
-                    selected_level += 1
-                    sfx['menu_click'].play()
-                elif event.key in [pygame.K_UP, pygame.K_w] and selected_level > levels_per_row:
-                    selected_level -= levels_per_row
-                    sfx['menu_click'].play()
-                elif event.key in [pygame.K_DOWN, pygame.K_s] and selected_level <= total_levels - levels_per_row:
-                    selected_level += levels_per_row
-                    sfx['menu_click'].play()
-                elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
-                    if selected_level <= max_level:
-                        sfx['menu_click'].play()
-                        return selected_level  # Return the selected level if it's cleared
-                elif event.key == pygame.K_ESCAPE:
-                    return "back"  # Return to pause menu
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    mouse_x, mouse_y = event.pos
-                    for i in range(total_levels):
-                        level_number = i + 1
-                        if level_number <= max_level:
-                            row = i // levels_per_row
-                            col = i % levels_per_row
-                            x = screen.get_width() // 2 + (col - 1.5) * 70  # Match horizontal spacing - centered for 4 columns
-                            y = 110 + row * 100  # Match vertical spacing
-                            # Account for floating animation in hit detection
-                            adjusted_y = y + 3 * math.sin(animation_time + level_data[level_number]['animation_offset'])
-                            # Use scaled hitbox for current level
-                            is_current_level = level_number == current_level
-                            hitbox_scale = 1.3 if is_current_level else 1.0
-                            base_radius = 28
-                            hitbox_radius = int(base_radius * hitbox_scale)
-                            level_rect = pygame.Rect(x - hitbox_radius, adjusted_y - hitbox_radius, hitbox_radius * 2, hitbox_radius * 2)
-                            if level_rect.collidepoint(mouse_x, mouse_y):
-                                sfx['menu_click'].play()
-                                return level_number
-
-        clock.tick(60)
+        surf.blit(self.nav_text, self.nav_rect)
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key in [pygame.K_LEFT, pygame.K_a] and self.selected_level > 1:
+                self.selected_level -= 1
+                self.sfx['menu_click'].play()
+            elif event.key in [pygame.K_RIGHT, pygame.K_d] and self.selected_level < self.total_levels:
+                self.selected_level += 1
+                self.sfx['menu_click'].play()
+            elif event.key in [pygame.K_UP, pygame.K_w] and self.selected_level > self.levels_per_row:
+                self.selected_level -= self.levels_per_row
+                self.sfx['menu_click'].play()
+            elif event.key in [pygame.K_DOWN, pygame.K_s] and self.selected_level <= self.total_levels - self.levels_per_row:
+                self.selected_level += self.levels_per_row
+                self.sfx['menu_click'].play()
+            elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
+                if self.selected_level <= self.max_level:
+                    self.sfx['menu_click'].play()
+                    self.close(self.selected_level)  # Return the selected level if it's cleared
+            elif event.key == pygame.K_ESCAPE:
+                self.close("back")  # Return to pause menu
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left click
+                level_number = self.level_at(event.pos)
+                if level_number is not None and level_number <= self.max_level:
+                    self.sfx['menu_click'].play()
+                    self.close(level_number)
@@ -1,20 +1,17 @@
 import pygame
-import sys
 import math
 import random
-import json
-from scripts.shared_background import SharedBackground
 from scripts.utils import resource_path
+from scripts.scenes import Scene
 
 pygame.init()
 pygame.mixer.init()
 
-class MainMenu:
-    def __init__(self, screen, clock, assets, sfx, shared_background=None):
-        self.screen = screen
-        self.clock = clock
-        self.assets = assets
-        self.sfx = sfx
+class MainMenu(Scene):
+    def __init__(self, game):
+        super().__init__(game)
+        self.assets = game.assets
+        self.sfx = game.sfx
         
         # Fonts
         self.title_font = pygame.font.Font(resource_path('data/fonts/ninjaline/NinjaLine.ttf'), 48) # Keep NinjaLine for title
@@ -32,22 +29,24 @@ class MainMenu:
         # Animation variables
         self.title_glow = 0
         self.menu_animation = 0
+        self.frame_scale = 1.0
         
         # Shared background
-        self.shared_background = shared_background or SharedBackground(assets)
-        
+        self.shared_background = game.shared_background
+        self.regions = []
+
+    def enter(self):
         # Load game state for display
         self.load_game_state()
     
     def load_game_state(self):
         """Load game state to display current progress"""
-        try:
-            with open("saves/savefile.json", "r") as save_file:
-                state = json.load(save_file)
-                self.current_level = state.get("level", 1)
-                self.max_level = state.get("max_level", 1)
-                self.death_count = state.get("death_counter", 0)
-        except (json.JSONDecodeError, FileNotFoundError):
+        state = self.game.save_index.summary(self.game.get_save_path())
+        if state:
+            self.current_level = state['level']
+            self.max_level = state['max_level']
+            self.death_count = state['death_counter']
+        else:
             self.current_level = 1
             self.max_level = 1
             self.death_count = 0
@@ -56,7 +55,7 @@ class MainMenu:
     def render_title(self, display):
         """Render animated game title"""
         # Animate title glow
-        self.title_glow += 0.1
+        self.title_glow += 0.1 * self.frame_scale
         glow_intensity = int(50 + 30 * math.sin(self.title_glow))
         
         # Main title
@@ -72,10 +71,10 @@ class MainMenu:
             glow_rect = title_rect.copy()
             glow_rect.x += offset[0]
             glow_rect.y += offset[1]
-            display.blit(glow_text, glow_rect)
+            self.regions.append(display.blit(glow_text, glow_rect))
         
         # Draw main title
-        display.blit(title_text, title_rect)
+        self.regions.append(display.blit(title_text, title_rect))
         
         # Subtitle
         # subtitle_text = self.subtitle_font.render("The Ultimate Ninja Challenge", True, (0, 0, 0))
@@ -85,7 +84,7 @@ class MainMenu:
     def render_menu_items(self, display):
         """Render menu items with selection highlighting"""
         # Animate menu
-        self.menu_animation += 0.05
+        self.menu_animation += 0.05 * self.frame_scale
 
         start_y = 110
         item_height = self.item_height  # Use adjusted spacing for Protest_Revolution font
@@ -127,17 +126,17 @@ class MainMenu:
             text_rect = text.get_rect(center=(display.get_width() // 2, y_pos))
 
             # Draw main text directly
-            display.blit(text, text_rect)
+            self.regions.append(display.blit(text, text_rect))
     
     def render_game_info(self, display):
         """Render current game progress information - removed as requested"""
         # All game progress info removed - looking bad according to user feedback
         pass
     
-    def render(self, display, display_2):
+    def render(self, surf):
         """Main render method"""
-        # Clear displays
-        display.fill((0, 0, 0, 0))
+        display = display_2 = surf  # Menus draw straight onto the screen
+        self.regions = []
         display_2.fill((0, 0, 0))
         
         # Render background using shared background
@@ -154,82 +153,54 @@ class MainMenu:
         
         # Render game info
         self.render_game_info(display)
-        
-        # Composite displays
-        display_2.blit(display, (0, 0))
-    
-    def handle_input(self):
-        """Handle menu input and return selected action"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            
+    def handle_event(self, event):
+        """Handle menu input and act on the selected item"""
+        action = self.action_for_event(event)
+        if action == "exit":
+            self.game.confirm("Exit the game?", self.on_exit_confirmed)
+        elif action:
+            self.game.handle_menu_action(action)
+
+    def on_exit_confirmed(self, confirmed):
+        if confirmed:
+            self.game.quit()
+
+    def action_for_event(self, event):
+        """Translate an input event into a menu action"""
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_s or event.key == pygame.K_DOWN:
+                self.selected_item = (self.selected_item + 1) % len(self.menu_items)
+                self.sfx['menu_click'].play()
+            elif event.key == pygame.K_w or event.key == pygame.K_UP:
+                self.selected_item = (self.selected_item - 1) % len(self.menu_items)
+                self.sfx['menu_click'].play()
+            elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
+                self.sfx['menu_click'].play()
+                return self.menu_items[self.selected_item].lower().replace(" ", "_")
+            elif event.key == pygame.K_ESCAPE:
                 return "exit"
 
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_s or event.key == pygame.K_DOWN:
-                    self.selected_item = (self.selected_item + 1) % len(self.menu_items)
-                    self.sfx['menu_click'].play()
-                elif event.key == pygame.K_w or event.key == pygame.K_UP:
-                    self.selected_item = (self.selected_item - 1) % len(self.menu_items)
-                    self.sfx['menu_click'].play()
-                elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                    self.sfx['menu_click'].play()
-                    return self.menu_items[self.selected_item].lower().replace(" ", "_")
-                elif event.key == pygame.K_ESCAPE:
-                    return "exit"
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    mouse_x, mouse_y = event.pos
-                    start_y = 110
-                    item_height = self.item_height  # Match Protest_Revolution spacing
-                    for i, item in enumerate(self.menu_items):
-                        y_pos = start_y + i * item_height
-                        item_rect = pygame.Rect(self.screen.get_width() // 2 - 100, y_pos - 10, 200, 20)
-                        if item_rect.collidepoint(mouse_x, mouse_y):
-                            self.selected_item = i
-                            self.sfx['menu_click'].play()
-                            return self.menu_items[i].lower().replace(" ", "_")
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left click
+                mouse_x, mouse_y = event.pos
+                start_y = 110
+                item_height = self.item_height  # Match Protest_Revolution spacing
+                for i, item in enumerate(self.menu_items):
+                    y_pos = start_y + i * item_height
+                    item_rect = pygame.Rect(self.screen.get_width() // 2 - 100, y_pos - 10, 200, 20)
+                    if item_rect.collidepoint(mouse_x, mouse_y):
+                        self.selected_item = i
+                        self.sfx['menu_click'].play()
+                        return self.menu_items[i].lower().replace(" ", "_")
 
         return None
     
-    def run(self):
-        """Main menu loop"""
-        while True:
-            # Handle input
-            action = self.handle_input()
-            if action:
-                return action
-            
-            # Update animations
-            self.shared_background.update()
-            
-            # Render
-            self.render(self.screen, self.screen)  # Using screen directly for menu
-            
-            # Update display
-            pygame.display.flip()
-            self.clock.tick(60)
-
-def confirmation_dialog(screen, clock, message, assets=None, sfx=None, shared_background=None):
-    """
-    Generic confirmation dialog with Yes/No options.
-    Returns True for Yes, False for No
-    Use the optimized confirmation dialog - calls the main implementation from pause.py
-    """
-    # Import and use the optimized dialog from pause.py
-    import scripts.pause
-    return scripts.pause.confirmation_dialog(screen, clock, message, assets, sfx, shared_background)
-
-
-def main_menu(screen, clock, assets, sfx, shared_background=None):
-    """Entry point for main menu"""
-    menu = MainMenu(screen, clock, assets, sfx, shared_background)
-    while True:
-        action = menu.run()
-        if action == "exit":
-            confirmed = confirmation_dialog(screen, clock, "Exit the game?", assets, sfx, shared_background)
-            if confirmed:
-                return action
-            # If not confirmed, continue the menu loop
-        else:
-            return action
+    def dirty_regions(self):
+        """Glowing title and blinking menu items"""
+        return self.regions
+
+    def update(self, dt):
+        """Update animations"""
+        self.frame_scale = dt
+        self.shared_background.update(dt)
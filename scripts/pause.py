@@ -1,142 +1,132 @@
 import pygame
-import sys
 import math
-from scripts.about import about_screen
-from scripts.shared_background import SharedBackground
-from scripts.keybindings_menu import keybindings_menu
-from scripts.levels_menu import levels_menu
 from scripts.utils import resource_path
+from scripts.scenes import Scene
+from scripts import ui_effects
 
 pygame.init()
 pygame.mixer.init()
 
 
-def confirmation_dialog(screen, clock, message, assets=None, sfx=None, shared_background=None):
+class ConfirmationDialog(Scene):
     """
     Generic confirmation dialog with Yes/No options.
-    Returns True for Yes, False for No
+    Closes with True for Yes, False for No
     """
-    font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 24)
-    title_font = pygame.font.Font(resource_path('data/fonts/ninjaline/NinjaLine.ttf'), 32)
+
     dialog_width = 450
     dialog_height = 220
-    dialog_x = (screen.get_width() - dialog_width) // 2
-    dialog_y = (screen.get_height() - dialog_height) // 2
-
-    options = ["Yes", "No"]
-    selected_item = 1  # Start with No selected for safety
-    hovered_item = None
-    title_glow = 0
-
-    # Create shared background if not provided
-    if not shared_background and assets:
-        shared_background = SharedBackground(assets)
-
-    # Pre-calculate static effects to eliminate per-frame lag
-    # Create vignette surface once
-    vignette = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-    center_x, center_y = screen.get_width() // 2, screen.get_height() // 2
-    max_distance = math.sqrt(center_x**2 + center_y**2)
-
-    # Optimized vignette creation using circular gradients
-    for radius in range(0, int(max_distance), 2):
-        alpha = int(100 * (radius / max_distance))
-        if alpha > 255:
-            alpha = 255
-        pygame.draw.circle(vignette, (0, 0, 0, alpha), (center_x, center_y), radius, 2)
-
-    # Pre-calculate dialog background gradient
-    dialog_bg = pygame.Surface((dialog_width, dialog_height), pygame.SRCALPHA)
-    for i in range(dialog_height):
-        alpha = int(220 + 35 * math.sin(i * math.pi / dialog_height))
-        red_intensity = int(20 + 25 * math.sin(i * math.pi / dialog_height))
-        pygame.draw.line(dialog_bg, (red_intensity, 0, 0, alpha), (0, i), (dialog_width, i))
-
-    # Pre-calculate border glow
-    border_glow = pygame.Surface((dialog_width + 8, dialog_height + 8), pygame.SRCALPHA)
-    pygame.draw.rect(border_glow, (255, 50, 50, 100),
-                    (0, 0, dialog_width + 8, dialog_height + 8), 0, border_radius=12)
-
-    # Pre-calculate inner shadow
-    inner_shadow = pygame.Surface((dialog_width - 8, dialog_height - 8), pygame.SRCALPHA)
-    for i in range(dialog_height - 8):
-        alpha = max(0, int(35 * (1 - i / (dialog_height - 8))))
-        pygame.draw.line(inner_shadow, (0, 0, 0, alpha), (0, i), (dialog_width - 8, i))
-
-    while True:
-        title_glow += 0.1
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.sfx = game.sfx
+        self.shared_background = game.shared_background
+        self.font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 24)
+        self.title_font = pygame.font.Font(resource_path('data/fonts/ninjaline/NinjaLine.ttf'), 32)
+
+        self.options = ["Yes", "No"]
+        self.title_glow = 0
+        self.message = ""
+        self.message_surfaces = []
+
+        # The icon and option labels never change between visits
+        self.icon_text = self.title_font.render("!", True, (255, 100, 100))  # Red exclamation
+        self.option_text = {}
+        for option in self.options:
+            for color in [(255, 255, 255), (220, 220, 230)]:
+                self.option_text[option, color] = self.font.render(option, True, color)
+
+    def dialog_pos(self):
+        return ((self.screen.get_width() - self.dialog_width) // 2,
+                (self.screen.get_height() - self.dialog_height) // 2)
+
+    def set_message(self, message):
+        """Pre-render the message shown on the next visit"""
+        if message == self.message:
+            return
+        self.message = message
+        self.message_surfaces = []
+        dialog_x, dialog_y = self.dialog_pos()
+        y_offset = dialog_y + 70  # Shift down to avoid overlapping with "!"
+        for line in message.split('\n'):
+            msg_text = self.font.render(line, True, (240, 240, 250))
+            self.message_surfaces.append((msg_text, msg_text.get_rect(center=(self.screen.get_width() // 2, y_offset))))
+            y_offset += 32
+
+    def enter(self):
+        self.selected_item = 1  # Start with No selected for safety
+        self.hovered_item = None
+
+    def button_rect(self, i):
+        dialog_x, dialog_y = self.dialog_pos()
+        start_y = dialog_y + 160
+        item_spacing = 100
+        button_width = 80
+        button_height = 32
+        x_pos = dialog_x + self.dialog_width // 2 + (i - 0.5) * item_spacing
+        return pygame.Rect(x_pos - button_width // 2, start_y - button_height // 2, button_width, button_height)
+
+    def update(self, dt):
+        self.title_glow += 0.1 * dt
+        self.shared_background.update(dt)
+
+    def render(self, screen):
+        dialog_x, dialog_y = self.dialog_pos()
+        dialog_width, dialog_height = self.dialog_width, self.dialog_height
 
         # Clear screen
         screen.fill((0, 0, 0))
 
-        # Render parallax background if available
-        if shared_background:
-            shared_background.render_background(screen)
-            shared_background.render_particles(screen)
-            shared_background.update()
+        # Render parallax background
+        self.shared_background.render_background(screen)
+        self.shared_background.render_particles(screen)
 
-        # Create elegant semi-transparent overlay (simplified)
-        overlay = pygame.Surface(screen.get_size())
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(160)
-        screen.blit(overlay, (0, 0))
+        # Elegant semi-transparent overlay
+        screen.blit(ui_effects.dim_overlay(screen.get_size(), 160), (0, 0))
 
         # Blit pre-calculated vignette
-        screen.blit(vignette, (0, 0))
+        screen.blit(ui_effects.vignette(screen.get_size()), (0, 0))
 
         # Blit pre-calculated effects
-        screen.blit(border_glow, (dialog_x - 4, dialog_y - 4))
-        screen.blit(dialog_bg, (dialog_x, dialog_y))
-        screen.blit(inner_shadow, (dialog_x + 4, dialog_y + 4))
+        screen.blit(ui_effects.border_glow(dialog_width, dialog_height), (dialog_x - 4, dialog_y - 4))
+        screen.blit(ui_effects.dialog_gradient(dialog_width, dialog_height), (dialog_x, dialog_y))
+        screen.blit(ui_effects.inner_shadow(dialog_width - 8, dialog_height - 8), (dialog_x + 4, dialog_y + 4))
 
         # Draw red border with rounded corners
         border_color = (200, 50, 50)  # Dark red border
         pygame.draw.rect(screen, border_color, (dialog_x, dialog_y, dialog_width, dialog_height), 2, border_radius=8)
 
         # Draw centered warning/exclamation icon at top with red glow
-        icon_text = title_font.render("!", True, (255, 100, 100))  # Red exclamation
-        icon_rect = icon_text.get_rect(center=(dialog_x + dialog_width // 2, dialog_y + 15 + 12))
-        screen.blit(icon_text, icon_rect)
+        screen.blit(self.icon_text, self.icon_text.get_rect(center=(dialog_x + dialog_width // 2, dialog_y + 15 + 12)))
 
         # Draw message with better spacing
-        message_lines = message.split('\n')
-        y_offset = dialog_y + 70  # Shift down to avoid overlapping with "!"
-        for line in message_lines:
-            msg_text = font.render(line, True, (240, 240, 250))
-            msg_rect = msg_text.get_rect(center=(screen.get_width() // 2, y_offset))
+        for msg_text, msg_rect in self.message_surfaces:
             screen.blit(msg_text, msg_rect)
-            y_offset += 32
 
         # Draw elegant option buttons
-        start_y = dialog_y + 160
-        item_spacing = 100
-        button_width = 80
-        button_height = 32
-
-        for i, option in enumerate(options):
-            x_pos = dialog_x + dialog_width // 2 + (i - 0.5) * item_spacing
-
+        for i, option in enumerate(self.options):
             # Create button background
-            button_rect = pygame.Rect(x_pos - button_width // 2, start_y - button_height // 2, button_width, button_height)
+            button_rect = self.button_rect(i)
             is_hovered = button_rect.collidepoint(pygame.mouse.get_pos())
 
             # Track previous hover state for sound logic
-            prev_hovered = hovered_item
+            prev_hovered = self.hovered_item
 
             # Update hover state - if hovering this button, set it, otherwise clear if it was this button
             if is_hovered:
-                hovered_item = i
-            elif hovered_item == i:
-                hovered_item = None
+                self.hovered_item = i
+            elif self.hovered_item == i:
+                self.hovered_item = None
 
             # Play sound only once when entering a new hover state
-            if prev_hovered != hovered_item and hovered_item == i and prev_hovered is None:
-                if sfx:
-                    sfx['menu_click'].play()
+            if prev_hovered != self.hovered_item and self.hovered_item == i and prev_hovered is None:
+                self.sfx['menu_click'].play()
 
             # Update selection to hovered item immediately
-            if hovered_item is not None:
-                selected_item = hovered_item
+            if self.hovered_item is not None:
+                self.selected_item = self.hovered_item
+
+            selected_item, hovered_item = self.selected_item, self.hovered_item
 
             # Red/black button styling
             if i == selected_item or i == hovered_item:
@@ -169,539 +159,459 @@ def confirmation_dialog(screen, clock, message, assets=None, sfx=None, shared_ba
 
             # Draw option text
             text_color = (255, 255, 255) if i == selected_item or i == hovered_item else (220, 220, 230)
-            option_text = font.render(option, True, text_color)
-            option_rect = option_text.get_rect(center=(x_pos, start_y))
-            screen.blit(option_text, option_rect)
-
-        pygame.display.flip()
-
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False  # Treat quit as No
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                    selected_item = (selected_item - 1) % len(options)
-                    hovered_item = None  # Reset hover when using keyboard
-                    if sfx:
-                        sfx['menu_click'].play()
-                elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                    selected_item = (selected_item + 1) % len(options)
-                    hovered_item = None  # Reset hover when using keyboard
-                    if sfx:
-                        sfx['menu_click'].play()
-                elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                    if sfx:
-                        sfx['menu_click'].play()
-                    return selected_item == 0  # Yes = True, No = False
-                elif event.key == pygame.K_ESCAPE:
-                    return False  # ESC = No
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    mouse_x, mouse_y = event.pos
-                    for i, option in enumerate(options):
-                        x_pos = dialog_x + dialog_width // 2 + (i - 0.5) * item_spacing
-                        button_rect = pygame.Rect(x_pos - button_width // 2, start_y - button_height // 2, button_width, button_height)
-                        if button_rect.collidepoint(mouse_x, mouse_y):
-                            if sfx:
-                                sfx['menu_click'].play()
-                            return i == 0  # Yes = True, No = False
-
-        clock.tick(60)
-
-def options_menu(screen, clock, current_level, max_level, assets=None, sfx=None, shared_background=None):
-    font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 20)
-    title_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 40)
-    options_items = ["Key-bindings", "Volume", "Back"]
-    selected_item = 0
-    hovered_item = None
-    title_glow = 0
-
-    # Create shared background if not provided
-    if not shared_background and assets:
-        shared_background = SharedBackground(assets)
-
-    while True:
-        title_glow += 0.1
+            option_text = self.option_text[option, text_color]
+            screen.blit(option_text, option_text.get_rect(center=button_rect.center))
+
+    def dirty_regions(self):
+        return []  # Nothing animates; hover changes arrive with mouse input
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_LEFT or event.key == pygame.K_a:
+                self.selected_item = (self.selected_item - 1) % len(self.options)
+                self.hovered_item = None  # Reset hover when using keyboard
+                self.sfx['menu_click'].play()
+            elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
+                self.selected_item = (self.selected_item + 1) % len(self.options)
+                self.hovered_item = None  # Reset hover when using keyboard
+                self.sfx['menu_click'].play()
+            elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
+                self.sfx['menu_click'].play()
+                self.close(self.selected_item == 0)  # Yes = True, No = False
+            elif event.key == pygame.K_ESCAPE:
+                self.close(False)  # ESC = No
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left click
+                for i, option in enumerate(self.options):
+                    if self.button_rect(i).collidepoint(event.pos):
+                        self.sfx['menu_click'].play()
+                        self.close(i == 0)  # Yes = True, No = False
+                        break
+
+
+class OptionsMenu(Scene):
+    def __init__(self, game):
+        super().__init__(game)
+        self.sfx = game.sfx
+        self.shared_background = game.shared_background
+        self.font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 20)
+        title_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 40)
+        self.title_text = title_font.render("Options", True, (255, 255, 255))
+        self.options_items = ["Key-bindings", "Volume", "Back"]
+        self.start_y = 150
+        self.item_height = 40
+        self.title_glow = 0
+        self.regions = []
+
+    def enter(self):
+        self.selected_item = 0
+        self.hovered_item = None
+
+    def item_rect(self, i):
+        y_pos = self.start_y + i * self.item_height
+        return pygame.Rect(self.screen.get_width() // 2 - 100, y_pos - 10, 200, 20)
+
+    def update(self, dt):
+        self.title_glow += 0.1 * dt
+        self.shared_background.update(dt)
+
+    def render(self, screen):
         # Clear screen
         screen.fill((0, 0, 0))
 
-        # Render parallax background if available
-        if shared_background:
-            shared_background.render_background(screen)
-            shared_background.render_particles(screen)
-            shared_background.update()
+        # Render parallax background
+        self.shared_background.render_background(screen)
+        self.shared_background.render_particles(screen)
 
         # Semi-transparent overlay
-        overlay = pygame.Surface(screen.get_size())
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        screen.blit(overlay, (0, 0))
+        screen.blit(ui_effects.dim_overlay(screen.get_size(), 180), (0, 0))
 
         # Draw the title "Options"
-        title_text = title_font.render("Options", True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(screen.get_width() // 2, 50))
-        screen.blit(title_text, title_rect)
+        title_rect = self.title_text.get_rect(center=(screen.get_width() // 2, 50))
+        screen.blit(self.title_text, title_rect)
 
         # Draw options menu items
-        start_y = 150
-        item_height = 40
-        for i, item in enumerate(options_items):
-            y_pos = start_y + i * item_height
+        self.regions = []
+        for i, item in enumerate(self.options_items):
+            y_pos = self.start_y + i * self.item_height
 
             # Check for hover effect
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            item_rect = pygame.Rect(screen.get_width() // 2 - 100, y_pos - 10, 200, 20)
-            is_hovered = item_rect.collidepoint(mouse_x, mouse_y)
+            is_hovered = self.item_rect(i).collidepoint(pygame.mouse.get_pos())
 
             # Update hover state and play sound on hover change
-            prev_hovered = hovered_item
+            prev_hovered = self.hovered_item
             if is_hovered:
-                hovered_item = i
-            elif hovered_item == i:
-                hovered_item = None
+                self.hovered_item = i
+            elif self.hovered_item == i:
+                self.hovered_item = None
 
             # Play sound when hover changes (only once per hover)
-            if prev_hovered != hovered_item:
-                if (prev_hovered is None and hovered_item is not None) or (prev_hovered is not None and hovered_item is None):
-                    sfx['menu_click'].play()
+            if prev_hovered != self.hovered_item:
+                if (prev_hovered is None and self.hovered_item is not None) or (prev_hovered is not None and self.hovered_item is None):
+                    self.sfx['menu_click'].play()
 
             # Unified highlight system - hover takes priority
-            if i == hovered_item:
+            if i == self.hovered_item:
                 # Hover takes priority
-                blink_intensity = int(128 + 127 * math.sin(title_glow))
+                blink_intensity = int(128 + 127 * math.sin(self.title_glow))
                 color = (blink_intensity, blink_intensity, blink_intensity)
-                selected_item = i  # Update selection to hovered item
-            elif i == selected_item:
+                self.selected_item = i  # Update selection to hovered item
+            elif i == self.selected_item:
                 # Blink effect for keyboard selection
-                blink_intensity = int(128 + 127 * math.sin(title_glow))
+                blink_intensity = int(128 + 127 * math.sin(self.title_glow))
                 color = (blink_intensity, blink_intensity, blink_intensity)
             else:
                 color = (255, 255, 255)
 
             # Render text
-            text = font.render(item, True, color)
+            text = self.font.render(item, True, color)
             text_rect = text.get_rect(center=(screen.get_width() // 2, y_pos))
-            screen.blit(text, text_rect)
-
-        pygame.display.flip()
-
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_s or event.key == pygame.K_DOWN:
-                    selected_item = (selected_item + 1) % len(options_items)
-                    sfx['menu_click'].play()
-                elif event.key == pygame.K_w or event.key == pygame.K_UP:
-                    selected_item = (selected_item - 1) % len(options_items)
-                    sfx['menu_click'].play()
-                elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                    sfx['menu_click'].play()
-                    if selected_item == 0:  # Key-bindings
-                        keybindings_menu(screen, clock, assets, sfx, shared_background)
-                    elif selected_item == 1:  # Volume
-                        volume_result = volume_menu(screen, clock, sfx, shared_background)
-                        if volume_result != "back":
-                            return volume_result  # shouldn't happen, but handle
-                    elif selected_item == 2:  # Back
-                        return "back"
-                elif event.key == pygame.K_ESCAPE:  # Escape to go back
-                    return "back"
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    mouse_x, mouse_y = event.pos
-                    for i, item in enumerate(options_items):
-                        y_pos = start_y + i * item_height
-                        item_rect = pygame.Rect(screen.get_width() // 2 - 100, y_pos - 10, 200, 20)
-                        if item_rect.collidepoint(mouse_x, mouse_y):
-                            if i == 0:  # Key-bindings
-                                result = keybindings_menu(screen, clock, assets, sfx, shared_background)
-                                if result != "back":
-                                    return result  # handle if not back
-                            elif i == 1:  # Volume
-                                volume_result = volume_menu(screen, clock, sfx, shared_background)
-                                if volume_result != "back":
-                                    return volume_result
-                            elif i == 2:  # Back
-                                return "back"
-                            break
-
-        clock.tick(60)
-
-
-def volume_menu(screen, clock, sfx, shared_background=None):
+            if i == self.selected_item:
+                self.regions.append(screen.blit(text, text_rect))
+            else:
+                screen.blit(text, text_rect)
+
+    def dirty_regions(self):
+        return self.regions  # The blinking selection
+
+    def activate(self, i):
+        if i == 0:  # Key-bindings
+            self.push(self.game.keybindings_menu)
+        elif i == 1:  # Volume
+            self.push(self.game.volume_menu)
+        elif i == 2:  # Back
+            self.close("back")
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_s or event.key == pygame.K_DOWN:
+                self.selected_item = (self.selected_item + 1) % len(self.options_items)
+                self.sfx['menu_click'].play()
+            elif event.key == pygame.K_w or event.key == pygame.K_UP:
+                self.selected_item = (self.selected_item - 1) % len(self.options_items)
+                self.sfx['menu_click'].play()
+            elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
+                self.sfx['menu_click'].play()
+                self.activate(self.selected_item)
+            elif event.key == pygame.K_ESCAPE:  # Escape to go back
+                self.close("back")
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left click
+                for i, item in enumerate(self.options_items):
+                    if self.item_rect(i).collidepoint(event.pos):
+                        self.activate(i)
+                        break
+
+
+class VolumeMenu(Scene):
     """Volume control menu with sliders for music and effects"""
-    font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 20)
-    title_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 40)
-    small_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 16)
-
-    # Initialize base volumes if not already done
-    if not hasattr(volume_menu, 'base_sfx_volumes'):
-        volume_menu.base_sfx_volumes = {key: sound.get_volume() for key, sound in sfx.items() if hasattr(sound, 'get_volume')}
-    if not hasattr(volume_menu, 'base_music_volume'):
-        volume_menu.base_music_volume = pygame.mixer.music.get_volume()
-
-    # Set current slider positions based on current volumes
-    # This logic is a bit tricky because we can't perfectly reverse the scaling
-    # A simpler approach is to store the master volume levels themselves.
-    if not hasattr(volume_menu, 'master_music_vol'):
-        volume_menu.master_music_vol = 1.0
-    if not hasattr(volume_menu, 'master_effects_vol'):
-        volume_menu.master_effects_vol = 1.0
-
-    music_volume = volume_menu.master_music_vol
-    effects_volume = volume_menu.master_effects_vol
-
-    selected_slider = 0  # 0 for music, 1 for effects
-    title_glow = 0
-
-    slider_width = 200
-    slider_height = 20
-    slider_x = screen.get_width() // 2 - slider_width // 2
-
-    music_group_y = 120
-    effects_group_y = 220
-    group_height = 80
-
-    def apply_volumes():
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.sfx = game.sfx
+        self.shared_background = game.shared_background
+        self.font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 20)
+        title_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 40)
+        self.small_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 16)
+        self.title_text = title_font.render("Volume Settings", True, (255, 255, 255))
+        self.back_text = self.small_font.render("Press ESC to go back", True, (200, 200, 200))
+
+        # Base volumes are captured on the first visit; the sliders scale them.
+        # Storing the master volume levels themselves avoids reversing the scaling.
+        self.base_sfx_volumes = None
+        self.base_music_volume = None
+        self.music_volume = 1.0
+        self.effects_volume = 1.0
+
+        self.slider_width = 200
+        self.slider_height = 20
+        self.music_group_y = 120
+        self.effects_group_y = 220
+        self.group_height = 80
+        self.title_glow = 0
+
+    @property
+    def slider_x(self):
+        return self.screen.get_width() // 2 - self.slider_width // 2
+
+    def enter(self):
+        # Initialize base volumes if not already done
+        if self.base_sfx_volumes is None:
+            self.base_sfx_volumes = {key: sound.get_volume() for key, sound in self.sfx.items() if hasattr(sound, 'get_volume')}
+        if self.base_music_volume is None:
+            self.base_music_volume = pygame.mixer.music.get_volume()
+        self.selected_slider = 0  # 0 for music, 1 for effects
+
+    def apply_volumes(self):
         # Apply music volume
         if hasattr(pygame.mixer.music, 'set_volume'):
-            pygame.mixer.music.set_volume(volume_menu.base_music_volume * music_volume)
-        
+            pygame.mixer.music.set_volume(self.base_music_volume * self.music_volume)
+
         # Apply SFX volume
-        if sfx:
-            for key, sound in sfx.items():
-                if key in volume_menu.base_sfx_volumes:
-                    sound.set_volume(volume_menu.base_sfx_volumes[key] * effects_volume)
-        
-        # Store master volumes
-        volume_menu.master_music_vol = music_volume
-        volume_menu.master_effects_vol = effects_volume
-
-    while True:
-        title_glow += 0.1
+        for key, sound in self.sfx.items():
+            if key in self.base_sfx_volumes:
+                sound.set_volume(self.base_sfx_volumes[key] * self.effects_volume)
+
+    def group_rect(self, group_y):
+        return pygame.Rect(self.slider_x - 20, group_y, self.slider_width + 40, self.group_height)
+
+    def update(self, dt):
+        self.title_glow += 0.1 * dt
+        self.shared_background.update(dt)
+
+    def render(self, screen):
+        slider_x, slider_width, slider_height = self.slider_x, self.slider_width, self.slider_height
+        music_group_y, effects_group_y = self.music_group_y, self.effects_group_y
         screen.fill((0, 0, 0))
 
-        if shared_background:
-            shared_background.render_background(screen)
-            shared_background.render_particles(screen)
-            shared_background.update()
+        self.shared_background.render_background(screen)
+        self.shared_background.render_particles(screen)
 
-        overlay = pygame.Surface(screen.get_size())
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        screen.blit(overlay, (0, 0))
+        screen.blit(ui_effects.dim_overlay(screen.get_size(), 180), (0, 0))
 
-        title_text = title_font.render("Volume Settings", True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(screen.get_width() // 2, 50))
-        screen.blit(title_text, title_rect)
+        title_rect = self.title_text.get_rect(center=(screen.get_width() // 2, 50))
+        screen.blit(self.title_text, title_rect)
+
+        blink_intensity = int(128 + 127 * math.sin(self.title_glow))
 
         # Music Volume Group
-        music_group_rect = pygame.Rect(slider_x - 20, music_group_y, slider_width + 40, group_height)
-        if selected_slider == 0:
-            blink_intensity = int(128 + 127 * math.sin(title_glow))
+        music_group_rect = self.group_rect(music_group_y)
+        if self.selected_slider == 0:
             pygame.draw.rect(screen, (0, 0, 0), music_group_rect.inflate(4, 4))
             pygame.draw.rect(screen, (blink_intensity, blink_intensity, blink_intensity), music_group_rect, 2)
         else:
             pygame.draw.rect(screen, (0, 0, 0), music_group_rect.inflate(2, 2))
             pygame.draw.rect(screen, (255, 255, 255), music_group_rect, 1)
 
-        music_label_color = (blink_intensity, blink_intensity, blink_intensity) if selected_slider == 0 else (255, 255, 255)
-        music_text = font.render("Music Volume", True, music_label_color)
+        music_label_color = (blink_intensity, blink_intensity, blink_intensity) if self.selected_slider == 0 else (255, 255, 255)
+        music_text = self.font.render("Music Volume", True, music_label_color)
         music_rect = music_text.get_rect(center=(screen.get_width() // 2, music_group_y + 20))
         screen.blit(music_text, music_rect)
 
         music_slider_y = music_group_y + 40
         pygame.draw.rect(screen, (100, 100, 100), (slider_x, music_slider_y, slider_width, slider_height))
-        handle_x_music = slider_x + int(music_volume * (slider_width - 10))
+        handle_x_music = slider_x + int(self.music_volume * (slider_width - 10))
         pygame.draw.rect(screen, (255, 255, 255), (handle_x_music, music_slider_y - 2, 10, slider_height + 4))
-        music_percent = int(music_volume * 100)
-        percent_text_music = small_font.render(f"{music_percent}%", True, music_label_color)
+        music_percent = int(self.music_volume * 100)
+        percent_text_music = self.small_font.render(f"{music_percent}%", True, music_label_color)
         percent_rect_music = percent_text_music.get_rect(center=(screen.get_width() // 2, music_slider_y + 35))
         screen.blit(percent_text_music, percent_rect_music)
 
         # Effects Volume Group
-        effects_group_rect = pygame.Rect(slider_x - 20, effects_group_y, slider_width + 40, group_height)
-        if selected_slider == 1:
-            blink_intensity = int(128 + 127 * math.sin(title_glow))
+        effects_group_rect = self.group_rect(effects_group_y)
+        if self.selected_slider == 1:
             pygame.draw.rect(screen, (0, 0, 0), effects_group_rect.inflate(4, 4))
             pygame.draw.rect(screen, (blink_intensity, blink_intensity, blink_intensity), effects_group_rect, 2)
         else:
             pygame.draw.rect(screen, (0, 0, 0), effects_group_rect.inflate(2, 2))
             pygame.draw.rect(screen, (255, 255, 255), effects_group_rect, 1)
 
-        effects_label_color = (blink_intensity, blink_intensity, blink_intensity) if selected_slider == 1 else (255, 255, 255)
-        effects_text = font.render("Effects Volume", True, effects_label_color)
+        effects_label_color = (blink_intensity, blink_intensity, blink_intensity) if self.selected_slider == 1 else (255, 255, 255)
+        effects_text = self.font.render("Effects Volume", True, effects_label_color)
         effects_rect = effects_text.get_rect(center=(screen.get_width() // 2, effects_group_y + 20))
         screen.blit(effects_text, effects_rect)
 
         effects_slider_y = effects_group_y + 40
         pygame.draw.rect(screen, (100, 100, 100), (slider_x, effects_slider_y, slider_width, slider_height))
-        handle_x_effects = slider_x + int(effects_volume * (slider_width - 10))
+        handle_x_effects = slider_x + int(self.effects_volume * (slider_width - 10))
         pygame.draw.rect(screen, (255, 255, 255), (handle_x_effects, effects_slider_y - 2, 10, slider_height + 4))
-        effects_percent = int(effects_volume * 100)
-        percent_text_effects = small_font.render(f"{effects_percent}%", True, effects_label_color)
+        effects_percent = int(self.effects_volume * 100)
+        percent_text_effects = self.small_font.render(f"{effects_percent}%", True, effects_label_color)
         percent_rect_effects = percent_text_effects.get_rect(center=(screen.get_width() // 2, effects_slider_y + 35))
         screen.blit(percent_text_effects, percent_rect_effects)
 
-        back_text = small_font.render("Press ESC to go back", True, (200, 200, 200))
-        back_rect = back_text.get_rect(center=(screen.get_width() // 2, screen.get_height() - 30))
-        screen.blit(back_text, back_rect)
-
-        pygame.display.flip()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return "back"
-                if event.key == pygame.K_w or event.key == pygame.K_UP:
-                    selected_slider = (selected_slider - 1) % 2
-                    sfx['menu_click'].play()
-                if event.key == pygame.K_s or event.key == pygame.K_DOWN:
-                    selected_slider = (selected_slider + 1) % 2
-                    sfx['menu_click'].play()
-                if event.key == pygame.K_a or event.key == pygame.K_LEFT:
-                    if selected_slider == 0:
-                        music_volume = max(0, music_volume - 0.1)
-                    else:
-                        effects_volume = max(0, effects_volume - 0.1)
-                    apply_volumes()
-                if event.key == pygame.K_d or event.key == pygame.K_RIGHT:
-                    if selected_slider == 0:
-                        music_volume = min(1, music_volume + 0.1)
-                    else:
-                        effects_volume = min(1, effects_volume + 0.1)
-                    apply_volumes()
-
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:
-                    mouse_x, mouse_y = event.pos
-                    if music_group_rect.collidepoint(mouse_x, mouse_y):
-                        selected_slider = 0
-                        music_volume = max(0, min(1, (mouse_x - slider_x) / slider_width))
-                        if hasattr(pygame.mixer.music, 'set_volume'):
-                            pygame.mixer.music.set_volume(music_volume)
-                    elif effects_group_rect.collidepoint(mouse_x, mouse_y):
-                        selected_slider = 1
-                        effects_volume = max(0, min(1, (mouse_x - slider_x) / slider_width))
-                        if sfx:
-                            for sound in sfx.values():
-                                if hasattr(sound, 'set_volume'):
-                                    sound.set_volume(effects_volume)
-            elif event.type == pygame.MOUSEMOTION:
-                mouse_x, mouse_y = event.pos
-                if music_group_rect.collidepoint(mouse_x, mouse_y):
-                    selected_slider = 0
-                elif effects_group_rect.collidepoint(mouse_x, mouse_y):
-                    selected_slider = 1
-
-                if event.buttons[0]:
-                    if selected_slider == 0:
-                        music_volume = max(0, min(1, (mouse_x - slider_x) / slider_width))
-                        if hasattr(pygame.mixer.music, 'set_volume'):
-                            pygame.mixer.music.set_volume(music_volume)
-                    elif selected_slider == 1:
-                        effects_volume = max(0, min(1, (mouse_x - slider_x) / slider_width))
-                        if sfx:
-                            for sound in sfx.values():
-                                if hasattr(sound, 'set_volume'):
-                                    sound.set_volume(effects_volume)
-
-        clock.tick(60)
-
-
-
-
-
-def about_menu(screen, clock, sfx):
-    normal_font = pygame.font.Font(None, 20)
-    font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 20)
-    title_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 40)
-
-    while True:
-        screen.fill((0, 0, 0, 180))  # Semi-transparent background
-
-        # Draw the title "About"
-        title_text = title_font.render("About", True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(screen.get_width() // 2, 50))
-        screen.blit(title_text, title_rect)
+        back_rect = self.back_text.get_rect(center=(screen.get_width() // 2, screen.get_height() - 30))
+        screen.blit(self.back_text, back_rect)
 
-        # Display developer and studio information
-        developer_text = font.render("Developed by : Samarth Sharma", True, (255, 255, 255))
-        studio_text = font.render("Studio : 105", True, (255, 255, 255))
+    def dirty_regions(self):
+        # The selected group's outline, label and percentage blink
+        group_y = self.music_group_y if self.selected_slider == 0 else self.effects_group_y
+        return [self.group_rect(group_y).inflate(4, 4)]
 
-        developer_rect = developer_text.get_rect(center=(screen.get_width() // 2, 150))
-        studio_rect = studio_text.get_rect(center=(screen.get_width() // 2, 180))
-
-        screen.blit(developer_text, developer_rect)
-        screen.blit(studio_text, studio_rect)
-
-        pygame.display.flip()
-
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    sfx['menu_click'].play()                    # Pressing ESC will return to pause menu
-                    return "back"
-
-        clock.tick(60)
-
-
-def pause_menu(screen, clock, current_level, max_level, assets=None, sfx=None, shared_background=None):
-    font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 28) # Use Protest_Revolution for pause menu options
-    title_font = pygame.font.Font(resource_path('data/fonts/ninjaline/NinjaLine.ttf'), 48) # Use NinjaLine for title consistency
-    menu_items = ["Resume", "Main Menu", "Options", "Levels", "About", "Exit"]
-    selected_item = 0
-    hovered_item = None
-    prev_hovered_item = None  # Track previous hover for sound logic
-    title_glow = 0
+    def set_music_volume(self, volume):
+        self.music_volume = volume
+        if hasattr(pygame.mixer.music, 'set_volume'):
+            pygame.mixer.music.set_volume(volume)
+
+    def set_effects_volume(self, volume):
+        self.effects_volume = volume
+        for sound in self.sfx.values():
+            if hasattr(sound, 'set_volume'):
+                sound.set_volume(volume)
+
+    def handle_event(self, event):
+        slider_x, slider_width = self.slider_x, self.slider_width
+        music_group_rect = self.group_rect(self.music_group_y)
+        effects_group_rect = self.group_rect(self.effects_group_y)
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.close("back")
+                return
+            if event.key == pygame.K_w or event.key == pygame.K_UP:
+                self.selected_slider = (self.selected_slider - 1) % 2
+                self.sfx['menu_click'].play()
+            if event.key == pygame.K_s or event.key == pygame.K_DOWN:
+                self.selected_slider = (self.selected_slider + 1) % 2
+                self.sfx['menu_click'].play()
+            if event.key == pygame.K_a or event.key == pygame.K_LEFT:
+                if self.selected_slider == 0:
+                    self.music_volume = max(0, self.music_volume - 0.1)
+                else:
+                    self.effects_volume = max(0, self.effects_volume - 0.1)
+                self.apply_volumes()
+            if event.key == pygame.K_d or event.key == pygame.K_RIGHT:
+                if self.selected_slider == 0:
+                    self.music_volume = min(1, self.music_volume + 0.1)
+                else:
+                    self.effects_volume = min(1, self.effects_volume + 0.1)
+                self.apply_volumes()
 
-    while True:
-        title_glow += 0.1
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:
+                mouse_x, mouse_y = event.pos
+                if music_group_rect.collidepoint(mouse_x, mouse_y):
+                    self.selected_slider = 0
+                    self.set_music_volume(max(0, min(1, (mouse_x - slider_x) / slider_width)))
+                elif effects_group_rect.collidepoint(mouse_x, mouse_y):
+                    self.selected_slider = 1
+                    self.set_effects_volume(max(0, min(1, (mouse_x - slider_x) / slider_width)))
+        elif event.type == pygame.MOUSEMOTION:
+            mouse_x, mouse_y = event.pos
+            if music_group_rect.collidepoint(mouse_x, mouse_y):
+                self.selected_slider = 0
+            elif effects_group_rect.collidepoint(mouse_x, mouse_y):
+                self.selected_slider = 1
+
+            if event.buttons[0]:
+                if self.selected_slider == 0:
+                    self.set_music_volume(max(0, min(1, (mouse_x - slider_x) / slider_width)))
+                elif self.selected_slider == 1:
+                    self.set_effects_volume(max(0, min(1, (mouse_x - slider_x) / slider_width)))
+
+
+class PauseMenu(Scene):
+    def __init__(self, game):
+        super().__init__(game)
+        self.sfx = game.sfx
+        self.font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 28) # Use Protest_Revolution for pause menu options
+        title_font = pygame.font.Font(resource_path('data/fonts/ninjaline/NinjaLine.ttf'), 48) # Use NinjaLine for title consistency
+        self.title_text = title_font.render("TRY-HARD", True, (255, 255, 255))
+        self.menu_items = ["Resume", "Main Menu", "Options", "Levels", "About", "Exit"]
+        self.start_y = 150
+        self.item_height = 30
+        self.title_glow = 0
+        self.regions = []
+
+    def enter(self):
+        self.selected_item = 0
+        self.hovered_item = None
+        self.prev_hovered_item = None  # Track previous hover for sound logic
+
+    def item_rect(self, i):
+        y_pos = self.start_y + i * self.item_height
+        return pygame.Rect(self.screen.get_width() // 2 - 100, y_pos - 10, 200, 20)
+
+    def update(self, dt):
+        self.title_glow += 0.1 * dt
+
+    def render(self, screen):
         screen.fill((0, 0, 0, 180))  # Semi-transparent background
 
         # Draw the title "TRY-HARD"
-        title_color = (255, 255, 255)
-        title_text = title_font.render("TRY-HARD", True, title_color)
-        title_rect = title_text.get_rect(center=(screen.get_width() // 2, 50))
-        screen.blit(title_text, title_rect)
+        title_rect = self.title_text.get_rect(center=(screen.get_width() // 2, 50))
+        screen.blit(self.title_text, title_rect)
 
         # Draw menu options with hover and selection effects
-        start_y = 150
-        item_height = 30
-        for i, item in enumerate(menu_items):
-            y_pos = start_y + i * item_height
-            base_y_pos = y_pos
+        self.regions = []
+        for i, item in enumerate(self.menu_items):
+            y_pos = self.start_y + i * self.item_height
 
             # Check for hover effect
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            item_rect = pygame.Rect(screen.get_width() // 2 - 100, y_pos - 10, 200, 20)
-            is_hovered = item_rect.collidepoint(mouse_x, mouse_y)
+            is_hovered = self.item_rect(i).collidepoint(pygame.mouse.get_pos())
             if is_hovered:
-                hovered_item = i
-            elif hovered_item == i:
-                hovered_item = None
+                self.hovered_item = i
+            elif self.hovered_item == i:
+                self.hovered_item = None
 
             # Track hover changes for sound
-            if prev_hovered_item != hovered_item:
-                prev_hovered_item = hovered_item
+            if self.prev_hovered_item != self.hovered_item:
+                self.prev_hovered_item = self.hovered_item
                 # Play sound only when entering a new hover
-                if hovered_item is not None:
-                    sfx['menu_click'].play()
+                if self.hovered_item is not None:
+                    self.sfx['menu_click'].play()
 
             # Unified highlight system - hover takes priority
-            if i == hovered_item:
+            if i == self.hovered_item:
                 # Hover takes priority
-                blink_intensity = int(128 + 127 * math.sin(title_glow))
+                blink_intensity = int(128 + 127 * math.sin(self.title_glow))
                 color = (blink_intensity, blink_intensity, blink_intensity)
-                selected_item = i  # Update selection to hovered item
-            elif i == selected_item:
+                self.selected_item = i  # Update selection to hovered item
+            elif i == self.selected_item:
                 # Blink effect for keyboard selection
-                blink_intensity = int(128 + 127 * math.sin(title_glow))
+                blink_intensity = int(128 + 127 * math.sin(self.title_glow))
                 color = (blink_intensity, blink_intensity, blink_intensity)
             else:
                 color = (160, 160, 160)
 
             # Render text
-            text = font.render(item, True, color)
+            text = self.font.render(item, True, color)
             text_rect = text.get_rect(center=(screen.get_width() // 2, y_pos))
-            screen.blit(text, text_rect)
-
-        pygame.display.flip()
-
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                    selected_item = (selected_item + 1) % len(menu_items)
-                    sfx['menu_click'].play()
-                elif event.key == pygame.K_UP or event.key == pygame.K_w:
-                    selected_item = (selected_item - 1) % len(menu_items)
-                    sfx['menu_click'].play()
-                elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                    sfx['menu_click'].play()
-                    if selected_item == 0:  # Resume
-                        return current_level
-                    elif selected_item == 1:  # Main Menu
-                        confirmed = confirmation_dialog(screen, clock, "Return to Main Menu?\nUnsaved progress will be lost.", assets, sfx, shared_background)
-                        if confirmed:
-                            return "menu"
-                    elif selected_item == 2:  # Options
-                        result = options_menu(screen, clock, current_level, max_level, assets, sfx, shared_background)
-                        if result != "back":
-                            return result
-                    elif selected_item == 3:  # Levels
-                        result = levels_menu(screen, clock, current_level, max_level, sfx)
-                        if result != "back":
-                            return result
-                    elif selected_item == 4:  # About
-                        if assets and sfx and shared_background:
-                            result = about_screen(screen, clock, assets, sfx, shared_background)
-                            if result != "back":
-                                return result  # could be "exit"
-                        else:
-                            result = about_menu(screen, clock, sfx)
-                            if result != "back":
-                                return result
-                    elif selected_item == 5:  # Exit
-                        confirmed = confirmation_dialog(screen, clock, "Exit the game?\nUnsaved progress will be lost.", assets, sfx, shared_background)
-                        if confirmed:
-                            pygame.quit()
-                            sys.exit()
-                elif event.key == pygame.K_ESCAPE:  # Escape to resume game
-                    return current_level
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    mouse_x, mouse_y = event.pos
-                    for i, item in enumerate(menu_items):
-                        y_pos = start_y + i * item_height
-                        item_rect = pygame.Rect(screen.get_width() // 2 - 100, y_pos - 10, 200, 20)
-                        if item_rect.collidepoint(mouse_x, mouse_y):
-                            selected_item = i
-                            sfx['menu_click'].play()
-                            if selected_item == 0:  # Resume
-                                return current_level
-                            elif selected_item == 1:  # Main Menu
-                                confirmed = confirmation_dialog(screen, clock, "Return to Main Menu?\nUnsaved progress will be lost.", assets, sfx, shared_background)
-                                if confirmed:
-                                    return "menu"
-                            elif selected_item == 2:  # Options
-                                result = options_menu(screen, clock, current_level, max_level, assets, sfx, shared_background)
-                                if result != "back":
-                                    return result
-                            elif selected_item == 3:  # Levels
-                                result = levels_menu(screen, clock, current_level, max_level, sfx)
-                                if result != "back":
-                                    return result
-                            elif selected_item == 4:  # About
-                                if assets and sfx and shared_background:
-                                    result = about_screen(screen, clock, assets, sfx, shared_background)
-                                    if result != "back":
-                                        return result  # could be "exit"
-                                else:
-                                    result = about_menu(screen, clock, sfx)
-                                    if result != "back":
-                                        return result
-                            elif selected_item == 5:  # Exit
-                                confirmed = confirmation_dialog(screen, clock, "Exit the game?\nUnsaved progress will be lost.", assets, sfx, shared_background)
-                                if confirmed:
-                                    pygame.quit()
-                                    sys.exit()
-
-        clock.tick(60)
+            if i == self.selected_item:
+                self.regions.append(screen.blit(text, text_rect))
+            else:
+                screen.blit(text, text_rect)
+
+    def dirty_regions(self):
+        return self.regions
+
+    def activate(self, i):
+        if i == 0:  # Resume
+            self.close(self.game.level)
+        elif i == 1:  # Main Menu
+            self.game.confirm("Return to Main Menu?\nUnsaved progress will be lost.", self.on_main_menu_confirmed)
+        elif i == 2:  # Options
+            self.push(self.game.options_menu)
+        elif i == 3:  # Levels
+            self.push(self.game.levels_menu, self.on_level_chosen)
+        elif i == 4:  # About
+            self.push(self.game.about_screen)
+        elif i == 5:  # Exit
+            self.game.confirm("Exit the game?\nUnsaved progress will be lost.", self.on_exit_confirmed)
+
+    def on_main_menu_confirmed(self, confirmed):
+        if confirmed:
+            self.close("menu")
+
+    def on_level_chosen(self, result):
+        if result != "back":
+            self.close(result)
+
+    def on_exit_confirmed(self, confirmed):
+        if confirmed:
+            self.game.quit()
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_DOWN or event.key == pygame.K_s:
+                self.selected_item = (self.selected_item + 1) % len(self.menu_items)
+                self.sfx['menu_click'].play()
+            elif event.key == pygame.K_UP or event.key == pygame.K_w:
+                self.selected_item = (self.selected_item - 1) % len(self.menu_items)
+                self.sfx['menu_click'].play()
+            elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+                self.sfx['menu_click'].play()
+                self.activate(self.selected_item)
+            elif event.key == pygame.K_ESCAPE:  # Escape to resume game
+                self.close(self.game.level)
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left click
+                for i, item in enumerate(self.menu_items):
+                    if self.item_rect(i).collidepoint(event.pos):
+                        self.selected_item = i
+                        self.sfx['menu_click'].play()
+                        self.activate(i)
+                        break
@@ -0,0 +1,170 @@
+import time
+from collections import deque
+import pygame
+
+
+class NullScope:
+    """Stand-in returned while profiling is off; entering it does nothing"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SCOPE = NullScope()
+
+
+class Scope:
+    """Times one named phase and adds it to the profiler's current frame"""
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        frame = self.profiler.frame_times
+        frame[self.name] = frame.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+class FrameProfiler:
+    """Per-phase frame timings and counters with an in-game overlay.
+
+    Wrap a phase in `with profiler.scope('tilemap'):`. While the profiler is
+    disabled scope() hands back a shared no-op object and count() returns at
+    once, so the instrumentation can stay in the hot path. When enabled,
+    every scope keeps its last `window` frames and the overlay shows min, avg
+    and p99 in milliseconds next to the per-frame counters.
+
+    The profiler also collects while a recorder is attached (see
+    scripts/telemetry.py); mark() tags the current frame with an event.
+    """
+
+    def __init__(self, window=120, refresh=15):
+        self.enabled = False
+        self.visible = False  # Overlay shown; collection may also be on for a recorder
+        self.recorder = None
+        self.window = window
+        self.refresh = refresh  # Frames between overlay text rebuilds, so the numbers stay readable
+        self.scopes = {}
+        self.samples = {}
+        self.frame_times = {}
+        self.counts = {}
+        self.last_counts = {}
+        self.marks = []
+        self.frame_start = 0.0
+        self.frames = 0
+        self.font = None
+        self.overlay = None
+
+    def toggle(self):
+        self.visible = not self.visible
+        if not self.enabled:
+            self.reset()
+        self.enabled = self.visible or self.recorder is not None
+
+    def attach(self, recorder):
+        """Hand every finished frame to recorder.record(...) from now on"""
+        self.recorder = recorder
+        if not self.enabled:
+            self.reset()
+        self.enabled = True
+
+    def reset(self):
+        self.samples.clear()
+        self.frame_times = {}
+        self.counts = {}
+        self.last_counts = {}
+        self.marks = []
+        self.frames = 0
+        self.overlay = None
+        # Switched on mid-frame: time from here rather than from a stale start
+        self.frame_start = time.perf_counter()
+
+    def scope(self, name):
+        if not self.enabled:
+            return NULL_SCOPE
+        scope = self.scopes.get(name)
+        if scope is None:
+            scope = self.scopes[name] = Scope(self, name)
+        return scope
+
+    def count(self, name, amount=1):
+        if self.enabled:
+            self.counts[name] = self.counts.get(name, 0) + amount
+
+    def mark(self, tag):
+        if self.enabled:
+            self.marks.append(tag)
+
+    def begin_frame(self):
+        if self.enabled:
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self, scene=None, level=None):
+        if not self.enabled:
+            return
+        work = time.perf_counter() - self.frame_start
+        if self.recorder:
+            self.recorder.record(scene, level, work, self.frame_times, self.counts, self.marks)
+        self.marks = []
+        self.frame_times['frame'] = work
+        for name, seconds in self.frame_times.items():
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.window)
+            samples.append(seconds * 1000)
+        self.frame_times = {}
+        self.last_counts, self.counts = self.counts, {}
+        self.frames += 1
+
+    def stats(self, name):
+        """(min, avg, p99) in milliseconds over the rolling window"""
+        samples = sorted(self.samples[name])
+        return samples[0], sum(samples) / len(samples), samples[int(0.99 * (len(samples) - 1))]
+
+    def build_overlay(self):
+        if self.font is None:
+            self.font = pygame.font.Font(None, 18)
+        rows = [('scope', 'min', 'avg', 'p99')]
+        # Slowest phases first; the whole frame always leads
+        names = sorted(self.samples, key=lambda name: (name != 'frame', -self.stats(name)[1]))
+        for name in names:
+            rows.append((name,) + tuple(f"{value:.2f}" for value in self.stats(name)))
+
+        # The default font is proportional, so lay the table out in columns
+        columns = [110, 50, 50, 50]
+        line_height = self.font.get_linesize()
+        counts = '  '.join(f"{name} {value}" for name, value in sorted(self.last_counts.items()))
+        counts_text = self.font.render(counts, True, (255, 220, 120)) if counts else None
+        width = max(sum(columns), counts_text.get_width() if counts_text else 0) + 12
+        height = line_height * (len(rows) + (1 if counts_text else 0)) + 12
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        y = 6
+        for row in rows:
+            x = 6
+            for i, (cell, column_width) in enumerate(zip(row, columns)):
+                text = self.font.render(cell, True, (255, 255, 255))
+                # Names are left aligned, numbers right aligned
+                overlay.blit(text, (x, y) if i == 0 else (x + column_width - text.get_width(), y))
+                x += column_width
+            y += line_height
+        if counts_text:
+            overlay.blit(counts_text, (6, y))
+        self.overlay = overlay
+
+    def render(self, surf):
+        """Draw the overlay in the top-left corner; returns the covered rect"""
+        if not self.visible or not self.samples:
+            return None
+        if self.overlay is None or self.frames % self.refresh == 0:
+            self.build_overlay()
+        return surf.blit(self.overlay, (4, 4))
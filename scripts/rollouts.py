@@ -0,0 +1,141 @@
+import hashlib
+import multiprocessing
+import random
+from scripts.level_catalog import LevelCatalog
+from scripts.vec_env import LevelSim, VecEnv
+
+# One byte per frame of input
+LEFT = 1
+RIGHT = 2
+JUMP = 4
+DASH = 8
+
+
+def encode_inputs(frames):
+    """Bytes for an iterable of (left, right, jump, dash) per frame"""
+    return bytes(LEFT * bool(left) | RIGHT * bool(right) | JUMP * bool(jump) | DASH * bool(dash)
+                 for left, right, jump, dash in frames)
+
+
+def policy_inputs(seed, frames):
+    """A seeded random player: holds a direction for a while, jumps and dashes now and then"""
+    rng = random.Random(seed)
+    out = bytearray()
+    direction = RIGHT
+    hold = 0
+    for _ in range(frames):
+        if hold <= 0:
+            direction = rng.choice((LEFT, RIGHT, RIGHT, 0))
+            hold = rng.randint(20, 90)
+        hold -= 1
+        out.append(direction | JUMP * (rng.random() < 0.08) | DASH * (rng.random() < 0.02))
+    return bytes(out)
+
+
+# Per worker process: the catalog and one warm LevelSim per level, loaded on first use
+worker_catalog = None
+worker_sims = {}
+
+
+def init_worker(maps_dir):
+    global worker_catalog
+    worker_catalog = LevelCatalog.scan(maps_dir) if maps_dir else LevelCatalog.load()
+    worker_sims.clear()
+
+
+def level_sim(level_id):
+    sim = worker_sims.get(level_id)
+    if sim is None:
+        sim = worker_sims[level_id] = LevelSim(*VecEnv.load(worker_catalog, level_id), max_frames=1 << 30)
+    return sim
+
+
+def projectile_rows(projectiles):
+    """[[x, y], vx, age] per projectile, the layout they had as lists, so hashes stay comparable"""
+    return [[pos, velocity[0], age] for pos, velocity, age in zip(projectiles.column('pos').tolist(),
+                                                               projectiles.column('velocity').tolist(),
+                                                               projectiles.column('age').tolist())]
+
+
+def state_hash(sim, kills, deaths):
+    """Short digest of the final state, for spotting replays that a code change plays out differently"""
+    player = sim.player
+    state = (sim.frame, kills, deaths, player.pos, player.velocity, player.dashing, player.air_time,
+             [enemy.pos for enemy in sim.enemies], projectile_rows(sim.projectiles))
+    return hashlib.sha1(repr(state).encode()).hexdigest()[:16]
+
+
+def run_rollout(job):
+    """Play one input sequence; job is (index, level_id, seed, inputs, frames), where inputs of None
+    means policy_inputs(seed, frames).
+
+    Enemy decisions draw from the global random module, seeded from the job,
+    so a job's result does not depend on which worker runs it. A death
+    restarts the level and play continues with the next input, as after a
+    respawn; the rollout ends when the level is cleared or the inputs run out.
+    Returns (index, completed, frames, deaths, kills, hash).
+    """
+    index, level_id, seed, inputs, frames = job
+    if inputs is None:
+        inputs = policy_inputs(seed, frames)
+    random.seed(seed)
+    sim = level_sim(level_id)
+    sim.reset()
+    kills = deaths = played = 0
+    completed = False
+    for bits in inputs:
+        played += 1
+        killed, died, completed, _ = sim.step(bits & LEFT, (bits & RIGHT) >> 1, bool(bits & JUMP), bool(bits & DASH))
+        kills += killed
+        if completed:
+            break
+        if died:
+            deaths += 1
+            sim.reset()
+    return index, completed, played, deaths, kills, state_hash(sim, kills, deaths)
+
+
+class RolloutPool:
+    """Runs rollouts on a pool of worker processes that keep their levels loaded.
+
+    Jobs go out and results come back in chunks over the pool's pipes as
+    small tuples, so the traffic per rollout is a few dozen bytes plus its
+    input bytes (nothing at all for policy seeds). With workers=1 the
+    rollouts run in this process, which is handy for debugging.
+    """
+
+    def __init__(self, workers=None, maps_dir=None):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.maps_dir = maps_dir
+        self.pool = None
+        if self.workers > 1:
+            self.pool = multiprocessing.Pool(self.workers, initializer=init_worker, initargs=(maps_dir,))
+        else:
+            init_worker(maps_dir)
+
+    def close(self):
+        if self.pool:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def run(self, jobs, frames=1800, chunksize=None):
+        """Results for (level_id, seed, inputs) jobs, in job order, as dicts"""
+        tasks = [(index, level_id, seed, inputs, frames) for index, (level_id, seed, inputs) in enumerate(jobs)]
+        if self.pool:
+            chunksize = chunksize or max(1, len(tasks) // (self.workers * 8))
+            results = self.pool.imap_unordered(run_rollout, tasks, chunksize)
+        else:
+            results = map(run_rollout, tasks)
+        ordered = [None] * len(tasks)
+        for index, completed, played, deaths, kills, digest in results:
+            level_id, seed, _ = jobs[index]
+            ordered[index] = {'level': level_id, 'seed': seed, 'completed': completed, 'frames': played,
+                              'deaths': deaths, 'kills': kills, 'hash': digest}
+        return ordered
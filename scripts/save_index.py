@@ -0,0 +1,92 @@
+import json
+import os
+import threading
+import time
+from scripts.save_writer import write_json_atomic
+
+
+def read_summary(path):
+    """Summary of one save file on disk, or None if it is missing or corrupt"""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        mtime = os.stat(path).st_mtime_ns
+    except (OSError, json.JSONDecodeError):
+        return None
+    return {
+        'level': data.get("level", 1),
+        'max_level': data.get("max_level", 1),
+        'death_counter': data.get("death_counter", 0),
+        'last_played': mtime / 1e9,
+        'mtime': mtime,
+    }
+
+
+class SaveIndex:
+    """Cached summaries of the save files (level, max level, deaths, last played).
+
+    The index is loaded once per session from saves/index.json; each entry is
+    checked against its file's mtime and only files that changed behind our
+    back are parsed again. After that the save writer keeps it current, so the
+    menus read save summaries without touching the disk.
+    """
+
+    def __init__(self, index_path, paths):
+        self.index_path = index_path
+        self.paths = [os.path.abspath(path) for path in paths]
+        self.entries = {}
+        self.lock = threading.Lock()  # The writer thread reports finished writes
+
+    def load(self):
+        try:
+            with open(self.index_path, 'r') as f:
+                cached = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            cached = {}
+
+        for path in self.paths:
+            entry = cached.get(os.path.basename(path))
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                self.entries[path] = None  # Empty slot
+                continue
+            if entry is None or entry.get('mtime') != mtime:
+                entry = read_summary(path)
+            self.entries[path] = entry
+
+    def save(self):
+        with self.lock:
+            # Keyed by file name so the index survives the game folder moving
+            entries = {os.path.basename(path): entry for path, entry in self.entries.items() if entry}
+        try:
+            write_json_atomic(self.index_path, entries)
+        except OSError as e:
+            print(f"Error saving save index: {e}")
+
+    def summary(self, path):
+        """Cached summary for a save file, or None if the slot is empty"""
+        return self.entries.get(os.path.abspath(path))
+
+    def update(self, path, state):
+        """Record a state that has been queued for writing"""
+        with self.lock:
+            self.entries[os.path.abspath(path)] = {
+                'level': state.get("level", 1),
+                'max_level': state.get("max_level", 1),
+                'death_counter': state.get("death_counter", 0),
+                'last_played': time.time(),
+                'mtime': None,  # Not on disk yet
+            }
+
+    def written(self, path, state, mtime):
+        """A state reached the disk; remember its mtime unless a newer state is already queued"""
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry and (entry['level'], entry['max_level'], entry['death_counter']) == \
+                    (state.get("level", 1), state.get("max_level", 1), state.get("death_counter", 0)):
+                entry['mtime'] = mtime
+
+    def remove(self, path):
+        with self.lock:
+            self.entries[os.path.abspath(path)] = None
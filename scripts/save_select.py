@@ -1,22 +1,19 @@
 import pygame
-import sys
 import math
 import random
-import json
-import os
-from scripts.shared_background import SharedBackground
 from scripts.utils import resource_path
+from scripts.scenes import Scene
+from scripts import ui_effects
 
 pygame.init()
 pygame.mixer.init()
 
 
-class SaveSelect:
-    def __init__(self, screen, clock, assets, sfx, shared_background=None):
-        self.screen = screen
-        self.clock = clock
-        self.assets = assets
-        self.sfx = sfx
+class SaveSelect(Scene):
+    def __init__(self, game):
+        super().__init__(game)
+        self.assets = game.assets
+        self.sfx = game.sfx
 
         self.title_font = pygame.font.Font(resource_path('data/fonts/ninjaline/NinjaLine.ttf'), 32)  # Keep title as is
         self.save_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 16)
@@ -24,41 +21,43 @@ class SaveSelect:
         self.level_font = pygame.font.Font(resource_path('data/fonts/Protest_Revolution/ProtestRevolution-Regular.ttf'), 24)
 
         self.save_slots = []
-        self.selected_slot = 0
-        self.selected_button = 0  # 0 for slot, 1 for delete
-        self.confirming_delete = -1
-        self.confirm_selection = 0  # 0 for Yes, 1 for No
-        self.load_save_data()
 
         self.title_glow = 0
-        self.shared_background = shared_background or SharedBackground(assets)
+        self.frame_scale = 1.0
+        self.shared_background = game.shared_background
+        self.regions = []
 
         # Create a blurred background for the slots
-        self.slot_background = pygame.transform.smoothscale(assets['background_layers'][0], (140, 200))
+        self.slot_background = pygame.transform.smoothscale(self.assets['background_layers'][0], (140, 200))
         self.slot_background.set_alpha(100)
 
+    def enter(self):
+        self.selected_slot = 0
+        self.selected_button = 0  # 0 for slot, 1 for delete
+        self.confirming_delete = -1
+        self.confirm_selection = 0  # 0 for Yes, 1 for No
+        self.load_save_data()
+
         self.delete_button_rects = {}
         self.confirm_yes_rect = None
         self.confirm_no_rect = None
 
     def load_save_data(self):
+        # Summaries come from the save index; no file is opened here
         self.save_slots = []
         for i in range(4):
-            save_file = f"saves/savefile_{i+1}.json"
-            try:
-                if os.path.exists(save_file):
-                    with open(save_file, "r") as f:
-                        data = json.load(f)
-                        self.save_slots.append({
-                            'exists': True,
-                            'level': data.get("level", 1),
-                            'max_level': data.get("max_level", 1),
-                            'death_count': data.get("death_counter", 0),
-                            'file_path': save_file
-                        })
-                else:
-                    self.save_slots.append({'exists': False, 'file_path': save_file})
-            except (json.JSONDecodeError, FileNotFoundError):
+            save_file = self.game.get_save_path(f'savefile_{i+1}.json')
+            summary = self.game.save_index.summary(save_file)
+            if summary:
+                self.save_slots.append({
+                    'exists': True,
+                    'level': summary['level'],
+                    'max_level': summary['max_level'],
+                    'death_count': summary['death_counter'],
+                    'last_played': summary['last_played'],
+                    'file_path': save_file
+                })
+            else:
                 self.save_slots.append({'exists': False, 'file_path': save_file})
 
     def render_slot(self, display, i, slot, x, y, slot_width, slot_height):
@@ -70,9 +69,7 @@ class SaveSelect:
             pygame.draw.rect(display, (glow, glow, glow), selection_rect, 2, border_radius=5)
             # Shadow
             shadow_rect = pygame.Rect(x + 2, y + 2, slot_width, slot_height)
-            shadow_surface = pygame.Surface((slot_width, slot_height), pygame.SRCALPHA)
-            shadow_surface.fill((0, 0, 0, 50))
-            display.blit(shadow_surface, shadow_rect.topleft)
+            display.blit(ui_effects.tinted_panel((slot_width, slot_height), (0, 0, 0, 50)), shadow_rect.topleft)
 
         # Slot background
         slot_rect = pygame.Rect(x, y, slot_width, slot_height)
@@ -136,15 +133,15 @@ class SaveSelect:
                 display.blit(stroke_new_save, (new_save_rect.x + offset[0], new_save_rect.y + offset[1]))
             display.blit(new_save_text, new_save_rect)
 
-    def render(self, display, display_2):
-        display.fill((0, 0, 0, 0))
+    def render(self, surf):
+        display = display_2 = surf  # Menus draw straight onto the screen
         display_2.fill((0, 0, 0))
 
         self.shared_background.render_background(display_2)
         self.shared_background.render_particles(display)
 
         # Title
-        self.title_glow += 0.1
+        self.title_glow += 0.1 * self.frame_scale
         glow_intensity = int(50 + 30 * math.sin(self.title_glow))
         title_text = self.title_font.render("SELECT SAVE FILE", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(display.get_width() // 2, 40))
@@ -161,16 +158,19 @@ class SaveSelect:
         start_y = 120
 
         self.delete_button_rects = {}
+        self.regions = []
 
         for i, slot in enumerate(self.save_slots):
             x = start_x + i * (slot_width + slot_spacing)
             y = start_y
             self.render_slot(display, i, slot, x, y, slot_width, slot_height)
 
+            # The selected slot blinks (selection outline, label, delete button or Yes/No)
+            if i == self.selected_slot or i == self.confirming_delete:
+                self.regions.append(pygame.Rect(x - 3, y - 3, slot_width + 6, slot_height + 46))
+
             if self.confirming_delete == i:
-                overlay = pygame.Surface((slot_width, slot_height + 40), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 220))
-                display.blit(overlay, (x, y))
+                display.blit(ui_effects.tinted_panel((slot_width, slot_height + 40), (0, 0, 0, 220)), (x, y))
 
                 confirm_text = self.save_font.render("Delete?", True, (255, 255, 255))
                 display.blit(confirm_text, confirm_text.get_rect(center=(x + slot_width // 2, y + 40)))
@@ -199,116 +199,90 @@ class SaveSelect:
         display.blit(controls_surface,
                      controls_surface.get_rect(center=(display.get_width() // 2, display.get_height() - 20)))
 
-        display_2.blit(display, (0, 0))
-
-    def handle_input(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "exit"
-
-            if self.confirming_delete != -1:
-                if event.type == pygame.KEYDOWN:
-                    if event.key in [pygame.K_a, pygame.K_LEFT]:
-                        self.confirm_selection = (self.confirm_selection - 1 + 2) % 2
-                        self.sfx['menu_click'].play()
-                    elif event.key in [pygame.K_d, pygame.K_RIGHT]:
-                        self.confirm_selection = (self.confirm_selection + 1) % 2
-                        self.sfx['menu_click'].play()
-                    elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
-                        if self.confirm_selection == 0:  # Yes
-                            try:
-                                os.remove(self.save_slots[self.confirming_delete]['file_path'])
-                            except OSError:
-                                pass
-                            self.load_save_data()
-                            self.sfx['menu_click'].play()
-                        self.confirming_delete = -1
-                        self.confirm_selection = 0
-                    elif event.key == pygame.K_ESCAPE:
-                        self.confirming_delete = -1
-                        self.confirm_selection = 0
-
-                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    mouse_x, mouse_y = event.pos
-                    if self.confirm_yes_rect and self.confirm_yes_rect.collidepoint(mouse_x, mouse_y):
-                        try:
-                            os.remove(self.save_slots[self.confirming_delete]['file_path'])
-                        except OSError:
-                            pass
-                        self.load_save_data()
-                        self.sfx['menu_click'].play()
-                        self.confirming_delete = -1
-                        self.confirm_selection = 0
-                    elif self.confirm_no_rect and self.confirm_no_rect.collidepoint(mouse_x, mouse_y):
-                        self.confirming_delete = -1
-                        self.confirm_selection = 0
-                continue
-
+    def handle_event(self, event):
+        if self.confirming_delete != -1:
             if event.type == pygame.KEYDOWN:
                 if event.key in [pygame.K_a, pygame.K_LEFT]:
-                    self.selected_slot = (self.selected_slot - 1 + 4) % 4
-                    self.selected_button = 0
+                    self.confirm_selection = (self.confirm_selection - 1 + 2) % 2
                     self.sfx['menu_click'].play()
                 elif event.key in [pygame.K_d, pygame.K_RIGHT]:
-                    self.selected_slot = (self.selected_slot + 1) % 4
-                    self.selected_button = 0
+                    self.confirm_selection = (self.confirm_selection + 1) % 2
                     self.sfx['menu_click'].play()
-                elif event.key in [pygame.K_s, pygame.K_DOWN]:
-                    if self.save_slots[self.selected_slot]['exists']:
-                        self.selected_button = (self.selected_button + 1) % 2
-                        self.sfx['menu_click'].play()
-                elif event.key in [pygame.K_w, pygame.K_UP]:
-                    if self.save_slots[self.selected_slot]['exists']:
-                        self.selected_button = (self.selected_button - 1 + 2) % 2
-                        self.sfx['menu_click'].play()
                 elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
-                    if self.selected_button == 0:  # Slot selected
-                        self.sfx['menu_click'].play()
-                        return self.selected_slot
-                    elif self.selected_button == 1:  # Delete button selected
-                        self.confirming_delete = self.selected_slot
+                    if self.confirm_selection == 0:  # Yes
+                        self.game.save_writer.delete(self.save_slots[self.confirming_delete]['file_path'])
+                        self.load_save_data()
                         self.sfx['menu_click'].play()
+                    self.confirming_delete = -1
+                    self.confirm_selection = 0
                 elif event.key == pygame.K_ESCAPE:
-                    return "back"
+                    self.confirming_delete = -1
+                    self.confirm_selection = 0
+
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                mouse_x, mouse_y = event.pos
+                if self.confirm_yes_rect and self.confirm_yes_rect.collidepoint(mouse_x, mouse_y):
+                    self.game.save_writer.delete(self.save_slots[self.confirming_delete]['file_path'])
+                    self.load_save_data()
+                    self.sfx['menu_click'].play()
+                    self.confirming_delete = -1
+                    self.confirm_selection = 0
+                elif self.confirm_no_rect and self.confirm_no_rect.collidepoint(mouse_x, mouse_y):
+                    self.confirming_delete = -1
+                    self.confirm_selection = 0
+            return
+
+        if event.type == pygame.KEYDOWN:
+            if event.key in [pygame.K_a, pygame.K_LEFT]:
+                self.selected_slot = (self.selected_slot - 1 + 4) % 4
+                self.selected_button = 0
+                self.sfx['menu_click'].play()
+            elif event.key in [pygame.K_d, pygame.K_RIGHT]:
+                self.selected_slot = (self.selected_slot + 1) % 4
+                self.selected_button = 0
+                self.sfx['menu_click'].play()
+            elif event.key in [pygame.K_s, pygame.K_DOWN]:
+                if self.save_slots[self.selected_slot]['exists']:
+                    self.selected_button = (self.selected_button + 1) % 2
+                    self.sfx['menu_click'].play()
+            elif event.key in [pygame.K_w, pygame.K_UP]:
+                if self.save_slots[self.selected_slot]['exists']:
+                    self.selected_button = (self.selected_button - 1 + 2) % 2
+                    self.sfx['menu_click'].play()
+            elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
+                if self.selected_button == 0:  # Slot selected
+                    self.sfx['menu_click'].play()
+                    self.close(self.selected_slot)
+                elif self.selected_button == 1:  # Delete button selected
+                    self.confirming_delete = self.selected_slot
+                    self.sfx['menu_click'].play()
+            elif event.key == pygame.K_ESCAPE:
+                self.close("back")
 
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for i, rect in self.delete_button_rects.items():
-                    if rect.collidepoint(event.pos):
-                        self.confirming_delete = i
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            for i, rect in self.delete_button_rects.items():
+                if rect.collidepoint(event.pos):
+                    self.confirming_delete = i
+                    self.sfx['menu_click'].play()
+                    return
+
+            slot_width = 140
+            slot_height = 200
+            slot_spacing = 20
+            start_x = (self.screen.get_width() - (4 * slot_width + 3 * slot_spacing)) // 2
+            start_y = 120
+            for i in range(4):
+                slot_rect = pygame.Rect(start_x + i * (slot_width + slot_spacing), start_y, slot_width, slot_height)
+                if slot_rect.collidepoint(event.pos):
+                    if self.selected_slot == i:
+                        self.close(self.selected_slot)  # Double click to select
+                    else:
+                        self.selected_slot = i
                         self.sfx['menu_click'].play()
-                        return None
-
-                slot_width = 140
-                slot_height = 200
-                slot_spacing = 20
-                start_x = (self.screen.get_width() - (4 * slot_width + 3 * slot_spacing)) // 2
-                start_y = 120
-                for i in range(4):
-                    slot_rect = pygame.Rect(start_x + i * (slot_width + slot_spacing), start_y, slot_width, slot_height)
-                    if slot_rect.collidepoint(event.pos):
-                        if self.selected_slot == i:
-                            return self.selected_slot  # Double click to select
-                        else:
-                            self.selected_slot = i
-                            self.sfx['menu_click'].play()
-
-        return None
-
-    def run(self):
-        while True:
-            action = self.handle_input()
-            if action is not None:
-                return action
-
-            self.shared_background.update()
-
-            self.render(self.screen, self.screen)
-
-            pygame.display.flip()
-            self.clock.tick(60)
-
-
-def save_select(screen, clock, assets, sfx, shared_background=None):
-    """Entry point for save selection"""
-    save_screen = SaveSelect(screen, clock, assets, sfx, shared_background)
-    return save_screen.run()
+
+    def dirty_regions(self):
+        return self.regions
+
+    def update(self, dt):
+        self.frame_scale = dt
+        self.shared_background.update(dt)
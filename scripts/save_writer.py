@@ -0,0 +1,90 @@
+import json
+import os
+import threading
+import time
+
+
+def write_json_atomic(path, data):
+    """Write data to path through a temp file so a crash never leaves half a save behind"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class SaveWriter:
+    """Writes save files on a background thread.
+
+    save() only records the latest state for a path and returns immediately.
+    The writer thread waits `delay` seconds after the first change so bursts
+    (death, respawn, level load) collapse into one write per file. flush()
+    writes everything still pending on the calling thread; call it on exit or
+    before reading a save back from disk.
+    """
+
+    def __init__(self, delay=0.5, index=None):
+        self.delay = delay
+        self.index = index  # Optional SaveIndex kept in step with every save
+        self.pending = {}
+        self.lock = threading.Lock()  # Guards pending
+        self.write_lock = threading.Lock()  # Serializes disk writes so the newest state lands last
+        self.changed = threading.Event()
+        self.stopped = False
+        self.thread = threading.Thread(target=self.run, name='save-writer', daemon=True)
+        self.thread.start()
+
+    def save(self, path, state):
+        path = os.path.abspath(path)
+        with self.lock:
+            self.pending[path] = dict(state)
+        if self.index:
+            self.index.update(path, state)
+        self.changed.set()
+
+    def delete(self, path):
+        """Drop any pending write for path and remove the file"""
+        path = os.path.abspath(path)
+        with self.write_lock:
+            with self.lock:
+                self.pending.pop(path, None)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        if self.index:
+            self.index.remove(path)
+
+    def run(self):
+        while not self.stopped:
+            self.changed.wait()
+            if self.stopped:
+                break
+            # Debounce: let the rest of the burst arrive before touching the disk
+            time.sleep(self.delay)
+            self.changed.clear()
+            self.write_pending()
+
+    def write_pending(self):
+        with self.write_lock:
+            with self.lock:
+                pending, self.pending = self.pending, {}
+            for path, state in pending.items():
+                try:
+                    write_json_atomic(path, state)
+                    if self.index:
+                        self.index.written(path, state, os.stat(path).st_mtime_ns)
+                except Exception as e:
+                    print(f"Error saving game state: {e}")
+
+    def flush(self):
+        """Write everything pending now, on the calling thread"""
+        self.write_pending()
+
+    def close(self):
+        self.flush()
+        self.stopped = True
+        self.changed.set()
+        self.thread.join(timeout=1)
@@ -0,0 +1,87 @@
+class Scene:
+    """A screen driven by the main loop in Game.run (gameplay, menus, dialogs).
+
+    Scenes are created once and kept alive, so fonts and pre-rendered art
+    survive between visits. The main loop owns event polling, frame pacing and
+    presentation; a scene only reacts to events, advances its animations and
+    draws itself.
+    """
+
+    # Menus may drop to a low frame rate while nothing is happening
+    allow_idle = True
+
+    def __init__(self, game):
+        self.game = game
+        self.stack = None
+
+    @property
+    def screen(self):
+        return self.game.screen
+
+    def enter(self):
+        """Called when the scene is pushed (a fresh visit)"""
+
+    def resume(self):
+        """Called when the scene becomes the top again after a scene above it closed"""
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, dt):
+        """Advance animations; dt is measured in 60 FPS frames"""
+
+    def render(self, surf):
+        pass
+
+    def dirty_regions(self):
+        """Screen regions changed by the last render, or None to present the whole screen.
+
+        Only regions that animate on their own need reporting: the main loop
+        already presents the whole screen after input, when the scene changes
+        and when the shared background scrolls by a pixel.
+        """
+        return None
+
+    def push(self, scene, on_result=None):
+        self.stack.push(scene, on_result)
+
+    def close(self, result=None):
+        """Leave this scene, handing result to whoever pushed it"""
+        self.stack.pop(self, result)
+
+
+class SceneStack:
+    """Stack of active scenes; only the top one receives input and is drawn"""
+
+    def __init__(self):
+        self.scenes = []
+        self.callbacks = []
+
+    @property
+    def top(self):
+        return self.scenes[-1] if self.scenes else None
+
+    def push(self, scene, on_result=None):
+        scene.stack = self
+        self.scenes.append(scene)
+        self.callbacks.append(on_result)
+        scene.enter()
+
+    def pop(self, scene=None, result=None):
+        if not self.scenes or (scene is not None and self.scenes[-1] is not scene):
+            return  # Already closed (e.g. two close requests in the same frame)
+        self.scenes.pop()
+        callback = self.callbacks.pop()
+        if self.scenes:
+            self.scenes[-1].resume()
+        if callback:
+            callback(result)
+
+    def clear(self):
+        self.scenes = []
+        self.callbacks = []
+
+    def reset(self, scene):
+        """Drop every scene and start over from scene"""
+        self.clear()
+        self.push(scene)
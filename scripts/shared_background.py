@@ -1,50 +1,65 @@
 import pygame
-import random
+import numpy as np
+
+# Translucent motes are drawn from a handful of pre-rendered stamps
+MOTE_SIZES = (1, 2)
+MOTE_ALPHA_STEPS = 8
+
+
+def mote_stamps():
+    """White dots for every size and alpha step, indexed size_index * MOTE_ALPHA_STEPS + alpha_step"""
+    stamps = []
+    for size in MOTE_SIZES:
+        for step in range(MOTE_ALPHA_STEPS):
+            alpha = 30 + (100 - 30) * step // (MOTE_ALPHA_STEPS - 1)
+            stamp = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, (255, 255, 255, alpha), (size, size), size)
+            stamps.append(stamp)
+    return stamps
+
 
 class SharedBackground:
-    def __init__(self, assets):
+    def __init__(self, assets, dirty=None, particle_count=15, field_size=(320, 240)):
         self.assets = assets
+        self.dirty = dirty  # Optional DirtyRects tracker that drawn regions are reported to
+        self.layer_offsets = None
+        self.scaled_layers = {}
         self.background_scroll = 0
-        self.particles = []
-        self.init_particles()
+        self.field_size = field_size
+        self.stamps = mote_stamps()
+        self.init_particles(particle_count)
     
-    def init_particles(self):
-        """Initialize particle effects"""
-        for i in range(15):
-            particle = {
-                'pos': [random.random() * 320, random.random() * 240],
-                'velocity': [random.random() * 0.3 - 0.15, random.random() * 0.3 - 0.15],
-                'size': random.randint(1, 2),
-                'alpha': random.randint(30, 100),
-                'life': random.randint(100, 300)
-            }
-            self.particles.append(particle)
+    def init_particles(self, count):
+        """Initialize particle effects as parallel arrays (one row per mote)"""
+        self.rng = np.random.default_rng()
+        self.particle_pos = self.rng.random((count, 2)) * self.field_size
+        self.particle_velocity = self.rng.random((count, 2)) * 0.3 - 0.15
+        self.particle_size = self.rng.integers(0, len(MOTE_SIZES), count)  # Index into MOTE_SIZES
+        self.particle_alpha = self.rng.integers(0, MOTE_ALPHA_STEPS, count)
+        self.particle_life = self.rng.integers(100, 301, count).astype(float)
     
-    def update(self):
-        """Update background animation and particles"""
+    def update(self, dt=1.0):
+        """Update background animation and particles (dt is measured in 60 FPS frames)"""
         # Update background scroll
-        self.background_scroll += 0.1
+        self.background_scroll += 0.1 * dt
         
         # Update particles
-        for particle in self.particles:
-            particle['pos'][0] += particle['velocity'][0]
-            particle['pos'][1] += particle['velocity'][1]
-            particle['life'] -= 1
-            
-            # Wrap particles around screen
-            if particle['pos'][0] < 0:
-                particle['pos'][0] = 320
-            elif particle['pos'][0] > 320:
-                particle['pos'][0] = 0
-            if particle['pos'][1] < 0:
-                particle['pos'][1] = 240
-            elif particle['pos'][1] > 240:
-                particle['pos'][1] = 0
-            
-            # Respawn particles
-            if particle['life'] <= 0:
-                particle['pos'] = [random.random() * 320, random.random() * 240]
-                particle['life'] = random.randint(100, 300)
+        pos = self.particle_pos
+        pos += self.particle_velocity * dt
+        self.particle_life -= dt
+
+        # Wrap particles around screen
+        for axis, limit in enumerate(self.field_size):
+            column = pos[:, axis]
+            column[column < 0] = limit
+            column[column > limit] = 0
+
+        # Respawn particles
+        expired = self.particle_life <= 0
+        respawned = int(expired.sum())
+        if respawned:
+            pos[expired] = self.rng.random((respawned, 2)) * self.field_size
+            self.particle_life[expired] = self.rng.integers(100, 301, respawned)
     
     def render_background(self, display_2):
         """Render animated background with parallax effect"""
@@ -53,6 +68,13 @@ class SharedBackground:
     def _render_parallax_layers(self, surface):
         """Render parallax layers to a surface"""
         parallax_factors = [0.05, 0.1, 0.2, 0.35, 0.5, 0.65]
+
+        # The scroll is sub-pixel; the picture only changes when a layer moves a whole pixel
+        offsets = tuple(int(self.background_scroll * factor) for factor in parallax_factors)
+        if offsets != self.layer_offsets:
+            self.layer_offsets = offsets
+            if self.dirty:
+                self.dirty.invalidate()
         
         for index, layer in enumerate(self.assets['background_layers']):
             if index < len(parallax_factors):
@@ -63,8 +85,11 @@ class SharedBackground:
                 
                 screen_height = surface.get_height()
                 if layer_height < screen_height:
-                    scale_factor = screen_height / layer_height
-                    scaled_layer = pygame.transform.scale(layer, (int(layer_width * scale_factor), screen_height))
+                    scaled_layer = self.scaled_layers.get((index, screen_height))
+                    if scaled_layer is None:
+                        scale_factor = screen_height / layer_height
+                        scaled_layer = pygame.transform.scale(layer, (int(layer_width * scale_factor), screen_height))
+                        self.scaled_layers[index, screen_height] = scaled_layer
                     layer_width = scaled_layer.get_width()
                 else:
                     scaled_layer = layer
@@ -82,6 +107,18 @@ class SharedBackground:
     
     def render_particles(self, display):
         """Render particle effects"""
-        for particle in self.particles:
-            color = (255, 255, 255, particle['alpha'])
-            pygame.draw.circle(display, color, (int(particle['pos'][0]), int(particle['pos'][1])), particle['size'])
+        sizes = np.take(MOTE_SIZES, self.particle_size)
+        corners = self.particle_pos.astype(int) - sizes[:, None]
+        stamp_index = self.particle_size * MOTE_ALPHA_STEPS + self.particle_alpha
+        display.fblits(list(zip(map(self.stamps.__getitem__, stamp_index.tolist()), corners.tolist())))
+
+        if self.dirty:
+            if len(corners) <= 64:
+                for (x, y), size in zip(corners.tolist(), sizes.tolist()):
+                    self.dirty.add((x, y, size * 2 + 1, size * 2 + 1))
+            else:
+                # A dense field covers everything anyway; report its bounds once. Motes live in
+                # field coordinates on whatever surface they are drawn to (update() wraps them into
+                # [0, field_size]), so the field padded by the largest stamp covers every one
+                pad = max(MOTE_SIZES)
+                self.dirty.add((-pad, -pad, self.field_size[0] + pad * 2 + 1, self.field_size[1] + pad * 2 + 1))
@@ -0,0 +1,49 @@
+class SpatialHash:
+    """Uniform grid of buckets for broad-phase overlap tests, rebuilt every frame.
+
+    Objects are inserted with a rect and a kind such as 'enemy'; query()
+    returns the objects of a kind whose buckets overlap a rect. Callers
+    still do the exact test, but only against what is nearby, so the cost
+    of a collision pass follows the local density rather than the number of
+    objects in the level.
+    """
+
+    def __init__(self, cell_size=32):
+        self.cell_size = cell_size
+        self.cells = {}  # (cx, cy) -> [(kind, obj)]
+        self.size = 0
+
+    def clear(self):
+        self.cells.clear()
+        self.size = 0
+
+    def insert(self, obj, rect, kind):
+        cell_size = self.cell_size
+        cells = self.cells
+        for cx in range(int(rect[0] // cell_size), int((rect[0] + rect[2]) // cell_size) + 1):
+            for cy in range(int(rect[1] // cell_size), int((rect[1] + rect[3]) // cell_size) + 1):
+                cells.setdefault((cx, cy), []).append((kind, obj))
+        self.size += 1
+
+    def query(self, rect, kind):
+        """Objects of kind in the buckets rect touches, each once, in insertion order per bucket"""
+        cell_size = self.cell_size
+        cells = self.cells
+        found = []
+        seen = set()
+        for cx in range(int(rect[0] // cell_size), int((rect[0] + rect[2]) // cell_size) + 1):
+            for cy in range(int(rect[1] // cell_size), int((rect[1] + rect[3]) // cell_size) + 1):
+                for entry_kind, obj in cells.get((cx, cy), ()):
+                    if entry_kind == kind and id(obj) not in seen:
+                        seen.add(id(obj))
+                        found.append(obj)
+        return found
+
+
+def dash_hits(spatial, player):
+    """Enemies in the hash that the dashing player is touching"""
+    if abs(player.dashing) < 50:
+        return []
+    player_rect = player.rect()
+    return [enemy for enemy in spatial.query(player_rect, 'enemy') if enemy.rect().colliderect(player_rect)]
+
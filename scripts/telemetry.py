@@ -0,0 +1,87 @@
+import csv
+import math
+import os
+import queue
+import threading
+import time
+
+COLUMNS = ('frame', 'time', 'scene', 'level', 'frame_ms', 'work_ms', 'phases', 'counts', 'events')
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values), max(1, math.ceil(p / 100 * len(sorted_values)))) - 1
+    return sorted_values[rank]
+
+
+def pack(values, digits=None):
+    """Phase timings or counts as one compact 'name:value|...' cell"""
+    if digits is None:
+        return '|'.join(f"{name}:{value}" for name, value in values.items())
+    return '|'.join(f"{name}:{value:.{digits}f}" for name, value in values.items())
+
+
+def unpack(cell, kind=float):
+    if not cell:
+        return {}
+    return {name: kind(value) for name, value in (item.split(':', 1) for item in cell.split('|'))}
+
+
+class TelemetryLog:
+    """Streams one CSV row per frame to disk from a background thread.
+
+    Each row holds the frame interval (frame_ms, including the pacing wait),
+    the time spent doing work (work_ms), the scene and level, the per-phase
+    timings and counters of the frame profiler, and any event tags such as
+    death or dash. record() only queues the row; the writer thread batches
+    rows to the file so logging never stalls the game loop.
+    """
+
+    def __init__(self, path, batch=120):
+        self.path = path
+        self.batch = batch
+        self.rows = queue.Queue()
+        self.frame = 0
+        self.start = time.perf_counter()
+        self.last_frame = None
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(COLUMNS)
+        self.thread = threading.Thread(target=self.run, name='telemetry-writer', daemon=True)
+        self.thread.start()
+
+    def record(self, scene, level, work, phases, counts, events):
+        now = time.perf_counter()
+        frame_ms = (now - self.last_frame) * 1000 if self.last_frame is not None else work * 1000
+        self.last_frame = now
+        self.frame += 1
+        self.rows.put((self.frame, f"{now - self.start:.3f}", scene, level, f"{frame_ms:.3f}", f"{work * 1000:.3f}",
+                       pack({name: seconds * 1000 for name, seconds in phases.items()}, 3),
+                       pack(counts), '|'.join(events)))
+
+    def run(self):
+        while True:
+            row = self.rows.get()
+            if row is None:
+                break
+            rows = [row]
+            # Drain whatever else is queued and write it in one go
+            while len(rows) < self.batch:
+                try:
+                    row = self.rows.get_nowait()
+                except queue.Empty:
+                    break
+                if row is None:
+                    self.writer.writerows(rows)
+                    return
+                rows.append(row)
+            self.writer.writerows(rows)
+
+    def close(self):
+        self.rows.put(None)
+        self.thread.join(timeout=2)
+        self.file.close()
+        print(f"Telemetry: {self.frame} frames written to {self.path}")
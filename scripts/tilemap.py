@@ -1,5 +1,7 @@
 import json
+import math
 import pygame
+from scripts.culling import DRAW_MARGIN
 
 AUTOTILE_MAP = {
     tuple(sorted([(1, 0), (0, 1)])): 0,
@@ -16,6 +18,9 @@ AUTOTILE_MAP = {
 NEIGHBOR_OFFSETS = [(-1, 0), (-1, -1), (0, -1), (1, -1), (1, 0), (0, 0), (-1, 1), (0, 1), (1, 1)]
 PHYSICS_TILES = {'grass', 'stone'}
 AUTOTILE_TYPES = {'grass', 'stone'}
+# Pixel cell of the grid offgrid tiles are indexed in for drawing; bigger than any offgrid image,
+# so a tile that reaches into the view is found one cell up and left of it at most
+OFFGRID_CELL = 64
 
 class Tilemap:
     def __init__(self, game, tile_size=16):
@@ -23,6 +28,13 @@ class Tilemap:
         self.tile_size = tile_size
         self.tilemap = {}
         self.offgrid_tiles = []
+        # (x, y) of every physics tile -> (first x, last x) of the solid run it belongs to in its row.
+        # Enemies patrol within these spans instead of probing the map for ledges
+        self.walk_spans = {}
+        # (x, y) of every physics tile; what collision, raycasts and searches test cells against
+        self.solid_cells = set()
+        self.version = 0  # Bumped on every tile change, so cached spans know when they are stale
+        self.offgrid_index = None  # (offgrid list indexed, its length, {cell: [tile index]})
 
     def extract(self, id_pairs, keep=False):
         matches = []
@@ -71,6 +83,103 @@ class Tilemap:
         self.tilemap = map_data['tilemap']
         self.tile_size = map_data['tile_size']
         self.offgrid_tiles = map_data['offgrid']
+        self.analyze_walkability()
+
+    def clear(self):
+        self.tilemap = {}
+        self.offgrid_tiles = []
+        self.analyze_walkability()
+
+    def set_tile(self, pos, tile_type, variant):
+        self.tilemap[str(pos[0]) + ';' + str(pos[1])] = {'type': tile_type, 'variant': variant, 'pos': list(pos)}
+        self.refresh_spans([tuple(pos)])
+
+    def remove_tile(self, pos):
+        if self.tilemap.pop(str(pos[0]) + ';' + str(pos[1]), None):
+            self.refresh_spans([tuple(pos)])
+
+    def add_tiles(self, tiles):
+        """Merge a {loc: tile} block, e.g. a streamed chunk"""
+        self.tilemap.update(tiles)
+        self.refresh_spans([tuple(tile['pos']) for tile in tiles.values()])
+
+    def remove_tiles(self, locs):
+        cells = []
+        for loc in locs:
+            tile = self.tilemap.pop(loc, None)
+            if tile:
+                cells.append(tuple(tile['pos']))
+        self.refresh_spans(cells)
+
+    def is_solid_cell(self, x, y):
+        tile = self.tilemap.get(str(x) + ';' + str(y))
+        return tile is not None and tile['type'] in PHYSICS_TILES
+
+    def analyze_walkability(self):
+        """Index every horizontal run of physics tiles by the cells it covers"""
+        self.walk_spans = {}
+        self.solid_cells = set()
+        self.refresh_spans([tuple(tile['pos']) for tile in self.tilemap.values()])
+
+    def refresh_spans(self, cells):
+        """Recompute the runs through the given cells and their row neighbours after a change,
+        and the solid cells with them"""
+        spans = self.walk_spans
+        solid = self.solid_cells
+        done = set()
+        for x, y in cells:
+            for cx in (x - 1, x, x + 1):
+                if (cx, y) in done:
+                    continue
+                if not self.is_solid_cell(cx, y):
+                    spans.pop((cx, y), None)
+                    solid.discard((cx, y))
+                    done.add((cx, y))
+                    continue
+                x0 = cx
+                while self.is_solid_cell(x0 - 1, y):
+                    x0 -= 1
+                x1 = cx
+                while self.is_solid_cell(x1 + 1, y):
+                    x1 += 1
+                for run_x in range(x0, x1 + 1):
+                    spans[(run_x, y)] = (x0, x1)
+                    solid.add((run_x, y))
+                    done.add((run_x, y))
+        self.version += 1
+
+    def raycast(self, start, end):
+        """First physics tile cell crossed by the segment start -> end (pixels), or None.
+
+        Grid DDA (Amanatides & Woo): steps cell to cell along the segment, so the cost grows with the
+        number of cells crossed, not with the length in pixels, and tests cells against solid_cells
+        without building string keys."""
+        tile_size = self.tile_size
+        x, y = start[0] / tile_size, start[1] / tile_size
+        dx, dy = end[0] / tile_size - x, end[1] / tile_size - y
+        cx, cy = math.floor(x), math.floor(y)
+        steps = abs(math.floor(x + dx) - cx) + abs(math.floor(y + dy) - cy)
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        # Segment fraction to travel one cell along each axis, and to the first cell boundary
+        delta_x = abs(1 / dx) if dx else math.inf
+        delta_y = abs(1 / dy) if dy else math.inf
+        next_x = ((cx + 1 - x) if dx > 0 else (x - cx)) * delta_x
+        next_y = ((cy + 1 - y) if dy > 0 else (y - cy)) * delta_y
+        solid = self.solid_cells
+        for _ in range(steps + 1):
+            if (cx, cy) in solid:
+                return (cx, cy)
+            if next_x < next_y:
+                next_x += delta_x
+                cx += step_x
+            else:
+                next_y += delta_y
+                cy += step_y
+        return None
+
+    def line_of_sight(self, start, end):
+        return self.raycast(start, end) is None
 
     def solid_check(self, pos):
         tile_loc = str(int(pos[0] // self.tile_size)) + ';' + str(int(pos[1] // self.tile_size))
@@ -100,10 +209,35 @@ class Tilemap:
             if (tile['type'] in AUTOTILE_TYPES) and (neighbors in AUTOTILE_MAP):
                 tile['variant'] = AUTOTILE_MAP[neighbors]
 
-    def render(self, surf, offset=(0, 0)):
+    def offgrid_cells(self):
+        """Offgrid tile indices by the OFFGRID_CELL cell of their top-left corner. Rebuilt when the
+        list is replaced (a streamed chunk) or changes length (an edit), not every frame."""
+        tiles = self.offgrid_tiles
+        index = self.offgrid_index
+        if index is None or index[0] is not tiles or index[1] != len(tiles):
+            cells = {}
+            for i, tile in enumerate(tiles):
+                cells.setdefault((int(tile['pos'][0] // OFFGRID_CELL), int(tile['pos'][1] // OFFGRID_CELL)), []).append(i)
+            index = self.offgrid_index = (tiles, len(tiles), cells)
+        return index[2]
 
-        for tile in self.offgrid_tiles:
-            surf.blit(self.game.assets[tile['type']][tile['variant']], (tile['pos'][0] - offset[0], tile['pos'][1] - offset[1]))
+    def render(self, surf, offset=(0, 0)):
+        """Draw the visible tiles; returns how many were blitted. Offgrid tiles are drawn if their
+        image touches the screen plus DRAW_MARGIN, in list order."""
+        view = pygame.Rect(offset, surf.get_size()).inflate(DRAW_MARGIN * 2, DRAW_MARGIN * 2)
+        cells = self.offgrid_cells()
+        found = []
+        for cx in range(view.left // OFFGRID_CELL - 1, view.right // OFFGRID_CELL + 1):
+            for cy in range(view.top // OFFGRID_CELL - 1, view.bottom // OFFGRID_CELL + 1):
+                found += cells.get((cx, cy), ())
+        blits = 0
+        for i in sorted(found):
+            tile = self.offgrid_tiles[i]
+            img = self.game.assets[tile['type']][tile['variant']]
+            pos = (tile['pos'][0] - offset[0], tile['pos'][1] - offset[1])
+            if view.colliderect((tile['pos'][0], tile['pos'][1], img.get_width(), img.get_height())):
+                surf.blit(img, pos)
+                blits += 1
 
         for x in range(offset[0] // self.tile_size, (offset[0] + surf.get_width()) // self.tile_size + 1):
             for y in range(offset[1] // self.tile_size, (offset[1] + surf.get_height()) // self.tile_size + 1):
@@ -111,3 +245,5 @@ class Tilemap:
                 if loc in self.tilemap:
                     tile = self.tilemap[loc]
                     surf.blit(self.game.assets[tile['type']][tile['variant']], (tile['pos'][0] * self.tile_size - offset[0], tile['pos'][1] * self.tile_size - offset[1]))
+                    blits += 1
+        return blits
@@ -0,0 +1,91 @@
+import math
+import pygame
+
+# Static menu effects (vignette, gradients, glow borders, dimming overlays) are
+# built once per size and shared by every menu that asks for them.
+_cache = {}
+
+
+def _cached(key, build):
+    surf = _cache.get(key)
+    if surf is None:
+        surf = build()
+        _cache[key] = surf
+    return surf
+
+
+def clear_cache():
+    """Drop every cached effect surface (e.g. after the display mode changes)"""
+    _cache.clear()
+
+
+def dim_overlay(size, alpha):
+    """Full-size black overlay used to darken the background behind a menu"""
+    def build():
+        overlay = pygame.Surface(size)
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(alpha)
+        return overlay
+    return _cached(('dim', tuple(size), alpha), build)
+
+
+def tinted_panel(size, color):
+    """Flat translucent panel (RGBA color) used for shadows and slot overlays"""
+    def build():
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        panel.fill(color)
+        return panel
+    return _cached(('panel', tuple(size), tuple(color)), build)
+
+
+def vignette(size, strength=100):
+    """Radial darkening towards the screen edges"""
+    def build():
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        center_x, center_y = size[0] // 2, size[1] // 2
+        max_distance = math.sqrt(center_x ** 2 + center_y ** 2)
+        for radius in range(0, int(max_distance), 2):
+            alpha = min(255, int(strength * (radius / max_distance)))
+            pygame.draw.circle(surf, (0, 0, 0, alpha), (center_x, center_y), radius, 2)
+        return surf
+    return _cached(('vignette', tuple(size), strength), build)
+
+
+def dialog_gradient(width, height):
+    """Dark red vertical gradient used as the dialog body"""
+    def build():
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i in range(height):
+            alpha = int(220 + 35 * math.sin(i * math.pi / height))
+            red_intensity = int(20 + 25 * math.sin(i * math.pi / height))
+            pygame.draw.line(surf, (red_intensity, 0, 0, alpha), (0, i), (width, i))
+        return surf
+    return _cached(('dialog_gradient', width, height), build)
+
+
+def border_glow(width, height, color=(255, 50, 50, 100), spread=8, border_radius=12):
+    """Soft rounded glow drawn behind a panel of the given size"""
+    def build():
+        surf = pygame.Surface((width + spread, height + spread), pygame.SRCALPHA)
+        pygame.draw.rect(surf, color, (0, 0, width + spread, height + spread), 0, border_radius=border_radius)
+        return surf
+    return _cached(('border_glow', width, height, tuple(color), spread, border_radius), build)
+
+
+def inner_shadow(width, height, strength=35):
+    """Top-down shadow fading out towards the bottom of a panel"""
+    def build():
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i in range(height):
+            alpha = max(0, int(strength * (1 - i / height)))
+            pygame.draw.line(surf, (0, 0, 0, alpha), (0, i), (width, i))
+        return surf
+    return _cached(('inner_shadow', width, height, strength), build)
+
+
+def prewarm(size):
+    """Build the screen-sized effects up front so the first dialog opens without a hitch"""
+    vignette(size)
+    dim_overlay(size, 140)
+    dim_overlay(size, 160)
+    dim_overlay(size, 180)
@@ -26,6 +26,8 @@ def load_images(path):
     return images
 
 class Animation:
+    __slots__ = ('images', 'loop', 'img_duration', 'done', 'frame')
+
     def __init__(self, images, img_dur=5, loop=True):
         self.images = images
         self.loop = loop
@@ -0,0 +1,230 @@
+import random
+import numpy as np
+from scripts.entities import Player, Enemy, DOWN
+from scripts.tilemap import Tilemap
+from scripts.utils import Animation
+from scripts.culling import Culling
+from scripts.ai_scheduler import AIScheduler
+from scripts.spatial_hash import SpatialHash
+from scripts.gameplay import follow_camera, step_entities
+from scripts.profiler import FrameProfiler
+from scripts.world import Projectiles
+from scripts.level_catalog import LevelCatalog
+
+VIEW_SIZE = (320, 240)  # Game.display; decides which enemies are awake, as in the game
+ACTIONS = ('left', 'right', 'jump', 'dash')
+NEAREST = 4  # Enemies and projectiles listed per observation, nearest first
+GRID_RADIUS = 4  # Solid-tile grid of (2r+1)^2 cells around the player
+
+# Observation layout: player state, enemies left, nearest enemies (dx, dy, present),
+# nearest projectiles (dx, dy, velocity, present), then the tile grid row by row
+PLAYER_FIELDS = ('x', 'y', 'vx', 'vy', 'dashing', 'air_time', 'jumps', 'wall_slide', 'on_ground', 'flip')
+OBS_SIZE = len(PLAYER_FIELDS) + 1 + NEAREST * 3 + NEAREST * 4 + (2 * GRID_RADIUS + 1) ** 2
+
+
+class Silent:
+    def play(self):
+        pass
+
+
+class HeadlessAssets(dict):
+    """Every animation key maps to a one-frame animation with no image; nothing is drawn"""
+
+    def __missing__(self, key):
+        return Animation([None])
+
+
+class NoEffects:
+    """Stands in for Game.world: sparks and particles are dropped"""
+
+    def add_spark(self, pos, angle, speed):
+        pass
+
+    def add_particle(self, p_type, pos, velocity=(0, 0), frame=0):
+        pass
+
+
+SILENT = Silent()
+HEADLESS_ASSETS = HeadlessAssets()
+NO_EFFECTS = NoEffects()
+
+
+class LevelSim:
+    """One level played without a window, audio or effects.
+
+    It stands in for Game as far as Player and Enemy are concerned (assets,
+    sfx, world, player, projectiles, dead, screenshake) and runs the same
+    follow_camera and step_entities as Game.update_gameplay, with no-op
+    effect hooks. An episode ends on the first death, when the level is cleared or
+    after max_frames.
+    """
+
+    def __init__(self, tilemap, spawn, enemy_spawns, max_frames=3600):
+        self.assets = HEADLESS_ASSETS
+        self.sfx = {'jump': SILENT, 'dash': SILENT, 'hit': SILENT, 'shoot': SILENT, 'ambience': SILENT}
+        self.world = NO_EFFECTS
+        self.tilemap = tilemap
+        self.spawn = spawn
+        self.enemy_spawns = enemy_spawns
+        self.max_frames = max_frames
+        self.spatial = SpatialHash()
+        self.projectiles = Projectiles()
+        self.profiler = FrameProfiler()  # Never enabled; step_entities times its phases through it
+        self.streamer = None
+        self.reset()
+
+    def reset(self):
+        self.player = Player(self, self.spawn, (8, 15))
+        self.enemies = [Enemy(self, pos, (8, 15)) for pos in self.enemy_spawns]
+        self.projectiles.clear()
+        self.dead = 0
+        self.screenshake = 0
+        self.frame = 0
+        self.jump_held = False
+        self.culling = Culling()
+        self.ai = AIScheduler()
+        self.scroll = [self.player.rect().centerx - VIEW_SIZE[0] / 2, self.player.rect().centery - VIEW_SIZE[1] / 2]
+
+    def press(self, jump, dash):
+        """Jump and dash act on the press, and releasing jump early cuts it short, as with the keys"""
+        player = self.player
+        if jump and not self.jump_held:
+            player.jump()
+        elif self.jump_held and not jump:
+            player.cut_jump()
+        self.jump_held = jump
+        if dash:
+            player.dash()
+
+    def step(self, left, right, jump, dash):
+        """Advance one frame with the given buttons held; returns (kills, died, cleared, truncated)"""
+        self.press(jump, dash)
+
+        self.frame += 1
+        self.screenshake = max(0, self.screenshake - 1)
+        follow_camera(self, VIEW_SIZE)
+        kills = len(step_entities(self, (right - left, 0)))
+
+        died = self.dead > 0
+        cleared = not self.enemies
+        return kills, died, cleared, self.frame >= self.max_frames and not (died or cleared)
+
+    def on_enemy_killed(self, enemy):
+        pass
+
+    def on_projectile_blocked(self, pos, velocity):
+        pass
+
+    def on_player_hit(self):
+        pass
+
+    def observe(self, out):
+        """Write this level's observation into the float32 row out (see OBS_SIZE)"""
+        player = self.player
+        px, py = player.rect().center
+        out[:len(PLAYER_FIELDS)] = (player.pos[0], player.pos[1], player.velocity[0], player.velocity[1],
+                                    player.dashing, player.air_time, player.jumps, player.wall_slide,
+                                    bool(player.collision_flags & DOWN), player.flip)
+        i = len(PLAYER_FIELDS)
+        out[i] = len(self.enemies)
+        i += 1
+
+        out[i:] = 0
+        if self.enemies:
+            offsets = np.array([enemy.rect().center for enemy in self.enemies], dtype=np.float32) - (px, py)
+            for dx, dy in offsets[np.argsort(np.hypot(offsets[:, 0], offsets[:, 1]))[:NEAREST]].tolist():
+                out[i:i + 3] = (dx, dy, 1)
+                i += 3
+        i = len(PLAYER_FIELDS) + 1 + NEAREST * 3
+        projectiles = self.projectiles
+        if projectiles.count:
+            rows = np.column_stack((projectiles.column('pos') - (px, py),
+                                    projectiles.column('velocity')[:, 0])).astype(np.float32)
+            for dx, dy, vx in rows[np.argsort(np.hypot(rows[:, 0], rows[:, 1]))[:NEAREST]].tolist():
+                out[i:i + 4] = (dx, dy, vx, 1)
+                i += 4
+        i = len(PLAYER_FIELDS) + 1 + NEAREST * 3 + NEAREST * 4
+
+        tile_size = self.tilemap.tile_size
+        cx, cy = int(px // tile_size), int(py // tile_size)
+        solid = self.tilemap.solid_cells
+        out[i:] = [(x, y) in solid for y in range(cy - GRID_RADIUS, cy + GRID_RADIUS + 1)
+                   for x in range(cx - GRID_RADIUS, cx + GRID_RADIUS + 1)]
+
+
+class VecEnv:
+    """N independent headless level simulations stepped together, for training bots.
+
+        env = VecEnv([1, 1, 2, 3], seed=0)
+        obs = env.reset()                                # (N, OBS_SIZE) float32
+        obs, rewards, dones, info = env.step(actions)    # actions: (N, 4) of left, right, jump, dash
+
+    Rewards are +1 per enemy killed and -1 for dying. A level that is done
+    (death, cleared or out of frames) restarts at once, so the returned
+    observation is the first frame of the next episode; info holds the
+    per-level kills, died, cleared and truncated arrays for the finished
+    step. Each level id's map is read once and its Tilemap shared by every
+    simulation of that level. Enemies use the global random module, so runs
+    are reproducible for a given seed and list of levels, but simulations in
+    one VecEnv are not independent streams.
+    """
+
+    def __init__(self, levels, max_frames=3600, seed=None, maps_dir=None):
+        catalog = LevelCatalog.scan(maps_dir) if maps_dir else LevelCatalog.load()
+        if seed is not None:
+            random.seed(seed)
+        loaded = {}
+        self.sims = []
+        for level_id in levels:
+            if level_id not in loaded:
+                loaded[level_id] = self.load(catalog, level_id)
+            self.sims.append(LevelSim(*loaded[level_id], max_frames=max_frames))
+        self.levels = list(levels)
+        self.obs = np.zeros((len(self.sims), OBS_SIZE), dtype=np.float32)
+
+    @staticmethod
+    def load(catalog, level_id):
+        if level_id not in catalog:
+            raise ValueError(f"Unknown level {level_id}")
+        if catalog.chunk_path(level_id):
+            raise ValueError(f"Level {level_id} is chunked; headless simulation needs a single-file map")
+        tilemap = Tilemap(None)
+        tilemap.load(catalog.map_path(level_id))
+        spawn = [0, 0]
+        enemy_spawns = []
+        for spawner in tilemap.extract([('spawners', 0), ('spawners', 1)]):
+            if spawner['variant'] == 0:
+                spawn = spawner['pos']
+            else:
+                enemy_spawns.append(spawner['pos'])
+        return tilemap, spawn, enemy_spawns
+
+    @property
+    def num_envs(self):
+        return len(self.sims)
+
+    def reset(self):
+        for index, sim in enumerate(self.sims):
+            sim.reset()
+            sim.observe(self.obs[index])
+        return self.obs.copy()
+
+    def step(self, actions):
+        actions = np.asarray(actions, dtype=bool)
+        count = len(self.sims)
+        rewards = np.zeros(count, dtype=np.float32)
+        dones = np.zeros(count, dtype=bool)
+        info = {name: np.zeros(count, dtype=bool) for name in ('died', 'cleared', 'truncated')}
+        info['kills'] = np.zeros(count, dtype=np.int32)
+        for index, (sim, (left, right, jump, dash)) in enumerate(zip(self.sims, actions.tolist())):
+            kills, died, cleared, truncated = sim.step(left, right, jump, dash)
+            rewards[index] = kills - died
+            info['kills'][index] = kills
+            info['died'][index] = died
+            info['cleared'][index] = cleared
+            info['truncated'][index] = truncated
+            if died or cleared or truncated:
+                dones[index] = True
+                sim.reset()
+            sim.observe(self.obs[index])
+        return self.obs.copy(), rewards, dones, info
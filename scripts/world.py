@@ -0,0 +1,226 @@
+import numpy as np
+import pygame
+
+SWAY_KINDS = {'leaf'}  # Particle types that drift side to side as they fall
+PROJECTILE_LIFETIME = 360  # Frames before a projectile that hit nothing is dropped
+
+
+class Archetype:
+    """Entities that share one set of components, stored as one numpy column per component.
+
+    Live rows are packed into [0, count) in creation order; keep() compacts the
+    columns without reordering, so draw order matches spawn order.
+    """
+
+    def __init__(self, components, capacity=64):
+        self.components = components  # name -> (dtype, per-entity shape)
+        self.count = 0
+        self.columns = {name: np.zeros((capacity,) + shape, dtype) for name, (dtype, shape) in components.items()}
+
+    def __len__(self):
+        return self.count
+
+    def add(self, **values):
+        row = self.count
+        if row == len(self.columns['pos']):
+            for name, column in self.columns.items():
+                grown = np.zeros((row * 2,) + column.shape[1:], column.dtype)
+                grown[:row] = column
+                self.columns[name] = grown
+        for name in self.components:
+            self.columns[name][row] = values[name]
+        self.count += 1
+
+    def column(self, name):
+        return self.columns[name][:self.count]
+
+    def keep(self, alive):
+        """Drop the rows where alive is False"""
+        remaining = int(alive.sum())
+        if remaining == self.count:
+            return
+        for column in self.columns.values():
+            column[:remaining] = column[:self.count][alive]
+        self.count = remaining
+
+    def clear(self):
+        self.count = 0
+
+
+class Projectiles(Archetype):
+    """Enemy shots as component arrays: position, velocity and age.
+
+    Each system is one numpy pass over every live projectile. step_entities
+    runs them in the order the per-projectile loop did: move and age, drop
+    those in a physics tile or past PROJECTILE_LIFETIME, then those inside
+    the player.
+    """
+
+    def __init__(self):
+        super().__init__({
+            'pos': (float, (2,)),
+            'velocity': (float, (2,)),
+            'age': (int, ()),
+        })
+
+    def fire(self, pos, velocity):
+        self.add(pos=pos, velocity=velocity, age=0)
+
+    def motion(self):
+        self.column('pos')[:] += self.column('velocity')
+        self.column('age')[:] += 1
+
+    def blocked(self, tilemap):
+        """Projectiles whose point is in a physics tile"""
+        solid = tilemap.solid_cells
+        cells = (self.column('pos') // tilemap.tile_size).astype(int).tolist()
+        return np.array([(x, y) in solid for x, y in cells], dtype=bool)
+
+    def expired(self):
+        return self.column('age') > PROJECTILE_LIFETIME
+
+    def inside(self, rect):
+        """Projectiles inside rect, with the points truncated as Rect.collidepoint does"""
+        point = self.column('pos').astype(int)
+        return ((point[:, 0] >= rect.left) & (point[:, 0] < rect.right)
+                & (point[:, 1] >= rect.top) & (point[:, 1] < rect.bottom))
+
+
+def in_view(pos, view):
+    return (pos[:, 0] >= view.left) & (pos[:, 0] < view.right) & (pos[:, 1] >= view.top) & (pos[:, 1] < view.bottom)
+
+
+class World:
+    """The level's sparks and particles as component arrays.
+
+    Each system advances one component for all entities that have it in a
+    single numpy pass (movement, animation, lifetime, sway, render), so a
+    thirty-spark burst costs about the same Python work as one spark. The
+    systems run in the order the old per-object update/render methods did:
+    move, draw, then remove what expired.
+    """
+
+    def __init__(self, assets):
+        # Particle kinds come from the 'particle/<type>' animations; images of all kinds share one table
+        self.kinds = {}
+        self.images = []
+        base, duration, last, loop, sway = [], [], [], [], []
+        for key, animation in assets.items():
+            if not key.startswith('particle/'):
+                continue
+            p_type = key.split('/', 1)[1]
+            self.kinds[p_type] = len(self.kinds)
+            base.append(len(self.images))
+            self.images += animation.images
+            duration.append(animation.img_duration)
+            last.append(animation.img_duration * len(animation.images) - 1)
+            loop.append(animation.loop)
+            sway.append(p_type in SWAY_KINDS)
+        self.kind_base = np.array(base, dtype=int)
+        self.kind_duration = np.array(duration, dtype=int)
+        self.kind_last = np.array(last, dtype=int)
+        self.kind_loop = np.array(loop, dtype=bool)
+        self.kind_sway = np.array(sway, dtype=bool)
+        self.image_half = np.array([(img.get_width() // 2, img.get_height() // 2) for img in self.images], dtype=float)
+
+        self.sparks = Archetype({
+            'pos': (float, (2,)),
+            'angle': (float, ()),
+            'speed': (float, ()),
+        })
+        self.particles = Archetype({
+            'pos': (float, (2,)),
+            'velocity': (float, (2,)),
+            'kind': (int, ()),
+            'frame': (int, ()),
+            'done': (bool, ()),
+        })
+
+    def clear(self):
+        self.sparks.clear()
+        self.particles.clear()
+
+    def add_spark(self, pos, angle, speed):
+        self.sparks.add(pos=pos, angle=angle, speed=speed)
+
+    def add_particle(self, p_type, pos, velocity=(0, 0), frame=0):
+        self.particles.add(pos=pos, velocity=velocity, kind=self.kinds[p_type], frame=frame, done=False)
+
+    # Sparks
+
+    def spark_motion(self):
+        """Movement and decay; returns the sparks that have stopped"""
+        sparks = self.sparks
+        pos, angle, speed = sparks.column('pos'), sparks.column('angle'), sparks.column('speed')
+        pos[:, 0] += np.cos(angle) * speed
+        pos[:, 1] += np.sin(angle) * speed
+        np.maximum(speed - 0.1, 0, out=speed)
+        return speed == 0
+
+    def render_sparks(self, surf, offset, view):
+        sparks = self.sparks
+        visible = in_view(sparks.column('pos'), view)
+        pos = sparks.column('pos')[visible] - offset
+        angle = sparks.column('angle')[visible]
+        speed = sparks.column('speed')[visible]
+        # Diamond along the direction of travel: long tips ahead and behind, short ones to the sides
+        direction = np.stack((np.cos(angle), np.sin(angle)), axis=1)
+        side = np.stack((-direction[:, 1], direction[:, 0]), axis=1)
+        tip = direction * (speed * 3)[:, None]
+        wing = side * (speed * 0.5)[:, None]
+        points = np.stack((pos + tip, pos + wing, pos - tip, pos - wing), axis=1)
+        for polygon in points.tolist():
+            pygame.draw.polygon(surf, (255, 255, 255), polygon)
+        return len(points)
+
+    def run_sparks(self, surf=None, offset=(0, 0), view=None):
+        """One frame of sparks: move, draw if given a surface, then drop the stopped ones"""
+        if not self.sparks.count:
+            return 0
+        stopped = self.spark_motion()
+        drawn = self.render_sparks(surf, offset, view) if surf is not None else 0
+        self.sparks.keep(~stopped)
+        return drawn
+
+    # Particles
+
+    def particle_motion(self):
+        """Movement and animation; returns the particles whose animation had already finished"""
+        particles = self.particles
+        pos, frame, done = particles.column('pos'), particles.column('frame'), particles.column('done')
+        kind = particles.column('kind')
+        finished = done.copy()
+        pos += particles.column('velocity')
+        last = self.kind_last[kind]
+        loop = self.kind_loop[kind]
+        frame += 1
+        frame[:] = np.where(loop, frame % (last + 1), np.minimum(frame, last))
+        done |= ~loop & (frame >= last)
+        return finished
+
+    def particle_sway(self):
+        particles = self.particles
+        sway = self.kind_sway[particles.column('kind')]
+        if sway.any():
+            pos = particles.column('pos')
+            pos[sway, 0] += np.sin(particles.column('frame')[sway] * 0.035) * 0.3
+
+    def render_particles(self, surf, offset, view):
+        particles = self.particles
+        visible = in_view(particles.column('pos'), view)
+        kind = particles.column('kind')[visible]
+        image = self.kind_base[kind] + particles.column('frame')[visible] // self.kind_duration[kind]
+        corners = particles.column('pos')[visible] - offset - self.image_half[image]
+        surf.fblits(list(zip(map(self.images.__getitem__, image.tolist()), corners.tolist())))
+        return len(image)
+
+    def run_particles(self, surf=None, offset=(0, 0), view=None):
+        """One frame of particles: move and animate, draw if given a surface, sway, then drop the
+        ones that finished"""
+        if not self.particles.count:
+            return 0
+        finished = self.particle_motion()
+        drawn = self.render_particles(surf, offset, view) if surf is not None else 0
+        self.particle_sway()
+        self.particles.keep(~finished)
+        return drawn
@@ -0,0 +1,304 @@
+"""Headless benchmarks for every level in the catalog.
+
+For each level the runner plays a fixed, seeded input script and measures
+simulation-only and simulation-plus-render frame cost, then times the
+Tilemap hot paths (tiles_around, physics_rects_around, solid_check,
+line_of_sight, render, autotile). Results are written as JSON and compared against a baseline:
+
+    python -m tools.benchmark                          # run, compare with benchmarks/baseline.json
+    python -m tools.benchmark --save-baseline          # run and store as the new baseline
+    python -m tools.benchmark --levels 1 3 --frames 300 --threshold 0.2
+    python -m tools.benchmark --maps data/stress_maps --output benchmarks/stress.json
+    python -m tools.benchmark --entity-batching        # also report what batching enemy physics would save
+
+Every metric is a time or a memory size, so lower is better; a metric
+worse than the baseline by more than the threshold is a regression and the
+exit status is 1. The --entity-batching figures are a one-off report for
+that design question: they go in their own section of the output and are
+never compared against the baseline.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+# The game opens a window and an audio device on import of its Game class
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from main import Game
+from scripts.gameplay import follow_camera, step_entities, advance_death
+from scripts.entities import DOWN, UP
+
+RESULTS_PATH = 'benchmarks/results.json'
+BASELINE_PATH = 'benchmarks/baseline.json'
+WARMUP_FRAMES = 30
+
+
+def input_script(frames, seed):
+    """Per-frame (movement, jump, dash) for a run that walks, jumps and dashes both ways"""
+    rng = random.Random(seed)
+    script = []
+    direction = 1
+    hold = 0
+    for frame in range(frames):
+        if hold <= 0:
+            direction = rng.choice((-1, 1, 1))
+            hold = rng.randint(30, 120)
+        hold -= 1
+        movement = (direction < 0, direction > 0)
+        script.append((movement, rng.random() < 0.04, rng.random() < 0.015))
+    return script
+
+
+def apply_input(game, movement, jump, dash):
+    game.movement = list(movement)
+    if jump:
+        game.player.jump()
+    if dash:
+        game.player.dash()
+
+
+def simulate_frame(game):
+    """The non-drawing work of Game.update_gameplay: the shared gameplay step, effects and respawn"""
+    follow_camera(game, game.display.get_size())
+    if game.streamer:
+        game.streamer.update(game.camera_rect())
+
+    if game.dead and advance_death(game):
+        game.load_level(game.level)
+    step_entities(game, (game.movement[1] - game.movement[0], 0))
+
+    game.world.run_sparks()
+    game.world.run_particles()
+
+    # Cleared levels restart so every frame measures the same map
+    if not game.enemies_remaining():
+        game.load_level(game.level)
+
+
+def render_frame(game):
+    game.update_gameplay()
+    game.render_gameplay(game.screen)
+
+
+def run_frames(game, level, frames, step):
+    """Milliseconds per frame for `frames` scripted frames after a warmup"""
+    random.seed(level)
+    game.load_level(level)
+    game.player.velocity = [0, 0]
+    script = input_script(WARMUP_FRAMES + frames, seed=level)
+    for movement, jump, dash in script[:WARMUP_FRAMES]:
+        apply_input(game, movement, jump, dash)
+        step(game)
+
+    start = time.perf_counter()
+    for movement, jump, dash in script[WARMUP_FRAMES:]:
+        apply_input(game, movement, jump, dash)
+        step(game)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def time_calls(func, args_list, repeat=3):
+    """Best-of-repeat microseconds per call over args_list"""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for args in args_list:
+            func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / len(args_list)
+
+
+def load_cost(game, level):
+    """Level load time and peak memory allocated while loading"""
+    start = time.perf_counter()
+    game.load_level(level)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    tracemalloc.start()
+    game.load_level(level)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'load_ms': load_ms, 'load_peak_kb': peak / 1024}
+
+
+def micro_benchmarks(game, level, samples):
+    game.load_level(level)
+    tilemap = game.tilemap
+    rng = random.Random(level)
+    x0, y0, x1, y1 = game.levels.get(level)['bounds']
+    points = [((rng.uniform(x0, x1), rng.uniform(y0, y1)),) for _ in range(samples)]
+    # Sight lines about as long as an enemy's view across the screen
+    rays = [(pos, (pos[0] + rng.uniform(-240, 240), pos[1] + rng.uniform(-32, 32))) for (pos,) in points]
+    surf = pygame.Surface(game.display.get_size(), pygame.SRCALPHA)
+    offsets = [(surf, (int(pos[0]) - surf.get_width() // 2, int(pos[1]) - surf.get_height() // 2))
+               for (pos,) in points[:max(1, samples // 20)]]
+    return {
+        'tiles_around_us': time_calls(tilemap.tiles_around, points),
+        'physics_rects_around_us': time_calls(tilemap.physics_rects_around, points),
+        'solid_check_us': time_calls(tilemap.solid_check, points),
+        'line_of_sight_us': time_calls(tilemap.line_of_sight, rays),
+        'render_us': time_calls(tilemap.render, offsets),
+        'autotile_us': time_calls(tilemap.autotile, [()], repeat=5),
+    }
+
+
+def entity_batching(game, level):
+    """Microseconds per enemy for Enemy.update, its tile sweep, and its velocity integration done
+    per object and as one numpy pass over every enemy.
+
+    The sweep walks each entity's own tiles and stays per entity, so the
+    integration is all that moving Player and Enemy into component arrays
+    would batch; the batch is timed with the copy of velocities out of the
+    entities and back, which the per-entity sweep would still need.
+    """
+    game.load_level(level)
+    tilemap = game.tilemap
+    enemies = game.enemies
+    if not enemies:
+        return {}
+    each = [(enemy,) for enemy in enemies]
+
+    def integrate(enemy):
+        velocity = enemy.velocity
+        frame_movement = (velocity[0], velocity[1])
+        velocity[1] = min(5, velocity[1] + 0.1)
+        if enemy.collision_flags & (DOWN | UP):
+            velocity[1] = 0
+        return frame_movement
+
+    def integrate_batch():
+        velocity = np.array([enemy.velocity for enemy in enemies], dtype=float)
+        flags = np.array([enemy.collision_flags for enemy in enemies])
+        frame_movement = velocity.tolist()
+        velocity[:, 1] = np.minimum(5, velocity[:, 1] + 0.1)
+        velocity[flags & (DOWN | UP) != 0, 1] = 0
+        for enemy, row in zip(enemies, velocity.tolist()):
+            enemy.velocity = row
+        return frame_movement
+
+    return {
+        'enemy_update_us': time_calls(lambda enemy: enemy.update(tilemap, (0, 0), think=0), each),
+        'enemy_sweep_us': time_calls(lambda enemy: enemy.sweep_move(tilemap, (0, 0.1)), each),
+        'enemy_integrate_us': time_calls(integrate, each),
+        'enemy_batch_us': time_calls(integrate_batch, [()]) / len(enemies),
+    }
+
+
+def run(levels, frames, samples, maps_dir=None, batching=False):
+    """(results, entity_batching figures); the second is empty unless batching is set"""
+    game = Game(save_progress=False, maps_dir=maps_dir)
+    results = {}
+    batching_results = {}
+    try:
+        for level in levels:
+            print(f"level {level}...", flush=True)
+            entry = load_cost(game, level)
+            entry.update({
+                'sim_ms': run_frames(game, level, frames, simulate_frame),
+                'sim_render_ms': run_frames(game, level, frames, render_frame),
+            })
+            entry.update(micro_benchmarks(game, level, samples))
+            results[f'level_{level}'] = entry
+            if batching:
+                figures = entity_batching(game, level)
+                if figures:
+                    batching_results[f'level_{level}'] = figures
+    finally:
+        game.shutdown()
+    return results, batching_results
+
+
+def compare(results, baseline, threshold):
+    """(name, metric, baseline, current, change) for every metric worse than threshold allows"""
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(name, {}).get(metric)
+            if base and value > base * (1 + threshold):
+                regressions.append((name, metric, base, value, value / base - 1))
+    return regressions
+
+
+def print_table(results):
+    metrics = list(next(iter(results.values())))
+    print(f"{'':<10}" + ''.join(f"{metric:>24}" for metric in metrics))
+    for name, entry in results.items():
+        print(f"{name:<10}" + ''.join(f"{entry[metric]:24.3f}" for metric in metrics))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--levels', type=int, nargs='*', help='level ids (default: every level in the catalog)')
+    parser.add_argument('--frames', type=int, default=600, help='scripted frames per level and mode')
+    parser.add_argument('--samples', type=int, default=2000, help='positions per tilemap micro-benchmark')
+    parser.add_argument('--maps', metavar='DIR', help='benchmark the N.json maps in DIR (e.g. generated stress maps)')
+    parser.add_argument('--output', default=RESULTS_PATH)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--threshold', type=float, default=0.10, help='allowed slowdown, 0.10 = 10%%')
+    parser.add_argument('--save-baseline', action='store_true', help='store this run as the baseline')
+    parser.add_argument('--entity-batching', action='store_true',
+                        help='also time Enemy.update against a numpy batch of its integration (not compared)')
+    args = parser.parse_args()
+
+    from scripts.level_catalog import LevelCatalog
+    catalog = LevelCatalog.scan(args.maps) if args.maps else LevelCatalog.load()
+    levels = args.levels or catalog.ids()
+    results, batching = run(levels, args.frames, args.samples, args.maps, args.entity_batching)
+
+    report = {
+        'meta': {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'frames': args.frames,
+            'samples': args.samples,
+            'maps': args.maps or 'catalog',
+        },
+        'results': results,
+    }
+    if batching:
+        report['entity_batching'] = batching
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print_table(results)
+    if batching:
+        print("Entity batching, microseconds per enemy (not compared against the baseline):")
+        print_table(batching)
+    print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+    except (OSError, json.JSONDecodeError, KeyError):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, metric, base, value, change in regressions:
+        print(f"REGRESSION {name} {metric}: {base:.3f} -> {value:.3f} (+{change:.0%})")
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""Regenerate data/level_catalog.json from the maps in data/maps.
+
+Run from the game folder after adding or editing a map:
+
+    python -m tools.build_level_catalog
+"""
+import sys
+from scripts.level_catalog import write_catalog, CATALOG_PATH
+
+
+def main():
+    catalog = write_catalog()
+    for level in catalog['levels']:
+        print(f"level {level['id']}: {level['tiles']} tiles, {level['offgrid']} offgrid, "
+              f"{level['enemies']} enemies, spawn {level['spawn']}, bounds {level['bounds']}")
+    print(f"Wrote {len(catalog['levels'])} levels to {CATALOG_PATH}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""Convert a map file into a streamed chunk folder.
+
+    python -m tools.chunk_map data/stress_maps/1.json            # writes data/stress_maps/1.chunks
+    python -m tools.chunk_map data/stress_maps/1.json --chunk-size 64
+
+A level with an N.chunks folder next to (or instead of) N.json is streamed
+by the game; rebuild the level catalog afterwards if the folder is data/maps.
+"""
+import argparse
+import json
+import sys
+from scripts.chunk_streamer import write_chunks, CHUNK_SIZE
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', help='map JSON, named <id>.json')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='tiles per chunk side')
+    args = parser.parse_args()
+    if not args.path.endswith('.json'):
+        parser.error('expected a .json map')
+
+    with open(args.path, 'r') as f:
+        map_data = json.load(f)
+    out_dir = args.path[:-5] + '.chunks'
+    meta = write_chunks(map_data, out_dir, args.chunk_size)
+    print(f"Wrote {len(meta['chunks'])} chunks of {args.chunk_size}x{args.chunk_size} tiles to {out_dir} "
+          f"({meta['tiles']} tiles, {meta['enemies']} enemies)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
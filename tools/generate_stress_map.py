@@ -0,0 +1,139 @@
+"""Write large procedural maps for scaling tests.
+
+The output is ordinary map JSON (autotiled grass/stone platforms, off-grid
+decor, leaf-dropping trees and spawners), saved as <dir>/<id>.json so the
+game, the editor and the benchmarks can load it:
+
+    python -m tools.generate_stress_map --width 1000 --height 1000 --enemies 500
+    python main.py --maps data/stress_maps
+    python editor.py data/stress_maps/1.json
+    python -m tools.benchmark --maps data/stress_maps
+
+With --chunked the map is written as <dir>/<id>.chunks instead, which the
+game streams around the camera (see scripts/chunk_streamer.py).
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from scripts.tilemap import Tilemap
+from scripts.chunk_streamer import write_chunks, CHUNK_SIZE
+
+STRESS_MAPS_DIR = 'data/stress_maps'
+TILE_SIZE = 16
+LEAF_TREE = ('large_decor', 2)  # The only decor Game.load_level turns into a leaf spawner
+TREE_HEIGHTS = {0: 9, 1: 12, 2: 44}  # large_decor image heights, so trees stand on their platform
+
+
+def generate(width, height, density=0.08, decor=2000, trees=300, enemies=200, seed=None):
+    """Map data for a width x height tile world; density is the solid fraction of all cells.
+    Raises ValueError if the platforms leave no tile to stand on."""
+    rng = random.Random(seed)
+    tilemap = Tilemap(None, tile_size=TILE_SIZE)
+    grid = tilemap.tilemap
+
+    def place(x, y, tile_type):
+        grid[f'{x};{y}'] = {'type': tile_type, 'variant': 0, 'pos': [x, y]}
+
+    # A solid floor so nothing falls out of the world, then platforms until the density is reached
+    for x in range(width):
+        place(x, height - 1, 'stone')
+    # A density the platform rows cannot reach ends once a thousand platforms in a row add no tile
+    target = max(width, int(width * height * density))
+    stalled = 0
+    while len(grid) < target and stalled < 1000:
+        placed = len(grid)
+        length = rng.randint(3, 12)
+        thickness = 1 if rng.random() < 0.8 else rng.randint(2, 4)
+        x0 = rng.randrange(0, max(1, width - length))
+        y0 = rng.randrange(2, max(3, height - thickness - 1))
+        tile_type = 'grass' if rng.random() < 0.7 else 'stone'
+        for x in range(x0, x0 + length):
+            for y in range(y0, min(y0 + thickness, height - 1)):
+                place(x, y, tile_type)
+        stalled = stalled + 1 if len(grid) == placed else 0
+    tilemap.autotile()
+
+    # Standing spots: solid tiles with two free cells above them
+    surfaces = [tile['pos'] for loc, tile in grid.items()
+                if f"{tile['pos'][0]};{tile['pos'][1] - 1}" not in grid
+                and f"{tile['pos'][0]};{tile['pos'][1] - 2}" not in grid
+                and tile['pos'][1] > 2]
+    if not surfaces:
+        raise ValueError(f"no tile with two free cells above it in a {width}x{height} map at density {density}; "
+                         "lower --density or add rows")
+    rng.shuffle(surfaces)
+    spots = iter(surfaces)
+
+    def next_spot():
+        try:
+            return next(spots)
+        except StopIteration:
+            return rng.choice(surfaces)
+
+    offgrid = []
+    x, y = min(surfaces, key=lambda pos: (pos[0], -pos[1]))  # Player starts at the left edge
+    offgrid.append({'type': 'spawners', 'variant': 0, 'pos': [x * TILE_SIZE + 4, (y - 1) * TILE_SIZE]})
+    for _ in range(enemies):
+        x, y = next_spot()
+        offgrid.append({'type': 'spawners', 'variant': 1, 'pos': [x * TILE_SIZE + 4, (y - 1) * TILE_SIZE]})
+    for _ in range(trees):
+        x, y = next_spot()
+        variant = LEAF_TREE[1] if rng.random() < 0.6 else rng.randint(0, 1)
+        offgrid.append({'type': 'large_decor', 'variant': variant,
+                        'pos': [x * TILE_SIZE + rng.uniform(-8, 8), y * TILE_SIZE - TREE_HEIGHTS[variant]]})
+    for _ in range(decor):
+        x, y = next_spot()
+        offgrid.append({'type': 'decor', 'variant': rng.randint(0, 3),
+                        'pos': [x * TILE_SIZE + rng.uniform(-4, 4), (y - 1) * TILE_SIZE]})
+
+    return {'tilemap': grid, 'tile_size': TILE_SIZE, 'offgrid': offgrid}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--width', type=int, default=1000, help='map width in tiles')
+    parser.add_argument('--height', type=int, default=1000, help='map height in tiles')
+    parser.add_argument('--density', type=float, default=0.08, help='fraction of cells that are solid')
+    parser.add_argument('--decor', type=int, default=2000, help='off-grid decor count')
+    parser.add_argument('--trees', type=int, default=300, help='large_decor trees (about 60%% drop leaves)')
+    parser.add_argument('--enemies', type=int, default=200, help='enemy spawners')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dir', default=STRESS_MAPS_DIR, help='output folder; maps are named <id>.json')
+    parser.add_argument('--id', type=int, default=1, help='level id of the written map')
+    parser.add_argument('--chunked', action='store_true', help='write a streamed <id>.chunks folder')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='tiles per chunk side')
+    args = parser.parse_args()
+    if not 0 < args.density <= 0.9:
+        parser.error('--density must be in (0, 0.9]')
+    if args.width < 4 or args.height < 4:
+        parser.error('--width and --height must be at least 4 tiles (the floor needs two free rows above it)')
+
+    start = time.perf_counter()
+    try:
+        map_data = generate(args.width, args.height, args.density, args.decor, args.trees, args.enemies, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    os.makedirs(args.dir, exist_ok=True)
+    if args.chunked:
+        path = os.path.join(args.dir, f'{args.id}.chunks')
+        meta = write_chunks(map_data, path, args.chunk_size)
+        size = sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+        stored = f"{len(meta['chunks'])} chunks"
+    else:
+        path = os.path.join(args.dir, f'{args.id}.json')
+        tilemap = Tilemap(None, tile_size=map_data['tile_size'])
+        tilemap.tilemap = map_data['tilemap']
+        tilemap.offgrid_tiles = map_data['offgrid']
+        tilemap.save(path)
+        size = os.path.getsize(path)
+        stored = 'one file'
+    print(f"Wrote {path}: {args.width}x{args.height} tiles, {len(map_data['tilemap'])} solid, "
+          f"{len(map_data['offgrid'])} offgrid, {stored}, {size // 1024} KiB "
+          f"in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
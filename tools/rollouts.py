@@ -0,0 +1,97 @@
+"""Play many headless rollouts in parallel and check them against a previous run.
+
+Rollouts are seeded random players (--seeds per level) or recorded input
+sequences (--replays, one JSON object per line: {"level": 1, "seed": 0,
+"inputs": "<hex, one byte per frame: 1 left, 2 right, 4 jump, 8 dash>"}).
+Each result has completion, frames played, deaths, kills and a hash of the
+final state; with --compare, any rollout that now ends differently is listed
+and the exit status is 1:
+
+    python -m tools.rollouts --seeds 500 --output benchmarks/rollouts.json
+    python -m tools.rollouts --seeds 500 --compare benchmarks/rollouts.json   # after a physics change
+    python -m tools.rollouts --replays replays.jsonl --workers 8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from scripts.level_catalog import LevelCatalog
+from scripts.rollouts import RolloutPool
+
+OUTCOME_FIELDS = ('completed', 'frames', 'deaths', 'kills', 'hash')
+
+
+def read_replays(path):
+    jobs = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                replay = json.loads(line)
+                jobs.append((replay['level'], replay.get('seed', 0), bytes.fromhex(replay['inputs'])))
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--levels', type=int, nargs='*', help='level ids for seeded rollouts (default: every single-file level)')
+    parser.add_argument('--seeds', type=int, default=100, help='seeded random rollouts per level')
+    parser.add_argument('--frames', type=int, default=1800, help='frames per seeded rollout')
+    parser.add_argument('--replays', metavar='FILE', help='play recorded inputs from a JSON-lines file instead')
+    parser.add_argument('--maps', metavar='DIR', help='levels from the N.json maps in DIR')
+    parser.add_argument('--workers', type=int, help='processes (default: one per core; 1 runs in-process)')
+    parser.add_argument('--output', metavar='FILE', help='write the results as JSON')
+    parser.add_argument('--compare', metavar='FILE', help='results of an earlier run to check against')
+    args = parser.parse_args()
+
+    if args.replays:
+        jobs = read_replays(args.replays)
+    else:
+        catalog = LevelCatalog.scan(args.maps) if args.maps else LevelCatalog.load()
+        levels = args.levels or [level_id for level_id in catalog.ids() if not catalog.chunk_path(level_id)]
+        jobs = [(level_id, seed, None) for level_id in levels for seed in range(args.seeds)]
+
+    start = time.perf_counter()
+    with RolloutPool(args.workers, args.maps) as pool:
+        results = pool.run(jobs, frames=args.frames)
+        workers = pool.workers
+    elapsed = time.perf_counter() - start
+
+    frames = sum(result['frames'] for result in results)
+    print(f"{len(results)} rollouts, {frames} frames in {elapsed:.1f}s on {workers} workers "
+          f"({len(results) / elapsed:.0f} rollouts/s, {frames / elapsed:.0f} frames/s)")
+    by_level = {}
+    for result in results:
+        by_level.setdefault(result['level'], []).append(result)
+    print(f"{'level':>5} {'rollouts':>9} {'completed':>10} {'deaths/run':>11} {'kills/run':>10}")
+    for level_id, level_results in sorted(by_level.items()):
+        count = len(level_results)
+        print(f"{level_id:>5} {count:>9} {sum(r['completed'] for r in level_results) / count:>10.0%} "
+              f"{sum(r['deaths'] for r in level_results) / count:>11.2f} "
+              f"{sum(r['kills'] for r in level_results) / count:>10.2f}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump({'frames': args.frames, 'results': results}, f)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = {(r['level'], r['seed']): r for r in json.load(f)['results']}
+        changed = []
+        for result in results:
+            before = previous.get((result['level'], result['seed']))
+            if before and any(before[field] != result[field] for field in OUTCOME_FIELDS):
+                changed.append((before, result))
+        for before, result in changed[:20]:
+            diff = ', '.join(f"{field} {before[field]} -> {result[field]}"
+                             for field in OUTCOME_FIELDS if before[field] != result[field])
+            print(f"CHANGED level {result['level']} seed {result['seed']}: {diff}")
+        print(f"{len(changed)} of {len(results)} rollouts end differently than in {args.compare}")
+        return 1 if changed else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Summarize a telemetry log written by `python main.py --telemetry`.
+
+Prints p50/p95/p99 frame time per level (gameplay frames only) and the
+worst spikes with the phases, counts and events around them:
+
+    python -m tools.telemetry_report saves/telemetry/session-20250101-120000.csv
+    python -m tools.telemetry_report session.csv --spikes 20 --all-scenes
+"""
+import argparse
+import csv
+import sys
+from scripts.telemetry import percentile, unpack
+
+# Main-loop scopes that contain the gameplay phases; left out of the spike breakdown
+CONTAINER_SCOPES = ('update', 'render')
+
+
+def load_rows(path):
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        row['frame'] = int(row['frame'])
+        row['frame_ms'] = float(row['frame_ms'])
+        row['work_ms'] = float(row['work_ms'])
+        row['phases'] = unpack(row['phases'])
+        row['counts'] = unpack(row['counts'], int)
+        row['events'] = row['events'].split('|') if row['events'] else []
+    return rows
+
+
+def level_table(rows):
+    """Frame and work percentiles grouped by level"""
+    by_level = {}
+    for row in rows:
+        by_level.setdefault(row['level'], []).append(row)
+    table = []
+    for level, level_rows in sorted(by_level.items(), key=lambda item: int(item[0]) if item[0].isdigit() else 0):
+        frame = sorted(row['frame_ms'] for row in level_rows)
+        work = sorted(row['work_ms'] for row in level_rows)
+        table.append((level, len(level_rows), percentile(frame, 50), percentile(frame, 95), percentile(frame, 99),
+                      frame[-1], percentile(work, 99)))
+    return table
+
+
+def nearby_events(rows, index, radius):
+    events = []
+    for row in rows[max(0, index - radius):index + radius + 1]:
+        events += [f"{event}@{row['frame'] - rows[index]['frame']:+d}" for event in row['events']]
+    return events
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path')
+    parser.add_argument('--spikes', type=int, default=10, help='how many of the slowest frames to list')
+    parser.add_argument('--radius', type=int, default=10, help='frames either side to search for events')
+    parser.add_argument('--all-scenes', action='store_true', help='include menu frames, not just gameplay')
+    args = parser.parse_args()
+
+    rows = load_rows(args.path)
+    if not args.all_scenes:
+        rows = [row for row in rows if row['scene'] == 'GameplayScene']
+    if not rows:
+        print("No frames to report")
+        return 1
+
+    print(f"{'level':>5} {'frames':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7} {'work p99':>9}  (ms)")
+    for level, frames, p50, p95, p99, worst, work_p99 in level_table(rows):
+        print(f"{level:>5} {frames:>7} {p50:7.2f} {p95:7.2f} {p99:7.2f} {worst:7.2f} {work_p99:9.2f}")
+
+    print(f"\nWorst {args.spikes} frames:")
+    worst = sorted(range(len(rows)), key=lambda i: rows[i]['frame_ms'], reverse=True)[:args.spikes]
+    for i in worst:
+        row = rows[i]
+        phases = [item for item in row['phases'].items() if item[0] not in CONTAINER_SCOPES]
+        phases = sorted(phases, key=lambda item: item[1], reverse=True)[:3]
+        phases = ', '.join(f"{name} {ms:.2f}" for name, ms in phases) or 'no phase data'
+        counts = ' '.join(f"{name}={value}" for name, value in sorted(row['counts'].items()))
+        events = ' '.join(nearby_events(rows, i, args.radius)) or '-'
+        print(f"  frame {row['frame']} level {row['level']} {row['scene']}: {row['frame_ms']:.2f} ms "
+              f"(work {row['work_ms']:.2f})")
+        print(f"    slowest: {phases}")
+        print(f"    counts: {counts or '-'}   events: {events}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Check that every level can be completed, with a search bot playing the real player physics.
+
+For each level, a search over the player's jump, dash and movement inputs
+looks for one run from the spawn that dashes through every enemy (see
+scripts.level_search). Levels are searched in parallel, one per worker
+process. Each found run is replayed against the same standing enemies to
+confirm it, and --witness writes the runs in the rollout input format:
+
+    python -m tools.verify_levels
+    python -m tools.verify_levels --levels 3 8 --witness witnesses.jsonl
+
+Enemies are taken to stand still where they land and not to shoot, so a
+witness shows that the level's layout allows a clear, not that it is easy.
+It is a path, not a replay of the game: played with tools.rollouts
+--replays, against enemies that walk and shoot, it dies or misses them.
+A level is "unreachable" when the search tried every state it could get
+to or an enemy has no open path from the spawn at all; "gave up" means
+the node or time budget ran out first. The summary gives the wall time
+and the slowest level's, so a search that gets slower shows up. The exit
+status is 1 unless every level checked can be completed.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from scripts.level_catalog import LevelCatalog
+from scripts.level_search import verify_level
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--levels', type=int, nargs='*', help='level ids (default: every single-file level)')
+    parser.add_argument('--maps', metavar='DIR', help='levels from the N.json maps in DIR')
+    parser.add_argument('--nodes', type=int, default=64000, help='search states expanded per level')
+    parser.add_argument('--seconds', type=float, default=60, help='search time per level (0: no limit)')
+    parser.add_argument('--workers', type=int, help='processes (default: one per core; 1 runs in-process)')
+    parser.add_argument('--witness', metavar='FILE', help='write the runs found as JSON lines (rollout input format; layout paths, not game replays)')
+    args = parser.parse_args()
+
+    catalog = LevelCatalog.scan(args.maps) if args.maps else LevelCatalog.load()
+    levels = args.levels or [level_id for level_id in catalog.ids() if not catalog.chunk_path(level_id)]
+    # Biggest levels first, so the slowest searches are not left for last
+    levels.sort(key=lambda level_id: catalog.get(level_id)['enemies'], reverse=True)
+    jobs = [(level_id, args.maps, args.nodes, args.seconds) for level_id in levels]
+    workers = min(args.workers or multiprocessing.cpu_count(), len(jobs))
+
+    start = time.perf_counter()
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            results = list(pool.imap_unordered(verify_level, jobs))
+    else:
+        results = [verify_level(job) for job in jobs]
+    elapsed = time.perf_counter() - start
+    results.sort(key=lambda result: result['level'])
+
+    print(f"{'level':>5} {'enemies':>8} {'reached':>8} {'frames':>7} {'nodes':>8} {'time':>7}  result")
+    failed = 0
+    for result in results:
+        complete = result['reached'] == result['enemies'] and result['replayed'] == result['enemies']
+        if complete:
+            verdict = 'ok'
+        elif result['replayed'] != result['reached']:
+            verdict = f"REPLAY MISMATCH ({result['replayed']} on replay)"
+        elif result['exhausted'] or result['walled_off']:
+            verdict = 'UNREACHABLE'
+        else:
+            verdict = 'GAVE UP'
+        failed += not complete
+        print(f"{result['level']:>5} {result['enemies']:>8} {result['reached']:>8} {len(result['witness']) // 2:>7} "
+              f"{result['nodes']:>8} {result['seconds']:>6.1f}s  {verdict}")
+        for rect in result['unreached'][:5]:
+            print(f"      enemy at {rect[0]}, {rect[1]} not reached")
+    slowest = max(results, key=lambda result: result['seconds'])
+    print(f"{len(results) - failed} of {len(results)} levels completable, {elapsed:.1f}s on {workers} workers "
+          f"(slowest: level {slowest['level']}, {slowest['seconds']:.1f}s)")
+
+    if args.witness:
+        os.makedirs(os.path.dirname(args.witness) or '.', exist_ok=True)
+        with open(args.witness, 'w') as f:
+            for result in results:
+                f.write(json.dumps({'level': result['level'], 'seed': 0, 'inputs': result['witness']}) + '\n')
+        print(f"Runs written to {args.witness}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())